@@ -0,0 +1,106 @@
+"""Measure Light update throughput as threads are added.
+
+Many threads drive many lights, each thread updating every light in
+turn so lights are shared between threads. Device I/O is stubbed out
+as in update_overhead.py. On a free-threaded build of CPython, e.g.
+python3.13t, throughput should grow with the number of threads up to
+the number of cores. With the GIL it stays roughly flat.
+
+    python benchmarks/thread_scaling.py [-l LIGHTS] [-s SECONDS] [-t THREADS ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import sys
+import threading
+import time
+
+from update_overhead import LIGHTS, stub_light
+
+from busylight_core import Light
+
+
+def drive(
+    lights: list[Light],
+    index: int,
+    stop: threading.Event,
+    counts: list[int],
+) -> None:
+    """Update lights in turn until stop is set, recording the count at index."""
+    colors = itertools.cycle([(255, 0, 0), (0, 0, 255), (0, 255, 0)])
+    offset = index % len(lights)
+    order = lights[offset:] + lights[:offset]
+    updates = 0
+    while not stop.is_set():
+        for light in order:
+            light.on(next(colors))
+        updates += len(order)
+    counts[index] = updates
+
+
+def measure(
+    light_class: type[Light], nlights: int, nthreads: int, seconds: float
+) -> float:
+    """Return updates per second made by nthreads threads sharing nlights lights."""
+    device_type = LIGHTS[light_class]
+    lights = [stub_light(light_class, device_type) for _ in range(nlights)]
+    stop = threading.Event()
+    counts = [0] * nthreads
+    threads = [
+        threading.Thread(target=drive, args=(lights, n, stop, counts))
+        for n in range(nthreads)
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    for light in lights:
+        light.cancel_tasks()
+    return sum(counts) / elapsed
+
+
+def main() -> None:
+    """Print update throughput for increasing numbers of threads."""
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-l", "--lights", type=int, default=64)
+    parser.add_argument("-s", "--seconds", type=float, default=2.0)
+    parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, 8, cores}),
+    )
+    parser.add_argument(
+        "--light",
+        choices=[light_class.__name__ for light_class in LIGHTS],
+        default="Blynclight",
+    )
+    args = parser.parse_args()
+
+    light_class = next(c for c in LIGHTS if c.__name__ == args.light)
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    gil_state = "enabled" if gil else "disabled"
+    print(f"{sys.version.split()[0]}, GIL {gil_state}, {cores} cores")
+    print(f"{args.lights} {light_class.__name__} lights")
+    print(f"{'threads':>8} {'updates/s':>12} {'speedup':>8}")
+
+    baseline = None
+    for nthreads in args.threads:
+        rate = measure(light_class, args.lights, nthreads, args.seconds)
+        baseline = baseline or rate
+        print(f"{nthreads:>8} {rate:>12.0f} {rate / baseline:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Measure the host-side cost of Light updates with device I/O stubbed out.
+
+Each light is bound to hardware whose handle discards every write, so
+the timings are the library's own overhead: serializing state, write
+elision, framing and logging. on() is timed with changing colors, with
+the payload cache disabled and, for lights that support it, with a
+cache of cache_size entries.
+
+    python benchmarks/update_overhead.py [-n NUMBER]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import timeit
+from typing import TYPE_CHECKING
+
+from busylight_core import (
+    Blink1,
+    BlinkStick,
+    Blynclight,
+    Busylight,
+    FitStatUSB,
+    Light,
+    MuteMe,
+)
+from busylight_core.hardware import ConnectionType, Hardware
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+LIGHTS: dict[type[Light], ConnectionType] = {
+    Blynclight: ConnectionType.HID,
+    BlinkStick: ConnectionType.HID,
+    Busylight: ConnectionType.HID,
+    Blink1: ConnectionType.HID,
+    FitStatUSB: ConnectionType.SERIAL,
+    MuteMe: ConnectionType.HID,
+}
+
+CACHE_SIZE = 64
+
+
+class NullHandle:
+    """Device handle that discards every write."""
+
+    def write(self, data: bytes) -> int:
+        """Discard data, reporting it written."""
+        return len(data)
+
+    def send_feature_report(self, data: bytes) -> int:
+        """Discard data, reporting it written."""
+        return len(data)
+
+
+def stub_light(light_class: type[Light], device_type: ConnectionType) -> Light:
+    """Return an instance of light_class bound to a NullHandle."""
+    vendor_id, product_id = light_class.unique_device_ids()[0]
+    hardware = Hardware(
+        device_type=device_type,
+        path=b"benchmark",
+        vendor_id=vendor_id,
+        product_id=product_id,
+        serial_number="BS000000-1.0",
+        manufacturer_string="",
+        is_acquired=True,
+    )
+    hardware.handle = NullHandle()
+    return light_class(hardware)
+
+
+def measure(light: Light, number: int) -> dict[str, float]:
+    """Return nanoseconds per call for each update path of light."""
+    colors = itertools.cycle([(255, 0, 0), (0, 0, 255), (0, 255, 0)])
+
+    def on() -> None:
+        light.on(next(colors))
+
+    def update() -> None:
+        light.update(force=True)
+
+    light.on((0, 255, 0))
+
+    def elided() -> None:
+        light.update()
+
+    timings = {}
+    for name, statement in (("on", on), ("update", update), ("elided", elided)):
+        timings[name] = best(statement, number)
+    light.cancel_tasks()
+    return timings
+
+
+def measure_cached(
+    light_class: type[Light], device_type: ConnectionType, number: int
+) -> float | None:
+    """Return nanoseconds per on() call with the payload cache enabled.
+
+    Returns None for lights whose state cannot be snapshotted.
+    """
+    saved = vars(light_class).get("payload_cache_size")
+    light_class.payload_cache.cache_clear()
+    light_class.payload_cache_size = CACHE_SIZE
+    try:
+        light = stub_light(light_class, device_type)
+        if light.snapshot() is None:
+            return None
+        colors = itertools.cycle([(255, 0, 0), (0, 0, 255), (0, 255, 0)])
+        timing = best(lambda: light.on(next(colors)), number)
+        light.cancel_tasks()
+        return timing
+    finally:
+        if saved is None:
+            del light_class.payload_cache_size
+        else:
+            light_class.payload_cache_size = saved
+        light_class.payload_cache.cache_clear()
+
+
+def best(statement: Callable[[], None], number: int) -> float:
+    """Return the fastest of five runs of statement in nanoseconds per call."""
+    seconds = min(timeit.repeat(statement, number=number, repeat=5))
+    return seconds / number * 1e9
+
+
+def main() -> None:
+    """Print the update overhead of each light."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'light':<16} {'on()':>10} {'cached':>10}"
+        f" {'update()':>10} {'elided':>10}  ns/call"
+    )
+    for light_class, device_type in LIGHTS.items():
+        timings = measure(stub_light(light_class, device_type), args.number)
+        cached = measure_cached(light_class, device_type, args.number)
+        cached_column = "-" if cached is None else f"{cached:.0f}"
+        print(
+            f"{light_class.__name__:<16}"
+            f" {timings['on']:>10.0f}"
+            f" {cached_column:>10}"
+            f" {timings['update']:>10.0f}"
+            f" {timings['elided']:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -113,6 +113,8 @@ with mkdocs_gen_files.open("reference/index.md", "w") as index_file:
     # Mixins
     mixin_modules = [
         ("busylight_core.mixins.colorable", "Colorable"),
+        ("busylight_core.mixins.readback", "Readback"),
+        ("busylight_core.mixins.snapshot", "Word Snapshot"),
         ("busylight_core.mixins.taskable", "Taskable"),
     ]
 
@@ -233,6 +235,8 @@ with mkdocs_gen_files.open("reference/SUMMARY.md", "w") as nav_file:
     # Mixins
     mixin_modules = [
         ("busylight_core.mixins.colorable", "Colorable Mixin"),
+        ("busylight_core.mixins.readback", "Readback Mixin"),
+        ("busylight_core.mixins.snapshot", "Word Snapshot Mixin"),
         ("busylight_core.mixins.taskable", "Taskable Mixin"),
     ]
     
@@ -22,6 +22,7 @@ from importlib.metadata import version
 
 from loguru import logger
 
+from .cache import PayloadCache
 from .exceptions import (
     HardwareUnsupportedError,
     InvalidHardwareError,
@@ -30,6 +31,7 @@ from .exceptions import (
 )
 from .hardware import Hardware
 from .light import Light
+from .stats import LightStats
 from .vendors.agile_innovative import (
     AgileInnovativeLights,
     BlinkStick,
@@ -77,6 +79,7 @@ __all__ = [
     "InvalidHardwareError",
     "KuandoLights",
     "Light",
+    "LightStats",
     "LightUnavailableError",
     "LuxaforLights",
     "Mute",
@@ -86,6 +89,7 @@ __all__ = [
     "MuteSync",
     "NoLightsFoundError",
     "Orb",
+    "PayloadCache",
     "PlantronicsLights",
     "StatusIndicator",
     "ThingMLights",
@@ -0,0 +1,67 @@
+"""Bounded least recently used cache for light payloads."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+Entry = tuple[Hashable, bytes]
+
+
+class PayloadCache:
+    """Least recently used mapping from state changes to their results.
+
+    Each Light class with a non-zero payload_cache_size has its own
+    cache, shared by every instance of the class. Entries map a state
+    change, e.g. the color and LED passed to on() together with the
+    light's prior state, to the resulting state and its encoded
+    payload.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize an empty cache.
+
+        :param maxsize: Most entries kept, least recently used are evicted
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Entry | None:
+        """Return the entry for key, None if it is not cached.
+
+        :param key: Hashable description of a state change
+        """
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key: Hashable, entry: Entry) -> None:
+        """Cache entry for key, evicting the least recently used entries.
+
+        :param key: Hashable description of a state change
+        :param entry: The resulting state snapshot and its payload
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
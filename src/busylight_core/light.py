@@ -21,24 +21,76 @@ for light in all_lights:
 from __future__ import annotations
 
 import abc
+import asyncio
+import collections
 import contextlib
 import platform
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator
+    from collections.abc import Callable, Generator, Hashable
 
 from functools import cache, cached_property
 
+import serial
 from loguru import logger
 
+from .cache import PayloadCache
 from .exceptions import (
     HardwareUnsupportedError,
     LightUnavailableError,
     NoLightsFoundError,
 )
-from .hardware import Hardware
+from .hardware import ConnectionType, Hardware
 from .mixins import TaskableMixin
+from .stats import LightStats
+from .writer import Writer
+
+# Payload logging runs on every write, the payload is only formatted
+# if debug messages are actually being logged.
+_lazy_logger = logger.opt(lazy=True)
+
+
+class _Batch:
+    """Context manager returned by Light.batch_update().
+
+    A plain class rather than a generator based context manager, as
+    every on() enters at least one batch.
+    """
+
+    __slots__ = ("begin", "end")
+
+    def __init__(self, begin: Callable[[], None], end: Callable[..., None]) -> None:
+        self.begin = begin
+        self.end = end
+
+    def __enter__(self) -> None:
+        self.begin()
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        self.end(completed=exc_type is None)
+
+
+class _Miss:
+    """Context manager returned by Light.cached_change() with no cache.
+
+    Wraps a batch_update() and always reports a cache miss.
+    """
+
+    __slots__ = ("batch",)
+
+    def __init__(self, batch: contextlib.AbstractContextManager[None]) -> None:
+        self.batch = batch
+
+    def __enter__(self) -> bool:
+        self.batch.__enter__()
+        return False
+
+    def __exit__(self, *exc_info: object) -> bool | None:
+        return self.batch.__exit__(*exc_info)
 
 
 class Light(abc.ABC, TaskableMixin):
@@ -91,6 +143,53 @@ class Light(abc.ABC, TaskableMixin):
 
     supported_device_ids: ClassVar[dict[tuple[int, int], str]] = {}
 
+    elide_writes: ClassVar[bool] = True
+    """Skip writing a payload the device was already sent.
+
+    Subclasses whose writes are commands rather than complete device
+    states, e.g. keep alive packets or queries, should set this False.
+    Their writes are also never deferred by max_update_hz.
+    """
+
+    payload_cache_size: ClassVar[int] = 0
+    """Most entries in the class's payload cache, 0 disables the cache.
+
+    Only classes whose state can be captured by snapshot() and whose
+    on() uses cached_change() benefit, stateful protocols ignore it.
+    Set before the class's first update, e.g. `MuteMe.payload_cache_size = 64`.
+    """
+
+    write_timeout: float | None = None
+    """Seconds a single device write may take, None waits indefinitely.
+
+    A write that misses its deadline is dropped and counted in
+    stats.missed, and the next update is written even if unchanged.
+    Set it on Light, a subclass or an instance, e.g. `Light.write_timeout
+    = 0.25` before all_lights(), so a wedged device cannot stall the
+    updates of every other light.
+    """
+
+    degrade_after: int | None = None
+    """Consecutive missed deadlines after which the light is degraded.
+
+    Updates to a degraded light are dropped without writing to the
+    device until reset() is called. None never degrades the light.
+    """
+
+    _written: bytes | None = None
+    _hint: tuple[Hashable, bytes] | None = None
+    _written_at: float = 0.0
+    _pending: bytes | None = None
+    _flusher: asyncio.TimerHandle | threading.Timer | None = None
+    _max_update_hz: float | None = None
+    _writer: Writer | None = None
+    _batch_depth: int = 0
+    _generation: int = 0
+    _misses: int = 0
+    _degraded: bool = False
+    _in_flight: Future | None = None
+    _left_open: bool = False
+
     @classmethod
     @cache
     def vendor(cls) -> str:
@@ -134,6 +233,15 @@ class Light(abc.ABC, TaskableMixin):
         """
         return sorted(set(cls.supported_device_ids.keys()))
 
+    @classmethod
+    @cache
+    def payload_cache(cls) -> PayloadCache:
+        """Return the payload cache shared by every instance of this class.
+
+        Its hits and misses attributes count cached_change() lookups.
+        """
+        return PayloadCache(cls.payload_cache_size)
+
     @classmethod
     def claims(cls, hardware: Hardware) -> bool:
         """Check if this class can control the given hardware device.
@@ -319,6 +427,12 @@ class Light(abc.ABC, TaskableMixin):
         self.hardware = hardware
         self._reset = reset
         self._exclusive = exclusive
+        # Guards the light's state while it is changed and serialized.
+        self._lock = threading.RLock()
+        # Serializes device writes, which are made without holding _lock.
+        self._io_lock = threading.Lock()
+        # Per-thread outbox for writes captured by the async methods.
+        self._local = threading.local()
 
         if exclusive:
             self.hardware.acquire()
@@ -421,11 +535,47 @@ class Light(abc.ABC, TaskableMixin):
         If the light was acquired in exclusive mode, this method releases
         the hardware resource, allowing other processes to access it.
         If the light was not acquired in exclusive mode, no action is taken.
+        An update deferred by max_update_hz is discarded and writes
+        queued by the async methods or the background writer are waited
+        for.
+
+        A write that missed its write_timeout is given write_timeout
+        more seconds to finish. If it is still blocked the device is
+        closed once it returns rather than while it is using the
+        handle, and the light is degraded until it is reset.
         """
-        if self._exclusive:
-            logger.debug(f"Releasing exclusive access to {self.name}")
+        self._discard_pending()
+        # Failed background writes have already been logged.
+        with contextlib.suppress(LightUnavailableError):
+            self.join()
+        if "_executor" in self.__dict__:
+            self.__dict__.pop("_executor").shutdown()
+        with self._io_lock:
+            in_flight, self._in_flight = self._in_flight, None
+            if "_deadline_executor" in self.__dict__:
+                # A wedged write may never finish, don't wait for it.
+                self.__dict__.pop("_deadline_executor").shutdown(wait=False)
+            if in_flight is not None:
+                wait([in_flight], timeout=self.write_timeout)
+            self.__dict__.pop("_framing", None)
+            if self._exclusive or self._left_open:
+                logger.debug(f"Releasing exclusive access to {self.name}")
+                self._close(in_flight)
+                self._exclusive = False
+                self._left_open = False
+
+    def _close(self, in_flight: Future | None) -> None:
+        """Release the hardware, waiting for in_flight to finish with the handle.
+
+        :param in_flight: HID write that may still be blocked in the device
+        """
+        if in_flight is None or in_flight.done():
             self.hardware.release()
-            self._exclusive = False
+            return
+
+        self._degraded = True
+        logger.error(f"{self}: write still blocked, closing once it returns")
+        in_flight.add_done_callback(lambda _: self.hardware.release())
 
     @contextlib.contextmanager
     def exclusive_access(self) -> Generator[None, None, None]:
@@ -435,7 +585,9 @@ class Light(abc.ABC, TaskableMixin):
         acquired and released automatically.
 
         No actions are taken if the light is already acquired
-        in exclusive mode.
+        in exclusive mode. The device is left open while a write that
+        missed its write_timeout is still blocked using it, and closed
+        by a later exit or by release().
         """
         if not self._exclusive:
             self.hardware.acquire()
@@ -443,9 +595,78 @@ class Light(abc.ABC, TaskableMixin):
         yield
 
         if not self._exclusive:
-            self.hardware.release()
+            self._left_open = self._blocked()
+            if not self._left_open:
+                self.hardware.release()
+
+    @cached_property
+    def stats(self) -> LightStats:
+        """Counters describing the writes made to this light."""
+        return LightStats()
+
+    @property
+    def max_update_hz(self) -> float | None:
+        """Most device writes per second, None if writes are not limited.
+
+        Updates arriving faster than this are not written immediately.
+        Only the latest of them is kept and written at the next allowed
+        time, on the light's worker thread when scheduled by a running
+        asyncio event loop and by a timer thread otherwise. Classes
+        with elide_writes False write commands rather than complete
+        states and are never limited.
+        """
+        return self._max_update_hz
+
+    @max_update_hz.setter
+    def max_update_hz(self, value: float | None) -> None:
+        if value is not None and value <= 0:
+            msg = f"max_update_hz must be positive: {value}"
+            raise ValueError(msg)
+        self._max_update_hz = value
+
+    @cached_property
+    def _framing(self) -> tuple[bytes, Callable[[bytes], None]]:
+        """Platform payload prefix and bound write function.
 
-    def update(self) -> None:
+        Resolved on the first write and again after the light is
+        released, rather than on every update.
+        """
+        match self.platform:
+            case "Windows_10":
+                prefix = bytes([0])
+            case "Darwin" | "Linux" | "Windows_11":
+                prefix = b""
+            case _:
+                logger.info(f"Unsupported OS {self.platform}, hoping for the best.")
+                prefix = b""
+
+        return prefix, self.write_strategy
+
+    @property
+    def degraded(self) -> bool:
+        """True if the light stopped writing after missing degrade_after deadlines."""
+        return self._degraded
+
+    @cached_property
+    def _deadline_executor(self) -> ThreadPoolExecutor:
+        """Single worker thread making HID writes that have a write_timeout."""
+        return ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=f"{self.__class__.__name__}-deadline",
+        )
+
+    @cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Single worker thread performing this light's asynchronous writes.
+
+        A single worker writes in the order the writes were submitted.
+        """
+        return ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=self.__class__.__name__,
+        )
+
+    def update(self, *, force: bool = False) -> None:
         """Send the current light state to the physical device.
 
         Serializes the light's current state and transmits it to the hardware
@@ -453,31 +674,429 @@ class Light(abc.ABC, TaskableMixin):
         method after making changes to light properties to apply them to
         the physical device.
 
+        The last payload successfully written is remembered and an update
+        that would write the same payload again is skipped and counted in
+        stats.elided, unless force is True or the class sets elide_writes
+        to False. Updates exceeding max_update_hz are deferred, see
+        max_update_hz, and after start_writer() payloads are queued for
+        a background thread rather than written by the caller.
+
         The method handles platform-specific protocol differences automatically,
         such as adding leading zero bytes on Windows 10.
 
+        Updates may be made from several threads. The state is serialized
+        while holding the light's lock and written after releasing it, so
+        other threads can change the state during the write. If several
+        threads update the light at once, a payload overtaken by a newer
+        one before it was written is dropped rather than written late.
+
+        :param force: Write the payload now, even if the device was already sent it
         :raises LightUnavailableError: If device communication fails
         """
-        state = bytes(self)
+        if self._writer is not None:
+            self._writer.raise_error()
 
-        match self.platform:
-            case "Windows_10":
-                state = bytes([0]) + state
-            case "Darwin" | "Linux" | "Windows_11":
-                pass
-            case _:
-                logger.info(f"Unsupported OS {self.platform}, hoping for the best.")
+        with self._lock:
+            state = self._encode()
+
+            if self.elide_writes and not force and self._withhold(state):
+                return
+
+            self._discard_pending()
+            generation = self._stage(state)
+
+        self._deliver(state, generation)
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Write the update deferred by max_update_hz now, if there is one.
 
-        with self.exclusive_access():
-            logger.debug(f"{self.name} payload {state.hex(':')}")
+        With a background writer, also wait until the writer has written
+        every queued payload.
+
+        :param timeout: Seconds to wait for the writer, None waits until done
+        :raises LightUnavailableError: If device communication fails
+        :raises TimeoutError: If the writer has payloads left after timeout
+        """
+        self._flush_pending()
+        if self._writer is not None:
+            self._writer.flush(timeout)
+
+    def start_writer(self, maxsize: int = 8) -> None:
+        """Write to the device on a background thread from now on.
+
+        update() queues its payload for the writer thread and returns
+        without waiting for the device. Lights with elide_writes True
+        send complete states, so a queued payload is replaced by the
+        next one and only the latest is written. Other lights write
+        every payload in order, update() blocking while maxsize payloads
+        are waiting. A failed background write is raised by the next
+        call to update(), flush() or join().
+
+        :param maxsize: Most payloads waiting to be written
+        :raises ValueError: If maxsize is not positive
+        """
+        if self._writer is not None and self._writer.running:
+            return
+
+        self._writer = Writer(
+            self._transmit,
+            self.stats,
+            maxsize=maxsize,
+            latest_wins=self.elide_writes,
+            name=f"{self.__class__.__name__}-writer",
+        ).start()
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for queued writes and stop the background writer.
+
+        Later updates are written by the calling thread again. Updates
+        made while the writer is stopping wait for it, so they are never
+        written while a queued payload is still being written. A writer
+        still writing after timeout keeps writing later updates.
+
+        :param timeout: Seconds to wait for the writer thread to exit
+        :raises LightUnavailableError: If a background write failed
+        """
+        self._flush_pending()
+        with self._io_lock:
+            writer = self._writer
+            if writer is None:
+                return
             try:
-                self.write_strategy(state)
+                writer.join(timeout)
+            finally:
+                if writer.stopped:
+                    self._writer = None
+
+    def _flush_pending(self) -> None:
+        """Send the update deferred by max_update_hz, if there is one."""
+        with self._lock:
+            state = self._take_pending()
+
+            if state is None:
+                return
+
+            if state == self._written:
+                self.stats.elided += 1
+                return
+
+            generation = self._stage(state)
+            self.stats.merged += 1
+
+        self._deliver(state, generation)
+
+    def snapshot(self) -> Hashable | None:
+        """Return a value capturing the light's complete state.
+
+        Restoring the snapshot must reproduce the state, and equal
+        snapshots must serialize to the same payload. Subclasses that
+        support the payload cache override this, the default of None
+        marks the state as not cacheable.
+        """
+        return None
+
+    def restore(self, snapshot: Hashable) -> None:
+        """Return the light to the state captured by snapshot().
+
+        :param snapshot: Value previously returned by snapshot()
+        """
+        raise NotImplementedError
+
+    def cached_change(
+        self, *change: Hashable
+    ) -> contextlib.AbstractContextManager[bool]:
+        """Batch a state change, looking its result up in the payload cache.
+
+        The change, e.g. the color and LED given to on(), together with
+        the light's current snapshot is the cache key. On a hit the
+        resulting state is restored and its payload reused, so the
+        block should skip making the change when True is yielded. On
+        a miss the block makes the change and its result is cached.
+        With the cache disabled this is a plain batch_update() which
+        always yields False.
+
+        ```python
+        with self.cached_change(color, led) as hit:
+            if not hit:
+                self.color = color
+        ```
+
+        :param change: Hashable values describing the state change
+        :return: Context manager yielding True if the change was cached
+        """
+        if not self.payload_cache_size:
+            return _Miss(self.batch_update())
+        return self._cached_change(change)
+
+    @contextlib.contextmanager
+    def _cached_change(
+        self, change: tuple[Hashable, ...]
+    ) -> Generator[bool, None, None]:
+        """Batch a state change using the payload cache, see cached_change()."""
+        with self.batch_update():
+            prior = self.snapshot()
+
+            if prior is None:
+                yield False
+                return
+
+            cache = self.payload_cache()
+            key = (*change, prior)
+            entry = cache.get(key)
+
+            if entry is not None:
+                self.restore(entry[0])
+                self._hint = entry
+                yield True
+                return
+
+            yield False
+            entry = (self.snapshot(), bytes(self))
+            cache.put(key, entry)
+            self._hint = entry
+
+    def _encode(self) -> bytes:
+        """Return bytes(self), reusing the payload cached for the current state."""
+        hint = self._hint
+        if hint is not None and hint[0] == self.snapshot():
+            return hint[1]
+        return bytes(self)
+
+    def _withhold(self, state: bytes) -> bool:
+        """Elide or defer writing state if possible.
+
+        Must be called with the lock held.
+
+        :return: True if state should not be written now
+        """
+        target = self._written if self._pending is None else self._pending
+        if state == target:
+            self.stats.elided += 1
+            return True
+        return self._defer(state)
+
+    def _defer(self, state: bytes) -> bool:
+        """Hold state for a later write if writing now exceeds max_update_hz.
+
+        Must be called with the lock held.
+
+        :return: True if state will be written later
+        """
+        if not self._max_update_hz:
+            return False
+
+        delay = self._written_at + 1 / self._max_update_hz - time.monotonic()
+        if delay <= 0:
+            return False
+
+        if self._pending is not None:
+            self.stats.dropped += 1
+        self._pending = state
+
+        if self._flusher is None:
+            try:
+                loop = asyncio.get_running_loop()
+                # The write is made on the worker thread, not the loop.
+                self._flusher = loop.call_later(
+                    delay, self._executor.submit, self._flush_later
+                )
+            except RuntimeError:
+                self._flusher = threading.Timer(delay, self._flush_later)
+                self._flusher.daemon = True
+                self._flusher.start()
+
+        return True
+
+    def _flush_later(self) -> None:
+        """Write the deferred update when its time comes."""
+        # Nobody is waiting on this write, _send has already logged failures.
+        with contextlib.suppress(LightUnavailableError):
+            self._flush_pending()
+
+    def _take_pending(self) -> bytes | None:
+        """Return and forget the deferred update, cancelling its flush.
+
+        Must be called with the lock held.
+        """
+        state, self._pending = self._pending, None
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        return state
+
+    def _discard_pending(self) -> None:
+        """Forget any deferred update, counting it as dropped."""
+        if self._pending is None:
+            return
+        with self._lock:
+            if self._take_pending() is not None:
+                self.stats.dropped += 1
+
+    def _stage(self, state: bytes) -> int:
+        """Record state as the payload most recently sent to the device.
+
+        Updates compare their payloads with it before the write has been
+        made. Must be called with the lock held.
+
+        :return: Generation of state, newer payloads have higher generations
+        """
+        self._written = state
+        self._generation += 1
+        return self._generation
+
+    def _deliver(self, state: bytes, generation: int) -> None:
+        """Send state unless a newer complete state has been staged.
+
+        :param state: Serialized light state staged by _stage()
+        :param generation: Generation returned by _stage()
+        :raises LightUnavailableError: If device communication fails
+        """
+        with self._io_lock:
+            if self.elide_writes and generation != self._generation:
+                # The newer state is written by the update that staged it.
+                self.stats.dropped += 1
+                return
+            self._send(state)
+
+    @cached_property
+    def _queued(self) -> collections.deque[bytes]:
+        """Command payloads staged by _queue() and not yet sent."""
+        return collections.deque()
+
+    def _queue(self, command: bytes) -> None:
+        """Stage command to be sent by _drain() once the lock is released.
+
+        For classes with elide_writes False, whose payloads are commands
+        which must all reach the device in the order they were made.
+        Must be called with the lock held.
+
+        :param command: Serialized command without any platform prefix
+        """
+        self._stage(command)
+        self._queued.append(command)
+
+    def _drain(self) -> None:
+        """Send every queued command, oldest first.
+
+        Commands queued by other threads are sent too, so commands reach
+        the device in the order they were queued whichever thread sends
+        them. If a command fails, the commands queued after it are dropped.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        with self._io_lock:
+            try:
+                while self._queued:
+                    self._send(self._queued.popleft())
+            except LightUnavailableError:
+                self._queued.clear()
+                raise
+
+    def _send(self, state: bytes) -> None:
+        """Write state to the device, or to the outbox while capturing writes.
+
+        :param state: Serialized light state without any platform prefix
+        :raises LightUnavailableError: If device communication fails
+        """
+        outbox = getattr(self._local, "outbox", None)
+        if outbox is not None:
+            outbox.append(state)
+            return
+        if self._writer is not None:
+            self._writer.put(state)
+            return
+        self._transmit(state)
+
+    def _transmit(self, state: bytes) -> None:
+        """Write state to the device, forgetting the staged payload on failure.
+
+        :param state: Serialized light state without any platform prefix
+        :raises LightUnavailableError: If device communication fails
+        """
+        if self._degraded:
+            self._written = None
+            self.stats.dropped += 1
+            return
+
+        prefix, write = self._framing
+        payload = prefix + state if prefix else state
+        timeout = self.write_timeout
+
+        access = (
+            contextlib.nullcontext() if self._exclusive else self.exclusive_access()
+        )
+        with access:
+            _lazy_logger.debug(
+                "{name} payload {payload}",
+                name=lambda: self.name,
+                payload=lambda: payload.hex(":"),
+            )
+            try:
+                if timeout is None:
+                    write(payload)
+                elif not self._write_within(write, payload, timeout):
+                    self._miss(timeout)
+                    return
             except Exception as error:
+                self._written = None
                 logger.error(f"{self}: {error}")
                 raise LightUnavailableError(self) from None
 
-    @contextlib.contextmanager
-    def batch_update(self) -> Generator[None, None, None]:
+        self._misses = 0
+        self._written_at = time.monotonic()
+        self.stats.writes += 1
+
+    def _write_within(
+        self,
+        write: Callable[[bytes], None],
+        payload: bytes,
+        timeout: float,
+    ) -> bool:
+        """Write payload, giving up if the device takes longer than timeout.
+
+        Serial devices enforce the deadline with the port's write_timeout.
+        HID writes cannot be interrupted, so they are made on a worker
+        thread and abandoned if they miss the deadline. While an abandoned
+        write is still blocked, later writes are not queued behind it.
+
+        :return: True if payload was written in time
+        """
+        if self.hardware.device_type == ConnectionType.SERIAL:
+            handle = self.hardware.handle
+            if handle.write_timeout != timeout:
+                handle.write_timeout = timeout
+            try:
+                write(payload)
+            except serial.SerialTimeoutException:
+                return False
+            return True
+
+        if self._blocked():
+            return False
+
+        self._in_flight = future = self._deadline_executor.submit(write, payload)
+        try:
+            future.result(timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    def _blocked(self) -> bool:
+        """Return True if a HID write that missed its deadline is still running."""
+        return self._in_flight is not None and not self._in_flight.done()
+
+    def _miss(self, timeout: float) -> None:
+        """Count a write that missed its deadline, degrading the light if needed."""
+        self._written = None
+        self._misses += 1
+        self.stats.missed += 1
+        logger.warning(f"{self}: write missed its {timeout}s deadline, dropped")
+
+        if self.degrade_after and self._misses >= self.degrade_after:
+            self._degraded = True
+            logger.error(f"{self}: degraded after {self._misses} missed writes")
+
+    def batch_update(self) -> _Batch:
         """Defer device updates until multiple properties are changed.
 
         Context manager that accumulates multiple property changes and sends
@@ -486,10 +1105,39 @@ class Light(abc.ABC, TaskableMixin):
         brightness, effects) to reduce USB communication overhead and improve
         performance.
 
+        Batches may be nested, e.g. by calling on() inside a batch, and
+        only the outermost batch updates the device. Each nested batch
+        exit is counted in stats.coalesced. If the block raises an
+        exception the device is not updated.
+
+        The light's lock is held for the duration of the batch, so other
+        threads never see or write a partly changed state. It is released
+        before the device is updated.
+
         :return: Context manager for batching multiple property updates
         """
-        yield
-        self.update()
+        return _Batch(self._enter_batch, self._exit_batch)
+
+    def _enter_batch(self) -> None:
+        """Start a batch, acquiring the lock until _exit_batch()."""
+        self._lock.acquire()
+        self._batch_depth += 1
+
+    def _exit_batch(self, *, completed: bool) -> None:
+        """End a batch, updating the device if it was the outermost.
+
+        :param completed: False if the batch raised an exception
+        """
+        try:
+            self._batch_depth -= 1
+            outermost = not self._batch_depth
+            if completed and not outermost:
+                self.stats.coalesced += 1
+        finally:
+            self._lock.release()
+
+        if completed and outermost:
+            self.update()
 
     @abc.abstractmethod
     def on(
@@ -527,10 +1175,93 @@ class Light(abc.ABC, TaskableMixin):
         self.on((0, 0, 0), led)
 
     def reset(self) -> None:
-        """Turn the light off and cancel associated asynchronous tasks."""
+        """Turn the light off and cancel associated asynchronous tasks.
+
+        The light is written to immediately, even if it appears to already
+        be off or is degraded, and any update deferred by max_update_hz
+        is discarded.
+        """
+        self._reset_writes()
         self.off()
         self.cancel_tasks()
 
+    def _reset_writes(self) -> None:
+        """Forget earlier writes so the next update is written immediately.
+
+        Discards any deferred update and clears the degraded state.
+        """
+        with self._lock:
+            self._discard_pending()
+            self._written = None
+            self._written_at = 0.0
+            self._misses = 0
+            self._degraded = False
+
+    async def aon(self, color: tuple[int, int, int], led: int = 0) -> None:
+        """Awaitable on(), writing to the device without blocking the event loop.
+
+        The light's state changes immediately, the device write is made
+        by the light's own worker thread. Writes from the async methods
+        of a light reach the device in the order the methods were called.
+
+        :param color: RGB intensity values from 0-255 for each color component
+        :param led: Target LED index, 0 affects all LEDs on the device
+        :raises LightUnavailableError: If device communication fails
+        """
+        await self._acall(self.on, color, led)
+
+    async def aoff(self, led: int = 0) -> None:
+        """Awaitable off(), writing to the device without blocking the event loop.
+
+        :param led: Target LED index, 0 affects all LEDs on the device
+        :raises LightUnavailableError: If device communication fails
+        """
+        await self._acall(self.off, led)
+
+    async def aupdate(self, *, force: bool = False) -> None:
+        """Awaitable update(), writing to the device without blocking the event loop.
+
+        :param force: Write the payload now, even if the device was already sent it
+        :raises LightUnavailableError: If device communication fails
+        """
+        await self._acall(self.update, force=force)
+
+    async def areset(self) -> None:
+        """Awaitable reset(), writing to the device without blocking the event loop.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        await self._acall(self.reset)
+
+    async def _acall(
+        self,
+        method: Callable[..., None],
+        *args: object,
+        **kwargs: object,
+    ) -> None:
+        """Call method, then make its device writes on the worker thread."""
+        self._local.outbox = outbox = []
+        try:
+            method(*args, **kwargs)
+        finally:
+            self._local.outbox = None
+
+        if not outbox:
+            return
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._transmit_all, outbox)
+
+    def _transmit_all(self, states: list[bytes]) -> None:
+        """Send each of states in order, as update() would have sent them.
+
+        Writes are serialized with those made by other threads, and
+        queued for the background writer while it is running.
+        """
+        with self._io_lock:
+            for state in states:
+                self._send(state)
+
     @abc.abstractmethod
     def __bytes__(self) -> bytes:
         """Return the light's state suitable for writing to the device."""
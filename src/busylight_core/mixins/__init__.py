@@ -1,9 +1,13 @@
 """Mixin classes for extending Light functionality."""
 
 from .colorable import ColorableMixin
+from .readback import ReadbackMixin
+from .snapshot import WordSnapshotMixin
 from .taskable import TaskableMixin
 
 __all__ = [
     "ColorableMixin",
+    "ReadbackMixin",
     "TaskableMixin",
+    "WordSnapshotMixin",
 ]
@@ -0,0 +1,77 @@
+"""Query reply caching mixin for Light classes."""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+T = TypeVar("T")
+
+
+class ReadbackMixin:
+    """Mixin caching values read back from a device.
+
+    Values describing immutable device properties, e.g. a firmware
+    version, are read once and kept for the lifetime of the light.
+    Values describing volatile device state are kept for readback_ttl
+    seconds, or until invalidate_readings() is called. Values are
+    cached only after they have been parsed, so a malformed reply is
+    never served from the cache.
+    """
+
+    readback_ttl: ClassVar[float] = 1.0
+    """Seconds a volatile read back value is served from the cache."""
+
+    @cached_property
+    def _facts(self) -> dict[Hashable, Any]:
+        """Values of immutable device properties."""
+        return {}
+
+    @cached_property
+    def _readings(self) -> dict[Hashable, tuple[float, Any]]:
+        """Timestamped values of volatile device state."""
+        return {}
+
+    def invalidate_readings(self) -> None:
+        """Discard cached values of volatile device state."""
+        self._readings.clear()
+
+    def _fact(self, key: Hashable, read: Callable[[], T]) -> T:
+        """Return the cached value for key, calling read once to get it.
+
+        :param key: Identifies the property being read
+        :param read: Queries the device and returns the parsed value
+        """
+        with contextlib.suppress(KeyError):
+            return self._facts[key]
+        self._facts[key] = value = read()
+        return value
+
+    def _reading(
+        self,
+        key: Hashable,
+        read: Callable[[], T],
+        max_age: float | None,
+    ) -> T:
+        """Return a cached value younger than max_age, calling read if needed.
+
+        :param key: Identifies the state being read
+        :param read: Queries the device and returns the parsed value
+        :param max_age: Oldest cached value in seconds, defaults to readback_ttl
+        """
+        max_age = self.readback_ttl if max_age is None else max_age
+        now = time.monotonic()
+
+        with contextlib.suppress(KeyError):
+            timestamp, value = self._readings[key]
+            if now - timestamp < max_age:
+                return value
+
+        value = read()
+        self._readings[key] = (now, value)
+        return value
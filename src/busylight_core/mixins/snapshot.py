@@ -0,0 +1,21 @@
+"""State snapshot mixin for Light classes."""
+
+
+class WordSnapshotMixin:
+    """Mixin snapshotting a light whose complete state is a Word.
+
+    The light's state property must return a Word, whose integer value
+    captures every field written to the device. Use this mixin to make
+    such lights cacheable by the payload cache.
+    """
+
+    def snapshot(self) -> int:
+        """Return the device state as an integer."""
+        return self.state.value
+
+    def restore(self, snapshot: int) -> None:
+        """Return the device to a state returned by snapshot().
+
+        :param snapshot: Value previously returned by snapshot()
+        """
+        self.state.value = snapshot
@@ -0,0 +1,38 @@
+"""Write statistics for USB connected lights."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class LightStats:
+    """Counters describing the device writes made by a light.
+
+    Each Light instance keeps its own counters, available as the
+    light's stats attribute. Counters only ever increase until
+    clear() is called.
+    """
+
+    writes: int = 0
+    """Payloads written to the device."""
+
+    elided: int = 0
+    """Updates skipped because the device already had the payload."""
+
+    coalesced: int = 0
+    """Nested batch updates folded into their outermost batch."""
+
+    dropped: int = 0
+    """Deferred updates replaced or discarded before being written."""
+
+    merged: int = 0
+    """Deferred updates written once max_update_hz allowed."""
+
+    missed: int = 0
+    """Payloads dropped because their write missed write_timeout."""
+
+    def clear(self) -> None:
+        """Reset every counter to zero."""
+        for name in asdict(self):
+            setattr(self, name, 0)
@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from busylight_core.hardware import Hardware
 
 from .blinkstick_base import BlinkStickBase
-from .implementation import State
+from .implementation import Layout, State
 
 
 class BlinkStickFlex(BlinkStickBase):
@@ -17,6 +17,9 @@ class BlinkStickFlex(BlinkStickBase):
 
     The BlinkStick Flex is a USB-connected RGB LED device with a flex form factor
     that can be controlled to display various colors and patterns for status indication.
+
+    Up to 32 LEDs may be attached to a Flex. Set chain_length to the
+    number actually attached so layout effects span only those LEDs.
     """
 
     supported_device_ids: ClassVar[dict[tuple[int, int], str]] = {
@@ -38,3 +41,17 @@ class BlinkStickFlex(BlinkStickBase):
     def state(self) -> State:
         """The state of the BlinkStick Flex."""
         return State.blinkstick_flex()
+
+    @property
+    def chain_length(self) -> int:
+        """Number of LEDs physically attached to the Flex."""
+        return self.state.layout.chain_length
+
+    @chain_length.setter
+    def chain_length(self, value: int) -> None:
+        if value > self.state.nleds:
+            msg = f"chain_length {value} exceeds {self.state.nleds} LEDs"
+            raise ValueError(msg)
+        layout = Layout.linear(value)
+        with self._lock:
+            self.state.layout = layout
@@ -1,7 +1,10 @@
 """Agile Innovative BlinkStick implementation details."""
 
+from .layout import Layout, Shape
 from .state import State
 
 __all__ = [
+    "Layout",
+    "Shape",
     "State",
 ]
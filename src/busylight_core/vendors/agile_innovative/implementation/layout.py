@@ -0,0 +1,121 @@
+"""Agile Innovative BlinkStick LED layout metadata.
+
+This module defines the Layout class which describes where the LEDs
+of a BlinkStick variant physically sit: around a ring, along a strip
+or as a single point. Spatial effects use the precomputed index
+arrays to rearrange a State's colors with a single gather instead of
+recomputing index arithmetic for every pixel.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import cached_property
+
+
+class Shape(StrEnum):
+    """Physical arrangement of the LEDs on a BlinkStick device."""
+
+    POINT = "point"
+    LINEAR = "linear"
+    RING = "ring"
+
+
+@dataclass(frozen=True)
+class Layout:
+    """Geometry of the LEDs driven by a BlinkStick device.
+
+    The chain_length is the number of LEDs that are physically
+    present, which may be fewer than the number of LEDs the device
+    report can address (e.g. a BlinkStick Flex driving a short strip).
+    Index arrays only cover the LEDs in the chain.
+    """
+
+    shape: Shape
+    chain_length: int
+
+    @classmethod
+    def point(cls) -> Layout:
+        """Create a layout for a device with a single LED."""
+        return cls(shape=Shape.POINT, chain_length=1)
+
+    @classmethod
+    def linear(cls, chain_length: int) -> Layout:
+        """Create a layout for LEDs arranged in a line.
+
+        :param chain_length: Number of LEDs in the strip
+        """
+        return cls(shape=Shape.LINEAR, chain_length=chain_length)
+
+    @classmethod
+    def ring(cls, chain_length: int) -> Layout:
+        """Create a layout for LEDs evenly spaced around a circle.
+
+        :param chain_length: Number of LEDs in the ring
+        """
+        return cls(shape=Shape.RING, chain_length=chain_length)
+
+    def __post_init__(self) -> None:
+        if self.chain_length <= 0:
+            msg = f"chain_length must be positive: {self.chain_length}"
+            raise ValueError(msg)
+
+    @cached_property
+    def indices(self) -> tuple[int, ...]:
+        """LED indices in chain order."""
+        return tuple(range(self.chain_length))
+
+    @cached_property
+    def positions(self) -> tuple[float, ...]:
+        """Normalized position of each LED in the range [0.0, 1.0].
+
+        Linear layouts span 0.0 to 1.0 inclusive from the first to
+        the last LED. Ring layouts give the fraction of a full turn
+        in [0.0, 1.0), so the last LED sits just before the first.
+        """
+        n = self.chain_length
+        match self.shape:
+            case Shape.LINEAR if n > 1:
+                return tuple(i / (n - 1) for i in self.indices)
+            case Shape.RING:
+                return tuple(i / n for i in self.indices)
+            case _:
+                return (0.0,) * n
+
+    @cached_property
+    def angles(self) -> tuple[float, ...]:
+        """Angle of each LED in radians, clockwise from LED 0.
+
+        Only meaningful for ring layouts; other shapes report 0.0
+        for every LED.
+        """
+        if self.shape != Shape.RING:
+            return (0.0,) * self.chain_length
+        return tuple(math.tau * p for p in self.positions)
+
+    @cached_property
+    def reversed(self) -> tuple[int, ...]:
+        """Permutation that mirrors the chain end to end."""
+        return self.indices[::-1]
+
+    @cached_property
+    def rotations(self) -> tuple[tuple[int, ...], ...]:
+        """Permutations rotating the chain by 0 to chain_length - 1 steps.
+
+        Entry `rotations[s][i]` is the index of the LED whose color
+        LED `i` should show after rotating `s` steps forward.
+        """
+        n = self.chain_length
+        return tuple(tuple((i - steps) % n for i in self.indices) for steps in range(n))
+
+    def rotation(self, steps: int) -> tuple[int, ...]:
+        """Return the permutation rotating the chain by steps LEDs.
+
+        Negative steps rotate backwards.
+
+        :param steps: Number of LED positions to rotate by
+        :return: Gather indices suitable for State.gather
+        """
+        return self.rotations[steps % self.chain_length]
@@ -7,6 +7,12 @@ for BlinkStick devices, including LED arrays and color format conversion.
 from __future__ import annotations
 
 import contextlib
+from typing import TYPE_CHECKING
+
+from .layout import Layout
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 
 class State:
@@ -16,12 +22,15 @@ class State:
     while the public API uses the standard Red-Green-Blue (RGB) format.
     This class handles the conversion automatically and supports multiple
     device variants with different LED counts and report formats.
+
+    Each state carries a Layout describing where its LEDs physically
+    sit, which spatial effects use to rearrange colors with gather().
     """
 
     @classmethod
     def blinkstick(cls) -> State:
         """Create state for original BlinkStick (single LED, report 1)."""
-        return cls(report=1, nleds=1)
+        return cls(report=1, nleds=1, layout=Layout.point())
 
     @classmethod
     def blinkstick_pro(cls) -> State:
@@ -30,32 +39,48 @@ class State:
 
     @classmethod
     def blinkstick_square(cls) -> State:
-        """Create state for BlinkStick Square (8 LEDs, report 6)."""
-        return cls(report=6, nleds=8)
+        """Create state for BlinkStick Square (8 LEDs in a ring, report 6)."""
+        return cls(report=6, nleds=8, layout=Layout.ring(8))
 
     @classmethod
     def blinkstick_strip(cls) -> State:
-        """Create state for BlinkStick Strip (8 LEDs, report 6)."""
-        return cls(report=6, nleds=8)
+        """Create state for BlinkStick Strip (8 LEDs in a line, report 6)."""
+        return cls(report=6, nleds=8, layout=Layout.linear(8))
 
     @classmethod
     def blinkstick_nano(cls) -> State:
         """Create state for BlinkStick Nano (2 LEDs, report 6)."""
-        return cls(report=6, nleds=2)
+        return cls(report=6, nleds=2, layout=Layout.linear(2))
 
     @classmethod
-    def blinkstick_flex(cls) -> State:
-        """Create state for BlinkStick Flex (32 LEDs, report 6)."""
-        return cls(report=6, nleds=32)
+    def blinkstick_flex(cls, chain_length: int = 32) -> State:
+        """Create state for BlinkStick Flex (32 LEDs, report 6).
 
-    def __init__(self, *, report: int, nleds: int) -> None:
+        :param chain_length: Number of LEDs physically attached to the Flex
+        """
+        return cls(report=6, nleds=32, layout=Layout.linear(chain_length))
+
+    def __init__(
+        self,
+        *,
+        report: int,
+        nleds: int,
+        layout: Layout | None = None,
+    ) -> None:
         """Initialize BlinkStick state.
 
         :param report: HID report number for this device variant
         :param nleds: Number of LEDs supported by this device
+        :param layout: LED geometry, defaults to a line of nleds LEDs
+        :raises ValueError: If the layout chain is longer than nleds
         """
+        layout = layout or Layout.linear(nleds)
+        if layout.chain_length > nleds:
+            msg = f"chain_length {layout.chain_length} exceeds {nleds} LEDs"
+            raise ValueError(msg)
         self.report = report
         self.nleds = nleds
+        self.layout = layout
         self.channel = 0
         self.colors: list[tuple[int, int, int]] = [(0, 0, 0)] * nleds
 
@@ -132,3 +157,21 @@ class State:
         """
         with contextlib.suppress(IndexError):
             self.colors[index] = self.rgb_to_grb(color)
+
+    def gather(self, indices: Sequence[int]) -> None:
+        """Rearrange LED colors so LED i shows the color at indices[i].
+
+        All source colors are read before any are written, so indices
+        may be any permutation. LEDs beyond len(indices) are unchanged.
+
+        :param indices: Source LED index for each destination LED
+        """
+        colors = self.colors
+        self.colors = [colors[i] for i in indices] + colors[len(indices) :]
+
+    def rotate(self, steps: int = 1) -> None:
+        """Rotate LED colors along the layout chain by steps positions.
+
+        :param steps: Number of positions to rotate, negative reverses
+        """
+        self.gather(self.layout.rotation(steps))
@@ -1,24 +1,41 @@
 """CompuLab fit-statUSB status light implementation."""
 
+from __future__ import annotations
+
+import asyncio
+from functools import lru_cache, partial
 from typing import ClassVar
 
 from busylight_core.mixins import ColorableMixin
 
 from .compulab_base import CompuLabBase
 
+Step = tuple[tuple[int, int, int], int]
+
 
 class FitStatUSB(ColorableMixin, CompuLabBase):
     """CompuLab fit-statUSB status light controller.
 
     The fit-statUSB is a USB-connected RGB LED device that communicates
     using text-based commands for color control.
+
+    Multi-color sequences are stored on and looped by the device, so
+    blinking indications need no further writes once uploaded.
     """
 
     supported_device_ids: ClassVar[dict[tuple[int, int], str]] = {
         (0x2047, 0x03DF): "fit-statUSB",
     }
 
+    max_step_ms: ClassVar[int] = 9999
+    """Longest duration of a single sequence step in milliseconds."""
+
+    _sequence: bytes | None = None
+
     def __bytes__(self) -> bytes:
+        if self._sequence:
+            return self._sequence
+
         buf = f"B#{self.red:02x}{self.green:02x}{self.blue:02x}\n"
 
         return buf.encode()
@@ -26,8 +43,104 @@ class FitStatUSB(ColorableMixin, CompuLabBase):
     def on(self, color: tuple[int, int, int], led: int = 0) -> None:
         """Turn on the fit-statUSB with the specified color.
 
+        Stops any sequence the device is playing.
+
         :param color: RGB tuple (red, green, blue).
         :param led: LED index (not used by fit-statUSB).
         """
+        if "sequence" in self.tasks:
+            self.cancel_task("sequence")
+
+        with self.cached_change(tuple(color)) as hit:
+            if not hit:
+                self._sequence = None
+                self.color = color
+
+    def snapshot(self) -> tuple[int, int, int] | None:
+        """Return the color shown, None while a sequence is uploaded."""
+        return None if self._sequence else self.color
+
+    def restore(self, snapshot: tuple[int, int, int]) -> None:
+        """Return the device to a color returned by snapshot().
+
+        :param snapshot: Value previously returned by snapshot()
+        """
+        self._sequence = None
+        self.color = snapshot
+
+    def sequence(self, steps: list[Step], *, repeat: bool = True) -> None:
+        """Upload a sequence of colors for the device to play.
+
+        Each step shows a color for a number of milliseconds. Steps
+        longer than max_step_ms are split into several steps of the
+        same color. Encoded sequences are cached by content, and
+        uploading the sequence the device is already playing writes
+        nothing.
+
+        The device loops sequences on its own. If repeat is False a
+        task shows the last step's color once the sequence has played
+        through, the only host I/O after the upload.
+
+        :param steps: List of (color, duration_ms) pairs
+        :param repeat: Loop the sequence until the next color change
+        :raises ValueError: If steps is empty or a duration is not positive
+        """
+        steps = tuple((tuple(color), int(ms)) for color, ms in steps)
+
         with self.batch_update():
-            self.color = color
+            self._sequence = self.encode_sequence(steps, self.max_step_ms)
+            self.color = steps[0][0]
+
+        if repeat:
+            self.cancel_task("sequence")
+            return
+
+        duration = sum(ms for _, ms in steps) / 1000
+        self.add_task(
+            "sequence",
+            partial(_finish_sequence, delay=duration, color=steps[-1][0]),
+            replace=True,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def encode_sequence(steps: tuple[Step, ...], max_step_ms: int) -> bytes:
+        """Return the command that uploads a sequence of colors.
+
+        :param steps: Tuple of (color, duration_ms) pairs
+        :param max_step_ms: Longest duration of a single encoded step
+        :raises ValueError: If steps is empty or a duration is not positive
+        """
+        if not steps:
+            msg = "a sequence needs at least one step"
+            raise ValueError(msg)
+
+        encoded = []
+        for (red, green, blue), ms in steps:
+            if ms <= 0:
+                msg = f"step durations must be positive: {ms}"
+                raise ValueError(msg)
+            remaining = ms
+            while remaining > 0:
+                step_ms = min(remaining, max_step_ms)
+                encoded.append(f"#{red:02x}{green:02x}{blue:02x}-{step_ms:04d}")
+                remaining -= step_ms
+
+        return f"B{''.join(encoded)}\n".encode()
+
+    def reset(self) -> None:
+        """Turn the light off, stopping any sequence."""
+        self._sequence = None
+        super().reset()
+
+
+async def _finish_sequence(
+    light: FitStatUSB,
+    delay: float,
+    color: tuple[int, int, int],
+) -> None:
+    """Show color on light once a non-repeating sequence has played."""
+    await asyncio.sleep(delay)
+    # Untrack this task first so on() finishes it rather than cancelling it.
+    light.tasks.pop("sequence", None)
+    light.on(color)
@@ -3,6 +3,7 @@
 from typing import ClassVar
 
 from .embrava_base import EmbravaBase
+from .implementation import Cue
 
 
 class BlynclightPlus(EmbravaBase):
@@ -10,6 +11,9 @@ class BlynclightPlus(EmbravaBase):
 
     An enhanced version of the Blynclight with additional features
     while maintaining the same basic functionality.
+
+    Alerts combining a color, flash pattern and ringtone should be
+    sent with alert(), which writes a whole Cue in one report.
     """
 
     supported_device_ids: ClassVar[dict[tuple[int, int], str]] = {
@@ -17,6 +21,19 @@ class BlynclightPlus(EmbravaBase):
         (0x2C0D, 0x0010): "Blynclight Plus",
     }
 
+    def alert(self, cue: Cue) -> None:
+        """Show a cue's color, flash pattern and sound with a single write.
+
+        Replaces the entire device state, including any sound that
+        is playing and the mute setting. The cue's report is written
+        as is, without encoding the state again.
+
+        :param cue: The alert to show
+        """
+        with self.batch_update():
+            self.state.value = cue.value
+            self._hint = (cue.value, cue.frame)
+
     def play_sound(self, music: int = 0, volume: int = 1, repeat: bool = False) -> None:
         """Play a sound on the device.
 
@@ -3,11 +3,12 @@
 from functools import cached_property
 
 from busylight_core.light import Light
+from busylight_core.mixins import WordSnapshotMixin
 
 from .implementation import FlashSpeed, State
 
 
-class EmbravaBase(Light):
+class EmbravaBase(WordSnapshotMixin, Light):
     """Base class for Embrava Blynclight family devices.
 
     Provides common functionality for all Blynclight devices including
@@ -26,12 +27,7 @@ class EmbravaBase(Light):
 
     def __bytes__(self) -> bytes:
         """Return the device state as bytes for USB communication."""
-        if not self.is_lit:
-            self.state.off = True
-            self.state.flash = False
-            self.state.dim = False
-
-        return bytes([0, *bytes(self.state), 0xFF, 0x22])
+        return self.state.frame()
 
     @property
     def color(self) -> tuple[int, int, int]:
@@ -49,8 +45,9 @@ class EmbravaBase(Light):
         :param color: RGB color tuple (red, green, blue)
         :param led: LED index (not used by Blynclight devices)
         """
-        with self.batch_update():
-            self.color = color
+        with self.cached_change(tuple(color)) as hit:
+            if not hit:
+                self.color = color
 
     def dim(self) -> None:
         """Dim the current light color."""
@@ -90,5 +87,6 @@ class EmbravaBase(Light):
 
     def reset(self) -> None:
         """Reset the device to its default state (off, no sound)."""
+        self._reset_writes()
         self.state.reset()
-        self.update()
+        self.update(force=True)
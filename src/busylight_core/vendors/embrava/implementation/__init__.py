@@ -1,5 +1,6 @@
 """Embrava Blynclight implementation details."""
 
+from .cue import Cue
 from .enums import FlashSpeed
 from .fields import (
     BlueField,
@@ -19,6 +20,7 @@ from .state import State
 
 __all__ = [
     "BlueField",
+    "Cue",
     "DimBit",
     "FlashBit",
     "FlashSpeed",
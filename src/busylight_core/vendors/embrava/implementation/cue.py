@@ -0,0 +1,56 @@
+"""Embrava Blynclight alert cues.
+
+This module defines the Cue class which combines a color, flash
+pattern and ringtone into a single device state so an alert is
+sent to a device with one report instead of one per setting.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from .state import State
+
+if TYPE_CHECKING:
+    from .enums import FlashSpeed
+
+
+@dataclass(frozen=True)
+class Cue:
+    """An immutable color, flash and sound combination.
+
+    Cues are hashable and encode their report once, so a cue shared
+    by many devices costs a single encoding and one write per device.
+    A music of None leaves the speaker silent.
+    """
+
+    color: tuple[int, int, int]
+    flash: FlashSpeed | None = None
+    dim: bool = False
+    music: int | None = None
+    volume: int = 1
+    repeat: bool = False
+
+    @cached_property
+    def value(self) -> int:
+        """Integer value of the State that shows this cue."""
+        state = State()
+        state.reset()
+        state.red, state.green, state.blue = self.color
+        state.dim = self.dim
+        if self.flash:
+            state.flash = True
+            state.speed = self.flash.value
+        if self.music is not None:
+            state.play = True
+            state.music = self.music
+            state.volume = self.volume
+            state.repeat = self.repeat
+        return state.value
+
+    @cached_property
+    def frame(self) -> bytes:
+        """The 9-byte output report that shows this cue."""
+        return State.encode(self.value)
@@ -5,7 +5,9 @@ structure for Embrava Blynclight devices, including LED control and
 audio functionality.
 """
 
-from busylight_core.word import Word
+import functools
+
+from busylight_core.word import BitField, Word
 
 from .enums import FlashSpeed
 from .fields import (
@@ -76,6 +78,31 @@ class State(Word):
         self.music = 0
         self.volume = 0
 
+    def frame(self) -> bytes:
+        """Return the 9-byte output report for this state.
+
+        The state itself is not modified; see encode.
+        """
+        return self.encode(self.value)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def encode(value: int) -> bytes:
+        """Return the 9-byte output report for a state value.
+
+        A state with no color is sent with the off bit set and the
+        flash and dim bits clear, any other state with the off bit
+        clear. Reports are cached by value, so devices and cues that
+        share a state share a single encoded report.
+
+        :param value: Integer value of a State
+        """
+        if value & _COLOR:
+            value &= ~_OFF
+        else:
+            value = (value | _OFF) & ~(_FLASH | _DIM)
+        return bytes([0, *value.to_bytes(6, byteorder="big"), 0xFF, 0x22])
+
     red = RedField()
     blue = BlueField()
     green = GreenField()
@@ -88,3 +115,13 @@ class State(Word):
     music = MusicField()
     volume = VolumeField()
     mute = MuteBit()
+
+
+def _mask(field: BitField) -> int:
+    return ((1 << field.width) - 1) << field.offset
+
+
+_COLOR = _mask(State.red) | _mask(State.green) | _mask(State.blue)
+_OFF = _mask(State.off)
+_FLASH = _mask(State.flash)
+_DIM = _mask(State.dim)
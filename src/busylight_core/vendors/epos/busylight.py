@@ -3,15 +3,22 @@
 from functools import cached_property
 from typing import ClassVar
 
+from busylight_core.mixins import WordSnapshotMixin
+
 from .epos_base import EPOSBase
-from .implementation import Action, Report, State
+from .implementation import State
 
 
-class Busylight(EPOSBase):
+class Busylight(WordSnapshotMixin, EPOSBase):
     """EPOS Busylight status light controller.
 
     The EPOS Busylight is a USB-connected RGB LED device that provides
     status indication with multiple LED control capabilities.
+
+    Both LEDs are carried in every report, so any combination of
+    colors is written with a single report. The colors last written
+    are remembered and updates that would not change either LED are
+    not sent.
     """
 
     supported_device_ids: ClassVar[dict[tuple[int, int], str]] = {
@@ -32,17 +39,36 @@ class Busylight(EPOSBase):
         :param color: RGB color tuple (red, green, blue) with values 0-255
         :param led: LED index (0 for both LEDs, 1 for first LED, 2 for second LED)
         """
-        with self.batch_update():
+        with self.cached_change(tuple(color), led) as hit:
+            if hit:
+                return
             match led:
                 case 1:
-                    self.state.color0 = color
+                    self.state.set_colors(color, self.state.color1)
                 case 2:
-                    self.state.color1 = color
+                    self.state.set_colors(self.state.color0, color)
                 case _:
-                    self.state.color = color
+                    self.state.set_colors(color, color)
 
-            self.state.report = Report.ONE
-            self.state.action = Action.SetColor
+    def set_leds(
+        self,
+        color0: tuple[int, int, int],
+        color1: tuple[int, int, int],
+    ) -> None:
+        """Set both LEDs with a single report.
+
+        :param color0: RGB color for the first LED
+        :param color1: RGB color for the second LED
+        """
+        with self.batch_update():
+            self.state.set_colors(color0, color1)
+
+    def get_led(self, led: int) -> tuple[int, int, int]:
+        """Return the color most recently requested for LED 1 or 2.
+
+        :param led: LED number (1 or 2)
+        """
+        return (self.state.color0, self.state.color1)[led - 1]
 
     @property
     def color(self) -> tuple[int, int, int]:
@@ -6,6 +6,7 @@ for EPOS Busylight devices, including dual-LED control and device configuration.
 
 from busylight_core.word import Word
 
+from .enums import Action, Report
 from .fields import ActionField, ColorField, OnField, ReportField
 
 
@@ -70,3 +71,18 @@ class State(Word):
         """Set both LEDs to the same color."""
         self.color0 = color
         self.color1 = color
+
+    def set_colors(
+        self,
+        color0: tuple[int, int, int],
+        color1: tuple[int, int, int],
+    ) -> None:
+        """Prepare a single SetColor report for both LEDs.
+
+        :param color0: RGB color for the first LED
+        :param color1: RGB color for the second LED
+        """
+        self.report = Report.ONE
+        self.action = Action.SetColor
+        self.color0 = color0
+        self.color1 = color1
@@ -1,5 +1,7 @@
 """Kuando vendor base class."""
 
+from typing import ClassVar
+
 from busylight_core.light import Light
 
 
@@ -9,8 +11,13 @@ class KuandoBase(Light):
     Provides common functionality for all Kuando devices,
     primarily the Busylight product line. Use this as a base
     class when implementing new Kuando device variants.
+
+    Keep alive packets repeat the same payload, so writes are never
+    elided.
     """
 
+    elide_writes: ClassVar[bool] = False
+
     @staticmethod
     def vendor() -> str:
         """Return the vendor name for Kuando devices.
@@ -2,7 +2,25 @@
 
 # https://luxafor.helpscoutdocs.com/article/47-busy-tag-usb-cdc-command-reference-guide
 
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future
 from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from os import PathLike
+
+    import serial
+
+    Source = str | PathLike | bytes | bytearray | memoryview
 
 
 class Command(str, Enum):
@@ -18,6 +36,7 @@ class Command(str, Enum):
     GetLastResetReasonCore0: str = "AT+GLRR0"
     GetLastResetReasonCore1: str = "AT+GLRR1"
     SolidColor: str = "AT+SC={leds},{red:02x}{green:02x}{blue:02x}"
+    UploadFile: str = "AT+UF={name},{size}"
 
     @classmethod
     def solid_color(cls, color: tuple[int, int, int], led: int = 0) -> None:
@@ -25,3 +44,499 @@ class Command(str, Enum):
         led = 127 if led == 0 else 1 << led
 
         return cls.SolidColor.format(leds=led, red=red, green=green, blue=blue)
+
+    @classmethod
+    def upload_file(cls, name: str, size: int) -> str:
+        return cls.UploadFile.format(name=name, size=size)
+
+    @staticmethod
+    def is_query(command: str) -> bool:
+        """Return True if command only reads from the device."""
+        return command.startswith("AT+G")
+
+
+class Response(NamedTuple):
+    """The lines a Busy Tag sent in reply to a single AT command."""
+
+    command: str
+    lines: tuple[str, ...] = ()
+    ok: bool = True
+
+    @property
+    def value(self) -> str:
+        """Payload of the first response line, without its `+TAG:` prefix."""
+        if not self.lines:
+            return ""
+        _, sep, value = self.lines[0].partition(":")
+        return value if sep else self.lines[0]
+
+
+class Transport:
+    """Pipelined AT command transport for a Busy Tag serial handle.
+
+    Commands are written as soon as they are submitted without
+    waiting for earlier commands to be answered. A background reader
+    thread splits the device's output into lines and completes the
+    Future of the oldest outstanding command whenever a final `OK`
+    or `ERROR` line arrives, so callers never block on the serial
+    handle's read timeout.
+
+    Commands submitted while data is being streamed are queued and
+    written once the stream ends, so callers never wait for a stream.
+    """
+
+    terminator: ClassVar[bytes] = b"\r\n"
+    final: ClassVar[frozenset[str]] = frozenset({"OK", "ERROR"})
+
+    high_water: ClassVar[int] = 8192
+    """Bytes queued in the serial driver before streaming pauses."""
+
+    drain_interval: ClassVar[float] = 0.001
+    """Seconds to wait for the serial driver to drain below high_water."""
+
+    def __init__(self, handle: serial.Serial) -> None:
+        """Create a transport for an open serial handle.
+
+        :param handle: Serial handle of the Busy Tag device
+        """
+        self.handle = handle
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending: deque[tuple[str, Future[Response]]] = deque()
+        self._backlog: list[tuple[bytes, Future[Response], bool]] = []
+        self._streaming = False
+        self._lines: list[str] = []
+        self._buffer = b""
+        self._stop = threading.Event()
+        self._reader: threading.Thread | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of commands still waiting for a response."""
+        return len(self._pending)
+
+    def submit(self, command: str | bytes) -> Future[Response]:
+        """Write command to the device and return a Future for its response.
+
+        While data is being streamed the command is queued and written
+        after the stream, and this method returns without waiting.
+
+        :param command: AT command, with or without a line terminator
+        :return: Future resolved with the device's Response
+        """
+        return self._submit(command, replaces=False)
+
+    def _submit(self, command: str | bytes, *, replaces: bool) -> Future[Response]:
+        payload = command.encode() if isinstance(command, str) else bytes(command)
+        payload = payload.rstrip(self.terminator)
+        future: Future[Response] = Future()
+
+        # A stream holds the write lock for its duration, poll rather
+        # than block so a stream starting now queues the command.
+        while True:
+            with self._lock:
+                if self._streaming:
+                    self._queue(payload, future, replaces=replaces)
+                    return future
+            if self._write_lock.acquire(timeout=self.drain_interval):
+                break
+
+        try:
+            self._expect(payload, future)
+            self._write_or_forget(payload + self.terminator, future)
+        finally:
+            self._write_lock.release()
+
+        self.start()
+        return future
+
+    def _queue(
+        self,
+        payload: bytes,
+        future: Future[Response],
+        *,
+        replaces: bool,
+    ) -> None:
+        """Queue payload behind the stream, must be called with the lock held."""
+        if replaces:
+            # Only the latest of the commands written by send() matters.
+            self._backlog = [item for item in self._backlog if not item[2]]
+        self._backlog.append((payload, future, replaces))
+
+    def stream(
+        self,
+        command: str,
+        chunks: Iterable[memoryview],
+        size: int,
+        cancel: threading.Event | None = None,
+        on_chunk: Callable[[int], None] | None = None,
+    ) -> Future[Response]:
+        """Write command followed by size bytes of data and return a Future.
+
+        No other command is written until the data has been written, so
+        the data is never interleaved with AT commands. Commands
+        submitted meanwhile are queued and written after the data, and
+        responses to earlier commands continue to be matched. Writing
+        pauses whenever more than high_water bytes are waiting in the
+        serial driver, keeping the driver's buffer bounded.
+
+        The command announces size bytes and the device reads that many
+        before it accepts commands again. If cancel is set, the rest of
+        the data is written as zero bytes and the Future fails with
+        CancelledError. The device's reply to the padded data is
+        discarded.
+
+        :param command: AT command announcing the data
+        :param chunks: Data to write after the command
+        :param size: Number of bytes announced by command
+        :param cancel: Event that stops streaming before the next chunk
+        :param on_chunk: Called with the size of each chunk written
+        :return: Future resolved with the device's Response
+        :raises CancelledError: If cancel was set before the last chunk
+        """
+        payload = command.encode().rstrip(self.terminator)
+        future: Future[Response] = Future()
+
+        with self._write_lock:
+            with self._lock:
+                self._streaming = True
+            try:
+                self._expect(payload, future)
+                self._write_or_forget(payload + self.terminator, future)
+                self.start()
+                self._write_data(future, chunks, size, cancel, on_chunk)
+            finally:
+                self._write_backlog()
+
+        return future
+
+    def _write_data(
+        self,
+        future: Future[Response],
+        chunks: Iterable[memoryview],
+        size: int,
+        cancel: threading.Event | None,
+        on_chunk: Callable[[int], None] | None,
+    ) -> None:
+        sent = 0
+        for chunk in chunks:
+            if cancel and cancel.is_set():
+                future.set_exception(CancelledError())
+                self._pad(size - sent, future)
+                raise CancelledError
+            self._drain()
+            self._write_or_forget(chunk, future)
+            sent += len(chunk)
+            if on_chunk:
+                on_chunk(len(chunk))
+
+    def _pad(self, count: int, future: Future[Response]) -> None:
+        """Write count zero bytes, completing the data the device expects."""
+        zeros = memoryview(bytes(min(count, self.high_water)))
+        while count > 0:
+            self._drain()
+            self._write_or_forget(zeros[:count], future)
+            count -= len(zeros)
+
+    def _write_backlog(self) -> None:
+        """Write the commands queued during a stream, in order."""
+        with self._lock:
+            backlog, self._backlog = self._backlog, []
+            self._streaming = False
+
+        for payload, future, _ in backlog:
+            self._expect(payload, future)
+            try:
+                self._write_or_forget(payload + self.terminator, future)
+            except Exception as error:
+                logger.debug(f"queued Busy Tag command {payload!r} failed: {error}")
+
+    def _expect(self, payload: bytes, future: Future[Response]) -> None:
+        with self._lock:
+            self._pending.append((payload.decode(errors="replace"), future))
+
+    def _write_or_forget(
+        self,
+        data: bytes | memoryview,
+        future: Future[Response],
+    ) -> None:
+        """Write data, forgetting future's command and failing it on error."""
+        try:
+            self.handle.write(data)
+        except Exception as error:
+            with self._lock:
+                for index, (_, pending) in enumerate(self._pending):
+                    if pending is future:
+                        del self._pending[index]
+                        break
+            if not future.done():
+                future.set_exception(error)
+            raise
+
+    def _drain(self) -> None:
+        while getattr(self.handle, "out_waiting", 0) > self.high_water:
+            time.sleep(self.drain_interval)
+
+    def send(self, command: str | bytes) -> None:
+        """Write command to the device without waiting for its response.
+
+        Suitable for use as a Light write_strategy. Commands sent while
+        data is being streamed replace any sent earlier in the stream,
+        only the latest is written once the stream ends.
+
+        :param command: AT command, with or without a line terminator
+        """
+        self._submit(command, replaces=True)
+
+    def request(self, command: str | bytes, timeout: float | None = 1.0) -> Response:
+        """Write command to the device and wait for its response.
+
+        :param command: AT command, with or without a line terminator
+        :param timeout: Seconds to wait for the response, None waits forever
+        :return: The device's Response
+        :raises TimeoutError: If no response arrives in time
+        """
+        return self.submit(command).result(timeout)
+
+    def feed(self, data: bytes) -> None:
+        """Parse bytes received from the device.
+
+        Complete lines are matched against outstanding commands and any
+        trailing partial line is kept until more data arrives.
+
+        :param data: Bytes read from the serial handle
+        """
+        self._buffer += data
+        *lines, self._buffer = self._buffer.split(b"\n")
+        for line in lines:
+            self._receive(line.strip().decode(errors="replace"))
+
+    def _receive(self, line: str) -> None:
+        if not line:
+            return
+
+        with self._lock:
+            if not self._pending:
+                logger.debug(f"unsolicited Busy Tag response: {line!r}")
+                self._lines.clear()
+                return
+
+            command, future = self._pending[0]
+
+            if line == command:
+                return
+
+            if line not in self.final:
+                self._lines.append(line)
+                return
+
+            self._pending.popleft()
+            response = Response(command, tuple(self._lines), ok=line == "OK")
+            self._lines.clear()
+
+        if not response.ok:
+            logger.debug(f"Busy Tag rejected {command!r}")
+
+        if not future.done():
+            future.set_result(response)
+
+    def start(self) -> None:
+        """Start the background reader thread if it is not running."""
+        if self._reader and self._reader.is_alive():
+            return
+        self._stop.clear()
+        self._reader = threading.Thread(
+            target=self._read_loop,
+            name=f"busytag-reader-{getattr(self.handle, 'port', '')}",
+            daemon=True,
+        )
+        self._reader.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background reader and fail any outstanding commands.
+
+        :param timeout: Seconds to wait for the reader thread to exit
+        """
+        self._stop.set()
+        if self._reader and self._reader is not threading.current_thread():
+            self._reader.join(timeout)
+        self._reader = None
+        self._fail(ConnectionAbortedError("Busy Tag transport stopped"))
+
+    def _fail(self, error: BaseException) -> None:
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+            self._lines.clear()
+            self._buffer = b""
+
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+    def _read_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                data = self.handle.read(self.handle.in_waiting or 1)
+            except Exception as error:
+                logger.debug(f"Busy Tag reader stopped: {error}")
+                self._fail(error)
+                return
+            if data:
+                self.feed(data)
+
+
+class UploadProgress(NamedTuple):
+    """A snapshot of an Upload's progress."""
+
+    sent: int
+    total: int
+    elapsed: float
+
+    @property
+    def fraction(self) -> float:
+        """Fraction of the data written, 0.0 through 1.0."""
+        return self.sent / self.total if self.total else 1.0
+
+    @property
+    def throughput(self) -> float:
+        """Average bytes per second written so far."""
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class Upload:
+    """Stream a file or buffer to a Busy Tag in the background.
+
+    Files are read one chunk at a time into a reused buffer and
+    bytes-like sources are written as memoryview slices, so the data
+    is never copied or loaded as a whole. The upload runs on its own
+    thread and can be cancelled between chunks.
+    """
+
+    chunk_size: ClassVar[int] = 4096
+
+    def __init__(
+        self,
+        transport: Transport,
+        name: str,
+        source: Source,
+        *,
+        chunk_size: int | None = None,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+    ) -> None:
+        """Prepare to upload source to the device as name.
+
+        :param transport: Transport of the destination device
+        :param name: File name to store the data under on the device
+        :param source: Path of a file, or a bytes-like object, to upload
+        :param chunk_size: Bytes written per chunk
+        :param on_progress: Called with an UploadProgress after each chunk
+        """
+        self.transport = transport
+        self.name = name
+        self.source = source
+        self.chunk_size = chunk_size or self.chunk_size
+        self.on_progress = on_progress
+        self.total = self._size(source)
+        self.future: Future[Response] = Future()
+        self._cancel = threading.Event()
+        self._sent = 0
+        self._started = 0.0
+        self._elapsed = 0.0
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def _size(source: Source) -> int:
+        if isinstance(source, bytes | bytearray | memoryview):
+            return memoryview(source).nbytes
+        return Path(source).stat().st_size
+
+    @property
+    def progress(self) -> UploadProgress:
+        """How much of the data has been written."""
+        elapsed = self._elapsed
+        if self._started and not elapsed:
+            elapsed = time.monotonic() - self._started
+        return UploadProgress(self._sent, self.total, elapsed)
+
+    def start(self) -> Upload:
+        """Start streaming on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"busytag-upload-{self.name}",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """Stop streaming before the next chunk is written.
+
+        The rest of the announced size is written as zero bytes so the
+        device returns to accepting commands, and result() raises
+        CancelledError.
+        """
+        self._cancel.set()
+
+    def cancelled(self) -> bool:
+        """Return True if the upload was cancelled before completion."""
+        if not self.future.done():
+            return False
+        return isinstance(self.future.exception(), CancelledError)
+
+    def done(self) -> bool:
+        """Return True if the device replied or the upload failed."""
+        return self.future.done()
+
+    def result(self, timeout: float | None = None) -> Response:
+        """Wait for the device's reply to the upload.
+
+        :param timeout: Seconds to wait, None waits forever
+        :raises CancelledError: If the upload was cancelled
+        :raises TimeoutError: If the upload does not finish in time
+        """
+        return self.future.result(timeout)
+
+    def chunks(self) -> Iterator[memoryview]:
+        """Yield the source's data as memoryviews of at most chunk_size bytes."""
+        if isinstance(self.source, bytes | bytearray | memoryview):
+            data = memoryview(self.source).cast("B")
+            for offset in range(0, data.nbytes, self.chunk_size):
+                yield data[offset : offset + self.chunk_size]
+            return
+
+        buffer = memoryview(bytearray(self.chunk_size))
+        with Path(self.source).open("rb") as file:
+            while count := file.readinto(buffer):
+                yield buffer[:count]
+
+    def _advance(self, count: int) -> None:
+        self._sent += count
+        if self.on_progress:
+            self.on_progress(self.progress)
+
+    def _run(self) -> None:
+        self._started = time.monotonic()
+        try:
+            reply = self.transport.stream(
+                Command.upload_file(self.name, self.total),
+                self.chunks(),
+                self.total,
+                cancel=self._cancel,
+                on_chunk=self._advance,
+            )
+        except BaseException as error:
+            logger.debug(f"upload of {self.name} stopped: {error!r}")
+            self._elapsed = time.monotonic() - self._started
+            self.future.set_exception(error)
+            return
+
+        self._elapsed = time.monotonic() - self._started
+        reply.add_done_callback(self._relay)
+
+    def _relay(self, reply: Future[Response]) -> None:
+        try:
+            self.future.set_result(reply.result())
+        except BaseException as error:
+            self.future.set_exception(error)
@@ -1,24 +1,46 @@
 """BusyTag Light Support"""
 
-from typing import ClassVar
+from __future__ import annotations
 
-from busylight_core.mixins import ColorableMixin
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import cached_property, partial
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
 
-from ._busytag import Command
+from loguru import logger
+
+from busylight_core.exceptions import LightUnavailableError
+from busylight_core.mixins import ColorableMixin, ReadbackMixin
+
+from ._busytag import Command, Response, Transport, Upload, UploadProgress
 from .luxafor_base import LuxaforBase
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+
+    from ._busytag import Source
+
 
-class BusyTag(ColorableMixin, LuxaforBase):
+class BusyTag(ReadbackMixin, ColorableMixin, LuxaforBase):
     """BusyTag status light controller.
 
     The BusyTag is a wireless status light that uses command strings
     for communication and supports various lighting patterns.
+
+    Commands are pipelined over the serial connection by a Transport
+    which matches the device's line-oriented responses to the commands
+    that produced them, so color changes never wait on a response and
+    queries only wait for their own answer.
     """
 
     supported_device_ids: ClassVar[dict[tuple[int, int], str]] = {
         (0x303A, 0x81DF): "Busy Tag",
     }
 
+    readback_ttl: ClassVar[float] = 5.0
+    """Seconds a volatile query reply is served from the cache."""
+
     @classmethod
     def claims(cls, hardware) -> bool:
         """Return True if the hardware matches the BusyTag criteria."""
@@ -33,6 +55,60 @@ class BusyTag(ColorableMixin, LuxaforBase):
     def command(self, value: str) -> None:
         self._command = value
 
+    @cached_property
+    def transport(self) -> Transport:
+        """The pipelined AT command transport for this device."""
+        return Transport(self.hardware.handle)
+
+    @property
+    def write_strategy(self) -> Callable[[bytes], None]:
+        """Write commands through the transport without awaiting responses."""
+        return self.transport.send
+
+    def submit(self, command: str) -> Future[Response]:
+        """Send an AT command and return a Future for the device's response.
+
+        The device must stay open until the response arrives, so this
+        is only useful on lights acquired in exclusive mode. Releasing
+        the device fails any outstanding Futures. Unless the command only
+        reads from the device it may change what the device shows, so
+        the next update is always written.
+
+        :param command: AT command string, e.g. Command.GetDeviceName
+        :return: Future resolved with the Response
+        """
+        self._forget_written(command)
+        return self.transport.submit(command)
+
+    def query(self, command: str, timeout: float | None = 1.0) -> Response:
+        """Send an AT command and wait for the device's response.
+
+        Commands submitted earlier are not waited on separately; their
+        responses are matched to them as they arrive. As with submit(),
+        the next update is always written unless the command only reads
+        from the device.
+
+        :param command: AT command string, e.g. Command.GetDeviceName
+        :param timeout: Seconds to wait for the response, None waits forever
+        :return: The device's Response
+        :raises TimeoutError: If the device does not respond in time
+        """
+        self._forget_written(command)
+        with self.exclusive_access():
+            return self.transport.request(command, timeout)
+
+    def _forget_written(self, command: str) -> None:
+        """Make the next update write, if command may change the display."""
+        if not Command.is_query(command):
+            with self._lock:
+                self._written = None
+
+    def release(self) -> None:
+        """Stop the transport reader and release the device."""
+        if "transport" in self.__dict__:
+            self.transport.stop(timeout=0)
+        super().release()
+
     def __bytes__(self) -> bytes:
         return self.command.encode()
 
@@ -45,3 +121,167 @@ class BusyTag(ColorableMixin, LuxaforBase):
         with self.batch_update():
             self.color = color
             self.command = Command.solid_color(color, led)
+
+    def get_device_name(self) -> str:
+        """Return the device's name, e.g. busytag-3EC5C8.
+
+        The name is read from the device once and cached for the
+        lifetime of this light.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        command = Command.GetDeviceName
+        return self._fact(command, partial(self._ask, command))
+
+    def get_manufacturer_name(self) -> str:
+        """Return the device manufacturer's name.
+
+        The name is read from the device once and cached for the
+        lifetime of this light.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        command = Command.GetManufacturerName
+        return self._fact(command, partial(self._ask, command))
+
+    def get_device_id(self) -> str:
+        """Return the device's unique identifier.
+
+        The identifier is read from the device once and cached for
+        the lifetime of this light.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        command = Command.GetDeviceID
+        return self._fact(command, partial(self._ask, command))
+
+    def get_total_storage_size(self) -> int:
+        """Return the size of the device's file storage in bytes.
+
+        The size is read from the device once and cached for the
+        lifetime of this light.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        command = Command.GetTotalStorageSize
+        return self._fact(command, partial(self._ask_integer, command))
+
+    def get_free_storage_size(self, max_age: float | None = None) -> int:
+        """Return the free space in the device's file storage in bytes.
+
+        Replies are cached for max_age seconds, defaulting to the
+        class readback_ttl.
+
+        :param max_age: Oldest cached reply in seconds that may be returned
+        :raises LightUnavailableError: If device communication fails
+        """
+        command = Command.GetFreeStorageSize
+        return self._reading(command, partial(self._ask_integer, command), max_age)
+
+    def get_local_host_address(self, max_age: float | None = None) -> str:
+        """Return the address of the device's local web server.
+
+        Replies are cached for max_age seconds, defaulting to the
+        class readback_ttl.
+
+        :param max_age: Oldest cached reply in seconds that may be returned
+        :raises LightUnavailableError: If device communication fails
+        """
+        command = Command.GetLocalHostAddress
+        return self._reading(command, partial(self._ask, command), max_age)
+
+    def get_last_error_code(self) -> int:
+        """Return the code of the last error the device reported.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        command = Command.GetLastErrorCode
+        return self._ask_integer(command)
+
+    def get_file_list(self) -> list[str]:
+        """Return the names of the files stored on the device.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        return self._listing(Command.GetFileList)
+
+    def get_picture_list(self) -> list[str]:
+        """Return the names of the pictures stored on the device.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        return self._listing(Command.GetPictureList)
+
+    def upload(
+        self,
+        source: Source,
+        name: str | None = None,
+        *,
+        chunk_size: int | None = None,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+    ) -> Upload:
+        """Start streaming a file or buffer to the device's storage.
+
+        The upload runs in the background and returns immediately.
+        Commands sent while it is in progress, including color
+        changes, are written once the last chunk has been sent.
+        Files are read a chunk at a time and bytes-like sources are
+        sent as memoryview slices, so neither is copied whole.
+
+        The device must stay open until the upload completes, so this
+        is only useful on lights acquired in exclusive mode.
+
+        :param source: Path of a file, or a bytes-like object, to upload
+        :param name: File name on the device, defaults to the source file's name
+        :param chunk_size: Bytes written per chunk, defaults to Upload.chunk_size
+        :param on_progress: Called with an UploadProgress after each chunk
+        :return: The running Upload, which may be waited on or cancelled
+        :raises ValueError: If name is omitted for a bytes-like source
+        """
+        if name is None:
+            if isinstance(source, bytes | bytearray | memoryview):
+                msg = "name is required when uploading a bytes-like object"
+                raise ValueError(msg)
+            name = Path(source).name
+
+        upload = Upload(
+            self.transport,
+            name,
+            source,
+            chunk_size=chunk_size,
+            on_progress=on_progress,
+        )
+        upload.future.add_done_callback(lambda _: self.invalidate_readings())
+        return upload.start()
+
+    def _ask(self, command: Command) -> str:
+        """Query the device and return the value of its reply."""
+        return self._respond(command).value
+
+    def _respond(self, command: Command) -> Response:
+        """Query the device and return its reply, which must be OK."""
+        try:
+            response = self.query(command)
+        except (FutureTimeoutError, OSError) as error:
+            logger.error(f"{self}: {command.value}: {error!r}")
+            raise LightUnavailableError(self) from None
+
+        if not response.ok:
+            logger.error(f"{self}: {command.value} rejected")
+            raise LightUnavailableError(self)
+
+        return response
+
+    def _listing(self, command: Command) -> list[str]:
+        """Return the value of every line of the reply to command."""
+        response = self._respond(command)
+        return [Response(command, (line,)).value for line in response.lines]
+
+    def _ask_integer(self, command: Command) -> int:
+        """Query the device and return the value of its reply as an integer."""
+        value = self._ask(command)
+        try:
+            return int(value)
+        except ValueError:
+            logger.error(f"{self}: {command.value} returned {value!r}")
+            raise LightUnavailableError(self) from None
@@ -1,9 +1,13 @@
 """Luxafor Flag"""
 
+from __future__ import annotations
+
 from functools import cached_property
 from typing import ClassVar
 
-from .implementation import LEDS, State
+from busylight_core.exceptions import LightUnavailableError
+
+from .implementation import LEDS, Command, FrameBuffer, Pattern, State, Wave
 from .luxafor_base import LuxaforBase
 
 
@@ -19,6 +23,9 @@ class Flag(LuxaforBase):
         (0x4D8, 0xF372): "Flag",
     }
 
+    elide_writes: ClassVar[bool] = False
+    """Reports are commands, LED changes are diffed by the framebuffer instead."""
+
     @cached_property
     def state(self) -> State:
         """Device state manager for controlling Flag LED array.
@@ -31,6 +38,15 @@ class Flag(LuxaforBase):
         """
         return State()
 
+    @cached_property
+    def framebuffer(self) -> FrameBuffer:
+        """Per-LED colors requested by on() and last written to the device.
+
+        Updates only send the Color commands needed to bring the
+        device's LEDs in line with the framebuffer.
+        """
+        return FrameBuffer()
+
     def __bytes__(self) -> bytes:
         return bytes(self.state)
 
@@ -39,12 +55,115 @@ class Flag(LuxaforBase):
 
         :param color: RGB color tuple (red, green, blue)
         """
+        leds = self._leds(led)
+        with self.batch_update():
+            self.state.command = Command.Color
+            self.state.color = color
+            self.state.leds = leds
+            self.framebuffer.set(leds, color)
+
+    def get_led(self, led: int) -> tuple[int, int, int]:
+        """Return the color most recently requested for LED 1 through 6.
+
+        :param led: LED number (1-6)
+        """
+        return self.framebuffer[led]
+
+    def update(self, *, force: bool = False) -> None:
+        """Send the framebuffer, or the current effect, to the device.
+
+        Color changes are reduced to the fewest commands: LEDS.All if
+        every LED matches, a side command if a side matches, otherwise
+        one command per changed LED. Nothing is written if no LED
+        changed, unless force is True. Device-side effects are always
+        written, so repeating an effect restarts it, and make the
+        device's LED colors unknown.
+
+        :param force: Write every LED even if it already shows its color
+        :raises LightUnavailableError: If device communication fails
+        """
+        if self._writer is not None:
+            self._writer.raise_error()
+
+        with self._lock:
+            if force:
+                self.framebuffer.invalidate()
+
+            if self.state.command != Command.Color:
+                self._queue(bytes(self))
+                self.framebuffer.invalidate()
+            else:
+                for leds, color in self.framebuffer.commands():
+                    self.state.leds = leds
+                    self.state.color = color
+                    self._queue(bytes(self))
+                    self.framebuffer.commit(leds, color)
+
+        try:
+            self._drain()
+        except LightUnavailableError:
+            with self._lock:
+                self.framebuffer.invalidate()
+            raise
+
+    def _reset_writes(self) -> None:
+        """Forget the colors last written, the device may have changed them."""
+        super()._reset_writes()
+        self.framebuffer.invalidate()
+
+    def strobe(
+        self,
+        color: tuple[int, int, int],
+        speed: int = 20,
+        repeat: int = 0,
+        led: int = 0,
+    ) -> None:
+        """Strobe the specified color, timed by the device.
+
+        The whole effect is a single write, the device flashes the LEDs
+        on its own until the repeat count is exhausted.
+
+        :param color: RGB color tuple (red, green, blue)
+        :param speed: Strobe speed, lower values are faster (0-255)
+        :param repeat: Number of flashes, 0 repeats indefinitely (0-255)
+        :param led: LED index (default is 0, for all LEDs)
+        """
         with self.batch_update():
-            self.color = color
-            try:
-                self.state.leds = LEDS(led)
-            except ValueError:
-                self.state.leds = LEDS.All
+            self.state.strobe(color, speed, repeat, self._leds(led))
+
+    def wave(
+        self,
+        color: tuple[int, int, int],
+        wave: Wave = Wave.Short,
+        speed: int = 20,
+        repeat: int = 0,
+    ) -> None:
+        """Play a wave of the specified color across the LEDs.
+
+        :param color: RGB color tuple (red, green, blue)
+        :param wave: Wave shape to play
+        :param speed: Wave speed, lower values are faster (0-255)
+        :param repeat: Number of waves, 0 repeats indefinitely (0-255)
+        """
+        with self.batch_update():
+            self.state.wave_effect(color, Wave(wave), speed, repeat)
+
+    def pattern(self, pattern: Pattern, repeat: int = 0) -> None:
+        """Play one of the device's built-in patterns.
+
+        :param pattern: Built-in pattern to play, e.g. Pattern.Rainbow
+        :param repeat: Number of repetitions, 0 repeats indefinitely (0-255)
+        """
+        with self.batch_update():
+            self.state.play_pattern(Pattern(pattern), repeat)
+
+    @staticmethod
+    def _leds(led: int) -> LEDS:
+        """Return the LEDS target for led, falling back to all LEDs."""
+        try:
+            return LEDS(led)
+        except ValueError:
+            return LEDS.All
 
     @property
     def color(self) -> tuple[int, int, int]:
@@ -53,4 +172,6 @@ class Flag(LuxaforBase):
 
     @color.setter
     def color(self, value: tuple[int, int, int]) -> None:
+        self.state.command = Command.Color
         self.state.color = value
+        self.framebuffer.set(LEDS.All, value)
@@ -1,11 +1,13 @@
 """Luxafor Flag implementation details."""
 
 from .enums import LEDS, Command, Pattern, Wave
+from .framebuffer import FrameBuffer
 from .state import State
 
 __all__ = [
     "LEDS",
     "Command",
+    "FrameBuffer",
     "Pattern",
     "State",
     "Wave",
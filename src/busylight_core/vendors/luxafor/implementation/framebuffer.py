@@ -0,0 +1,96 @@
+"""Luxafor Flag LED framebuffer.
+
+This module defines the FrameBuffer class which tracks the color of
+each of the Flag's six LEDs, both as requested by the host and as
+last written to the device, and reduces the difference between the
+two to the fewest Color commands.
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from .enums import LEDS
+
+Color = tuple[int, int, int]
+
+
+class FrameBuffer:
+    """Requested and device-side colors for the six Luxafor Flag LEDs.
+
+    LEDs are numbered 1 through 6 to match LEDS.LED1 - LEDS.LED6.
+    LEDS 1-3 are addressed as a group by LEDS.Back and LEDs 4-6 by
+    LEDS.Front. The device-side colors start unknown so the first
+    update writes every LED.
+    """
+
+    nleds: ClassVar[int] = 6
+
+    sides: ClassVar[dict[LEDS, tuple[int, ...]]] = {
+        LEDS.Back: (1, 2, 3),
+        LEDS.Front: (4, 5, 6),
+    }
+
+    def __init__(self) -> None:
+        self.colors: list[Color] = [(0, 0, 0)] * self.nleds
+        self.shadow: list[Color | None] = [None] * self.nleds
+
+    @classmethod
+    def addressed(cls, leds: LEDS) -> tuple[int, ...]:
+        """Return the LED numbers addressed by leds."""
+        if leds == LEDS.All:
+            return tuple(range(1, cls.nleds + 1))
+        try:
+            return cls.sides[leds]
+        except KeyError:
+            return (int(leds),)
+
+    def __getitem__(self, led: int) -> Color:
+        return self.colors[led - 1]
+
+    def __setitem__(self, led: int, color: Color) -> None:
+        self.colors[led - 1] = tuple(color)
+
+    def set(self, leds: LEDS, color: Color) -> None:
+        """Request color for every LED addressed by leds."""
+        for led in self.addressed(leds):
+            self[led] = color
+
+    def commit(self, leds: LEDS, color: Color) -> None:
+        """Record that color was written to every LED addressed by leds."""
+        for led in self.addressed(leds):
+            self.shadow[led - 1] = tuple(color)
+
+    def invalidate(self) -> None:
+        """Forget the device-side colors, e.g. after a device-side effect."""
+        self.shadow = [None] * self.nleds
+
+    def commands(self) -> list[tuple[LEDS, Color]]:
+        """Return the fewest Color commands that bring the device up to date.
+
+        A single LEDS.All command is used when every LED is the same
+        color. Otherwise each side with changed LEDs gets a single
+        side command if all of its LEDs match, or one command for
+        each changed LED. LEDs already showing their color are skipped.
+        """
+        changed = {
+            led for led in range(1, self.nleds + 1) if self.shadow[led - 1] != self[led]
+        }
+
+        if not changed:
+            return []
+
+        if len(set(self.colors)) == 1:
+            return [(LEDS.All, self[1])]
+
+        commands = []
+        for side, leds in self.sides.items():
+            side_changed = [led for led in leds if led in changed]
+            if not side_changed:
+                continue
+            if len({self[led] for led in leds}) == 1:
+                commands.append((side, self[leds[0]]))
+            else:
+                commands.extend((LEDS(led), self[led]) for led in side_changed)
+
+        return commands
@@ -23,11 +23,63 @@ class State:
         self.command = Command.Color
         self.leds = LEDS.All
         self.fade = 0
+        self.speed = 0
         self.repeat = 0
         self.pattern = Pattern.Off
         self.wave = Wave.Off
         self.color = (0, 0, 0)
 
+    def strobe(
+        self,
+        color: tuple[int, int, int],
+        speed: int,
+        repeat: int,
+        leds: LEDS = LEDS.All,
+    ) -> None:
+        """Configure a device-side strobe of color.
+
+        :param color: RGB color tuple (red, green, blue) with values 0-255
+        :param speed: Strobe speed, lower values are faster (0-255)
+        :param repeat: Number of flashes, 0 repeats indefinitely (0-255)
+        :param leds: Which LEDs to strobe
+        """
+        self.command = Command.Strobe
+        self.leds = leds
+        self.color = color
+        self.speed = speed
+        self.repeat = repeat
+
+    def wave_effect(
+        self,
+        color: tuple[int, int, int],
+        wave: Wave,
+        speed: int,
+        repeat: int,
+    ) -> None:
+        """Configure a device-side wave of color across all LEDs.
+
+        :param color: RGB color tuple (red, green, blue) with values 0-255
+        :param wave: Wave shape to play
+        :param speed: Wave speed, lower values are faster (0-255)
+        :param repeat: Number of waves, 0 repeats indefinitely (0-255)
+        """
+        self.command = Command.Wave
+        self.leds = LEDS.All
+        self.color = color
+        self.wave = wave
+        self.speed = speed
+        self.repeat = repeat
+
+    def play_pattern(self, pattern: Pattern, repeat: int) -> None:
+        """Configure playback of a built-in pattern.
+
+        :param pattern: Built-in pattern to play
+        :param repeat: Number of repetitions, 0 repeats indefinitely (0-255)
+        """
+        self.command = Command.Pattern
+        self.pattern = pattern
+        self.repeat = repeat
+
     def __bytes__(self) -> bytes:
         """Convert state to bytes for device communication.
 
@@ -45,6 +97,16 @@ class State:
                 return bytes(
                     [self.command, self.leds, *self.color, self.fade, self.repeat]
                 )
+            case Command.Strobe:
+                return bytes(
+                    [self.command, self.leds, *self.color, self.speed, 0, self.repeat]
+                )
+            case Command.Wave:
+                return bytes(
+                    [self.command, self.wave, *self.color, 0, self.repeat, self.speed]
+                )
+            case Command.Pattern:
+                return bytes([self.command, self.pattern, self.repeat])
             case _:
                 pass
 
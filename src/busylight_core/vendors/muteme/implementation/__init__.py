@@ -1,15 +1,20 @@
 """MuteMe implementation details."""
 
+from .button import ButtonDecoder, ButtonEvent, Gesture, TouchCode
 from .fields import BlinkBit, BlueBit, DimBit, GreenBit, OneBitField, RedBit, SleepBit
 from .state import State
 
 __all__ = [
     "BlinkBit",
     "BlueBit",
+    "ButtonDecoder",
+    "ButtonEvent",
     "DimBit",
+    "Gesture",
     "GreenBit",
     "OneBitField",
     "RedBit",
     "SleepBit",
     "State",
+    "TouchCode",
 ]
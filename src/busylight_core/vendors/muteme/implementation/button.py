@@ -0,0 +1,117 @@
+"""MuteMe touch button input decoding.
+
+This module defines the ButtonDecoder class which turns the touch
+codes carried by MuteMe HID input reports into debounced touch,
+release, tap and long-press events.
+"""
+
+from __future__ import annotations
+
+from enum import IntEnum, StrEnum
+from typing import NamedTuple
+
+
+class TouchCode(IntEnum):
+    """Touch state codes found in the fourth byte of an input report."""
+
+    Idle = 0x00
+    Touching = 0x01
+    Released = 0x02
+    Touched = 0x04
+
+
+class Gesture(StrEnum):
+    """Kinds of events produced by the ButtonDecoder."""
+
+    TOUCH = "touch"
+    RELEASE = "release"
+    TAP = "tap"
+    LONG_PRESS = "long_press"
+
+
+class ButtonEvent(NamedTuple):
+    """A button gesture and when it was recognized.
+
+    The duration is how long the button had been held, zero for
+    TOUCH events.
+    """
+
+    gesture: Gesture
+    timestamp: float
+    duration: float = 0.0
+
+
+class ButtonDecoder:
+    """Debounce MuteMe touch reports into button events.
+
+    A change in the touch state is only accepted once it has been
+    reported continuously for debounce seconds, so contact chatter
+    produces no events. Each accepted touch produces a TOUCH event
+    and each accepted release a RELEASE event, followed by a TAP if
+    the button was held for less than long_press seconds. Holding the
+    button for long_press seconds produces a single LONG_PRESS event
+    while it is still held.
+    """
+
+    def __init__(self, debounce: float = 0.03, long_press: float = 0.8) -> None:
+        """Create a decoder with the given timings in seconds.
+
+        :param debounce: Seconds a touch state change must persist
+        :param long_press: Seconds the button is held for a long press
+        """
+        self.debounce = debounce
+        self.long_press = long_press
+        self.pressed = False
+        self._raw = False
+        self._changed_at = 0.0
+        self._pressed_at = 0.0
+        self._long_pressed = False
+
+    @staticmethod
+    def touching(report: bytes | list[int]) -> bool | None:
+        """Return the touch state carried by an input report.
+
+        :param report: Input report read from the device
+        :return: True if touched, False if not, None for an empty report
+        """
+        if len(report) < 4:
+            return None
+        return report[3] in (TouchCode.Touched, TouchCode.Touching)
+
+    def feed(self, touching: bool | None, now: float) -> list[ButtonEvent]:
+        """Advance the decoder and return any events recognized.
+
+        Call with None when a read timed out without a report, so
+        pending state changes and long presses are still recognized.
+
+        :param touching: Touch state reported by the device, if any
+        :param now: Monotonic time in seconds
+        """
+        events = []
+
+        if touching is not None and touching != self._raw:
+            self._raw = touching
+            self._changed_at = now
+
+        if self._raw != self.pressed and now - self._changed_at >= self.debounce:
+            self.pressed = self._raw
+            if self.pressed:
+                self._pressed_at = now
+                self._long_pressed = False
+                events.append(ButtonEvent(Gesture.TOUCH, now))
+            else:
+                held = now - self._pressed_at
+                events.append(ButtonEvent(Gesture.RELEASE, now, held))
+                if not self._long_pressed:
+                    events.append(ButtonEvent(Gesture.TAP, now, held))
+
+        if (
+            self.pressed
+            and not self._long_pressed
+            and now - self._pressed_at >= self.long_press
+        ):
+            self._long_pressed = True
+            held = now - self._pressed_at
+            events.append(ButtonEvent(Gesture.LONG_PRESS, now, held))
+
+        return events
@@ -1,21 +1,41 @@
 """MuteMe family base class."""
 
+from __future__ import annotations
+
+import asyncio
 import struct
-from functools import cached_property
+import time
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, ClassVar
+
+from loguru import logger
 
+from busylight_core.exceptions import LightUnavailableError
 from busylight_core.light import Light
+from busylight_core.mixins import WordSnapshotMixin
+
+from .implementation import ButtonDecoder, ButtonEvent, State
 
-from .implementation import State
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
 
 
-class MuteMeBase(Light):
+class MuteMeBase(WordSnapshotMixin, Light):
     """Base class for MuteMe family devices.
 
     Provides common functionality for all MuteMe devices including
     button support, device detection, and simple RGB control.
     Use this as a base class when implementing new MuteMe variants.
+
+    Button input is read from the device's HID input reports with a
+    short timeout, so waiting for a touch sleeps in the HID driver
+    rather than spinning, and is decoded into debounced touch,
+    release, tap and long-press events.
     """
 
+    read_timeout_ms: ClassVar[int] = 50
+    """Milliseconds to wait for an input report before checking timers."""
+
     @staticmethod
     def vendor() -> str:
         """Return the vendor name for MuteMe devices.
@@ -28,7 +48,7 @@ class MuteMeBase(Light):
         return "MuteMe"
 
     @cached_property
-    def state(self) -> "State":
+    def state(self) -> State:
         """Device state manager for controlling light behavior.
 
         Returns a State instance that manages RGB color values and
@@ -39,6 +59,11 @@ class MuteMeBase(Light):
         """
         return State()
 
+    @cached_property
+    def button(self) -> ButtonDecoder:
+        """Decoder turning input reports into button events."""
+        return ButtonDecoder()
+
     @cached_property
     def struct(self) -> struct.Struct:
         """The binary struct formatter for device communication."""
@@ -77,8 +102,67 @@ class MuteMeBase(Light):
 
     @property
     def button_on(self) -> bool:
-        """True if the mute button is currently pressed."""
-        raise NotImplementedError
+        """True if the mute button is currently pressed.
+
+        Reads any pending input report without waiting. Events
+        recognized by this read are not reported elsewhere, use
+        button_events or watch_button to receive every event.
+        """
+        self.read_button(timeout_ms=0)
+        return self.button.pressed
+
+    def read_button(self, timeout_ms: int | None = None) -> list[ButtonEvent]:
+        """Wait up to timeout_ms for an input report and return button events.
+
+        A read that times out still returns events that became due,
+        such as a long press on a button that is being held.
+
+        :param timeout_ms: Milliseconds to wait, defaults to read_timeout_ms
+        :raises LightUnavailableError: If device communication fails
+        """
+        timeout_ms = self.read_timeout_ms if timeout_ms is None else timeout_ms
+
+        with self.exclusive_access():
+            try:
+                report = self.hardware.handle.read(8, timeout_ms)
+            except Exception as error:
+                logger.error(f"{self}: {error}")
+                raise LightUnavailableError(self) from None
+
+        touching = self.button.touching(report) if report else None
+        return self.button.feed(touching, time.monotonic())
+
+    async def button_events(self) -> AsyncIterator[ButtonEvent]:
+        """Yield button events as they are recognized.
+
+        Reports are read on the event loop's default executor, so
+        waiting for input does not block other tasks.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            for event in await loop.run_in_executor(None, self.read_button):
+                yield event
+
+    def watch_button(
+        self,
+        callback: Callable[[ButtonEvent], None],
+        name: str = "button",
+    ) -> asyncio.Task:
+        """Call callback with every button event from a background task.
+
+        Replaces any task already watching the button under name.
+
+        :param callback: Called with each ButtonEvent
+        :param name: Name of the watching task
+        :return: The watching task
+        """
+        return self.add_task(
+            name,
+            partial(_watch_button, callback=callback),
+            replace=True,
+        )
 
     def on(self, color: tuple[int, int, int], led: int = 0) -> None:
         """Turn on the device with the specified color.
@@ -86,5 +170,15 @@ class MuteMeBase(Light):
         :param color: RGB color tuple (red, green, blue) with values 0-255
         :param led: LED index (unused for MuteMe devices)
         """
-        with self.batch_update():
-            self.color = color
+        with self.cached_change(tuple(color)) as hit:
+            if not hit:
+                self.color = color
+
+
+async def _watch_button(
+    light: MuteMeBase,
+    callback: Callable[[ButtonEvent], None],
+) -> None:
+    """Pass each of light's button events to callback."""
+    async for event in light.button_events():
+        callback(event)
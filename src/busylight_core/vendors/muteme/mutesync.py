@@ -1,24 +1,41 @@
 """MuteSync status light and button implementation."""
 
-from typing import ClassVar
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING, ClassVar, NoReturn
 
-from busylight_core.hardware import Hardware
 from busylight_core.mixins import ColorableMixin
 
 from .muteme_base import MuteMeBase
 
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import AsyncIterator, Callable
+
+    from busylight_core.hardware import Hardware
+
+    from .implementation import ButtonEvent
+
 
 class MuteSync(ColorableMixin, MuteMeBase):
     """MuteSync status light and button controller.
 
     The MuteSync is a USB-connected device that combines button
     functionality with status light capabilities for meeting control.
+
+    The light ring has four segments which can be set independently.
+    Segment colors are kept in a preallocated frame that is written
+    as is, and updates that would not change the frame are skipped.
     """
 
     supported_device_ids: ClassVar[dict[tuple[int, int], str]] = {
         (0x10C4, 0xEA60): "MuteSync Button",
     }
 
+    nleds: ClassVar[int] = 4
+    """Number of independently colored segments in the light ring."""
+
     @classmethod
     def claims(cls, hardware: Hardware) -> bool:
         """Return True if the hardware describes a MuteSync device."""
@@ -40,9 +57,63 @@ class MuteSync(ColorableMixin, MuteMeBase):
 
         return claim and (product or manufacturer)
 
+    @cached_property
+    def frame(self) -> bytearray:
+        """The report written to the device, a header and four RGB segments."""
+        return bytearray([65] + [0] * 3 * self.nleds)
+
     def __bytes__(self) -> bytes:
-        buf = [65] + [*self.color] * 4
-        return bytes(buf)
+        return bytes(self.frame)
+
+    def snapshot(self) -> None:
+        """Return None, the frame is the payload and there is nothing to cache."""
+        return
+
+    @property
+    def color(self) -> tuple[int, int, int]:
+        """The color of the first lit segment, or black if none are lit."""
+        for led in range(1, self.nleds + 1):
+            color = self.get_led(led)
+            if any(color):
+                return color
+        return (0, 0, 0)
+
+    @color.setter
+    def color(self, value: tuple[int, int, int]) -> None:
+        ColorableMixin.color.fset(self, value)
+        for led in range(1, self.nleds + 1):
+            self.set_led(led, value)
+
+    def get_led(self, led: int) -> tuple[int, int, int]:
+        """Return the color of a segment.
+
+        :param led: Segment number (1-4)
+        """
+        offset = 3 * led - 2
+        return tuple(self.frame[offset : offset + 3])
+
+    def set_led(self, led: int, color: tuple[int, int, int]) -> None:
+        """Set the color of a segment without updating the device.
+
+        :param led: Segment number (1-4)
+        :param color: RGB color tuple (red, green, blue) with values 0-255
+        :raises IndexError: If led is not a segment number
+        """
+        if not 1 <= led <= self.nleds:
+            msg = f"led must be 1-{self.nleds}: {led}"
+            raise IndexError(msg)
+        offset = 3 * led - 2
+        self.frame[offset : offset + 3] = bytes(color)
+
+    def set_leds(self, *colors: tuple[int, int, int]) -> None:
+        """Set the segments to colors, in order, with a single write.
+
+        :param colors: Up to four RGB color tuples starting with segment 1
+        :raises IndexError: If more than four colors are given
+        """
+        with self.batch_update():
+            for led, color in enumerate(colors, start=1):
+                self.set_led(led, color)
 
     @property
     def is_button(self) -> bool:
@@ -54,11 +125,44 @@ class MuteSync(ColorableMixin, MuteMeBase):
         """True if the mute button is currently pressed."""
         return False
 
+    def read_button(self, timeout_ms: int | None = None) -> NoReturn:
+        """Not supported, the MuteSync does not report button input.
+
+        :raises NotImplementedError: Always
+        """
+        self._no_button_input()
+
+    def button_events(self) -> AsyncIterator[ButtonEvent]:
+        """Not supported, the MuteSync does not report button input.
+
+        :raises NotImplementedError: Always
+        """
+        self._no_button_input()
+
+    def watch_button(
+        self,
+        callback: Callable[[ButtonEvent], None],
+        name: str = "button",
+    ) -> asyncio.Task:
+        """Not supported, the MuteSync does not report button input.
+
+        :raises NotImplementedError: Always
+        """
+        self._no_button_input()
+
+    def _no_button_input(self) -> NoReturn:
+        """Raise NotImplementedError for the MuteMe button input methods."""
+        msg = f"{self.name} is a serial device, button input is not supported"
+        raise NotImplementedError(msg)
+
     def on(self, color: tuple[int, int, int], led: int = 0) -> None:
         """Turn on the MuteSync with the specified color.
 
         :param color: RGB color tuple (red, green, blue) with values 0-255
-        :param led: LED index (unused for MuteSync)
+        :param led: Segment number (1-4), any other value sets every segment
         """
         with self.batch_update():
-            self.color = color
+            if 1 <= led <= self.nleds:
+                self.set_led(led, color)
+            else:
+                self.color = color
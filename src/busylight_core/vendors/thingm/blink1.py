@@ -1,14 +1,37 @@
 """ThingM blink(1) Support"""
 
-from collections.abc import Callable
-from functools import cached_property
-from typing import ClassVar
+from __future__ import annotations
 
-from .implementation import LEDS, Action, Report, State
+import asyncio
+import contextlib
+import math
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, ClassVar
+
+from loguru import logger
+
+from busylight_core.exceptions import LightUnavailableError
+from busylight_core.mixins import ReadbackMixin
+
+from .implementation import (
+    LEDS,
+    Action,
+    PatternLine,
+    PatternMemory,
+    PlayState,
+    Report,
+    State,
+)
 from .thingm_base import ThingMBase
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+FadeStop = tuple[tuple[int, int, int], int]
+LEDTarget = tuple[tuple[int, int, int], int]
+
 
-class Blink1(ThingMBase):
+class Blink1(ReadbackMixin, ThingMBase):
     """ThingM Blink(1) USB RGB LED with feature report control.
 
     The Blink(1) uses HID feature reports for communication and supports
@@ -21,21 +44,74 @@ class Blink1(ThingMBase):
         (0x27B8, 0x01ED): "Blink(1)",
     }
 
+    max_fade_ms: ClassVar[int] = 0xFFFF * State.tick_ms
+    """Longest fade in milliseconds, the device counts fades in 10 ms ticks."""
+
+    max_timeout_ms: ClassVar[int] = 0xFFFF * State.tick_ms
+    """Longest server tickle timeout in milliseconds, counted in 10 ms ticks."""
+
+    elide_writes: ClassVar[bool] = False
+    """Reports are commands and queries, LED changes are coalesced instead."""
+
+    query_actions: ClassVar[frozenset[Action]] = frozenset(
+        {
+            Action.ReadColor,
+            Action.ReadColorPattern,
+            Action.GetVersion,
+            Action.GetChipID,
+            Action.PlayStateRead,
+        }
+    )
+
+    _quiet_actions: ClassVar[frozenset[int]] = query_actions | {Action.ServerTickle}
+    """Actions which leave cached read back values valid."""
+
     @cached_property
     def state(self) -> State:
-        """Device state manager for Blink(1) control.
+        """The FadeColor command for the color most recently requested.
 
-        Returns a State instance that manages color, timing, and effect
-        settings for the Blink(1). Use this to configure device behavior
-        before calling update() to apply changes.
+        Only LED colors are kept here, pattern, watchdog and query
+        reports are built in State instances of their own so they never
+        change the light's color or get written again by update().
 
-        :return: State instance for managing device properties
+        :return: State instance holding the light's color
         """
         return State()
 
+    @cached_property
+    def patterns(self) -> PatternMemory:
+        """Host-side mirror of the device's pattern memory.
+
+        Lines are recorded as they are written to or read from the
+        device. Lines which have not been written or read are unknown.
+        """
+        return PatternMemory(tick_ms=State.tick_ms)
+
+    _watchdog: Callable[[], State] | None = None
+
+    @cached_property
+    def _shadow(self) -> dict[LEDS, LEDTarget]:
+        """The (color, fade_ms) last written to each LED."""
+        return {}
+
+    @cached_property
+    def _targets(self) -> dict[LEDS, LEDTarget]:
+        """The (color, fade_ms) requested for each LED but not yet written."""
+        return {}
+
     def __bytes__(self) -> bytes:
         return bytes(self.state)
 
+    @staticmethod
+    def _command(build: Callable[..., None], *args: object, **kwargs: object) -> State:
+        """Return a new State prepared by the State method build.
+
+        :param build: State method laying out a report, e.g. State.get_version
+        """
+        report = State()
+        build(report, *args, **kwargs)
+        return report
+
     def on(self, color: tuple[int, int, int], led: int = 0) -> None:
         """Turn on the Blink(1) with the specified color.
 
@@ -43,12 +119,104 @@ class Blink1(ThingMBase):
         :param led: LED index (0 for the first LED, 1 for the second, etc.)
         """
         with self.batch_update():
-            self.state.clear()
-            self.state.report = Report.One
-            self.state.action = Action.FadeColor
-            self.state.color = color
-            self.state.fade = 10  # Default fade time in milliseconds
-            self.state.leds = LEDS(led)
+            self._set_target(color, 10, LEDS(led))  # Default fade in milliseconds
+
+    def fade_to(
+        self,
+        color: tuple[int, int, int],
+        duration_ms: int,
+        leds: LEDS = LEDS.All,
+    ) -> None:
+        """Fade to the specified color using the device's hardware fader.
+
+        The whole transition costs a single FadeColor report, the
+        Blink(1) interpolates between the current and target colors
+        on its own.
+
+        :param color: RGB color tuple (red, green, blue) with values 0-255
+        :param duration_ms: Fade duration in milliseconds, rounded down to 10 ms
+        :param leds: Which LEDs to fade (All, Top, or Bottom)
+        :raises ValueError: If duration_ms is outside the range of the fade field
+        """
+        if duration_ms not in range(self.max_fade_ms + 1):
+            msg = f"duration_ms must be between 0 and {self.max_fade_ms}"
+            raise ValueError(msg)
+
+        with self.batch_update():
+            self._set_target(color, duration_ms, LEDS(leds))
+
+    def fade_through(
+        self,
+        stops: Sequence[FadeStop],
+        leds: LEDS = LEDS.All,
+        name: str = "fade",
+    ) -> asyncio.Task:
+        """Start a task fading through a sequence of colors.
+
+        Each stop is a (color, duration_ms) pair describing a linear
+        fade from the previous color. Every stop is offloaded to the
+        device as a single FadeColor report and the task sleeps while
+        the hardware performs the fade. Stops longer than max_fade_ms
+        are split into several linear segments. Any running task with
+        the same name is replaced.
+
+        :param stops: Sequence of (color, duration_ms) fade stops
+        :param leds: Which LEDs to fade (All, Top, or Bottom)
+        :param name: Task name used to manage the fade
+        :return: The asyncio.Task driving the fade
+        """
+        segments = self.fade_segments(self.color, stops, self.max_fade_ms)
+        return self.add_task(
+            name,
+            partial(_fade_through, segments=segments, leds=LEDS(leds)),
+            replace=True,
+        )
+
+    @staticmethod
+    def fade_segments(
+        start: tuple[int, int, int],
+        stops: Sequence[FadeStop],
+        max_fade_ms: int,
+    ) -> list[FadeStop]:
+        """Split fade stops into segments no longer than max_fade_ms.
+
+        Long stops are divided into equal linear segments with colors
+        interpolated from the previous stop, so the resulting sequence
+        describes the same gradient.
+
+        :param start: RGB color the first stop fades from
+        :param stops: Sequence of (color, duration_ms) fade stops
+        :param max_fade_ms: Longest duration a single segment may have
+        :return: List of (color, duration_ms) segments
+        """
+        segments: list[FadeStop] = []
+
+        for color, duration_ms in stops:
+            nsegments = max(1, math.ceil(duration_ms / max_fade_ms))
+            elapsed = 0
+            for segment in range(1, nsegments + 1):
+                fraction = segment / nsegments
+                step = tuple(
+                    round(a + (b - a) * fraction)
+                    for a, b in zip(start, color, strict=True)
+                )
+                end = round(duration_ms * fraction)
+                segments.append((step, end - elapsed))
+                elapsed = end
+            start = color
+
+        return segments
+
+    def get_led(self, led: LEDS) -> tuple[int, int, int]:
+        """Return the color most recently requested for the Top or Bottom LED.
+
+        Colors requested inside an unfinished batch_update are reported
+        even though they have not yet been written to the device.
+
+        :param led: Which LED to report (Top or Bottom)
+        """
+        target = self._targets.get(led) or self._shadow.get(led)
+        return target[0] if target else (0, 0, 0)
 
     @property
     def color(self) -> tuple[int, int, int]:
@@ -57,9 +225,397 @@ class Blink1(ThingMBase):
 
     @color.setter
     def color(self, value: tuple[int, int, int]) -> None:
-        self.state.color = value
+        self._set_target(value, 10, LEDS.All)
 
     @property
     def write_strategy(self) -> Callable:
         """The write strategy for communicating with the device."""
         return self.hardware.handle.send_feature_report
+
+    def write_patterns(
+        self,
+        lines: Sequence[PatternLine],
+        start: int = 0,
+        *,
+        save: bool = False,
+    ) -> int:
+        """Store pattern lines on the device, writing only changed lines.
+
+        The lines are compared with the host-side pattern mirror and
+        only lines that differ are sent to the device, one report per
+        line. Pattern memory is volatile until saved, pass save=True
+        to also commit it to the device's flash storage.
+
+        :param lines: Pattern lines to store, starting at start
+        :param start: Pattern line index of the first line
+        :param save: Save pattern memory to flash after writing
+        :return: Number of pattern lines written to the device
+        :raises ValueError: If the lines do not fit in pattern memory
+        :raises LightUnavailableError: If device communication fails
+        """
+        changed = self.patterns.diff(lines, start)
+
+        for index, line in changed:
+            self._write(
+                self._command(State.write_pattern_line, line.color, line.fade_ms, index)
+            )
+            self.patterns[index] = line
+
+        if save:
+            self.save_patterns()
+
+        return len(changed)
+
+    def clear_patterns(self, start: int = 0, count: int = 16) -> int:
+        """Write black to a range of pattern lines, skipping lines already black.
+
+        :param start: Starting pattern line index
+        :param count: Number of pattern lines to clear
+        :return: Number of pattern lines written to the device
+        """
+        return self.write_patterns([PatternLine((0, 0, 0), 0)] * count, start)
+
+    def save_patterns(self) -> None:
+        """Save the device's pattern memory to flash storage.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        self._write(self._command(State.save_patterns))
+
+    def read_pattern_line(self, index: int) -> PatternLine:
+        """Read a single pattern line from the device.
+
+        The line read is recorded in the pattern mirror.
+
+        :param index: Pattern line index (0-15)
+        :return: The pattern line stored on the device
+        :raises LightUnavailableError: If device communication fails
+        """
+        reply = self._query(self._command(State.read_pattern_line, index))
+        line = PatternLine(reply.color, reply.fade * State.tick_ms)
+        self.patterns[index] = line
+        return line
+
+    def read_patterns(self) -> list[PatternLine]:
+        """Read every pattern line from the device, seeding the pattern mirror.
+
+        :return: All pattern lines stored on the device
+        :raises LightUnavailableError: If device communication fails
+        """
+        return [self.read_pattern_line(index) for index in range(len(self.patterns))]
+
+    def get_version(self) -> int:
+        """Return the device's firmware version, e.g. 204 for version 2.04.
+
+        The version is read from the device once and cached for the
+        lifetime of this light.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        return self._fact(Action.GetVersion, self._read_version)
+
+    def get_chip_id(self) -> str:
+        """Return the device's unique chip identifier as a hex string.
+
+        The identifier is read from the device once and cached for the
+        lifetime of this light.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        return self._fact(Action.GetChipID, self._read_chip_id)
+
+    def read_color(
+        self,
+        leds: LEDS = LEDS.Top,
+        max_age: float | None = None,
+    ) -> tuple[int, int, int]:
+        """Return the color an LED is currently displaying.
+
+        Replies are cached for max_age seconds, defaulting to the
+        class readback_ttl. Writes to the device made through this
+        light discard cached colors.
+
+        :param leds: Which LED to read (Top or Bottom)
+        :param max_age: Oldest cached reply in seconds that may be returned
+        :raises LightUnavailableError: If device communication fails
+        """
+        return self._reading(
+            (Action.ReadColor, LEDS(leds)),
+            partial(self._read_color, LEDS(leds)),
+            max_age,
+        )
+
+    def read_play_state(self, max_age: float | None = None) -> PlayState:
+        """Return the device's pattern playback status.
+
+        Replies are cached for max_age seconds, defaulting to the
+        class readback_ttl. Writes to the device made through this
+        light discard the cached status.
+
+        :param max_age: Oldest cached reply in seconds that may be returned
+        :raises LightUnavailableError: If device communication fails
+        """
+        return self._reading(Action.PlayStateRead, self._read_play_state, max_age)
+
+    def update(self, *, force: bool = False) -> None:
+        """Send pending LED changes to the device.
+
+        LED colors requested with on() or fade_to() are coalesced into
+        the fewest commands needed and LEDs already showing the requested
+        color are skipped entirely, unless force is True. With nothing
+        requested, the LEDs are moved to the colors last written to them,
+        or to the light's color if nothing was written yet.
+
+        :param force: Write LEDs even if they already show their color
+        :raises LightUnavailableError: If device communication fails
+        """
+        if self._writer is not None:
+            self._writer.raise_error()
+
+        with self._lock:
+            targets = dict(self._targets) or dict(self._shadow)
+            if not targets:
+                targets = dict.fromkeys(self._expand(LEDS.All), (self.color, 10))
+            self._targets.clear()
+
+            if force:
+                self._shadow.clear()
+
+            commands = self._coalesce(targets)
+            for leds, (color, fade_ms) in commands:
+                self._queue(State.fade_report(color, fade_ms, leds))
+                for led in self._expand(leds):
+                    self._shadow[led] = (color, fade_ms)
+
+        if not commands:
+            return
+
+        try:
+            self._drain()
+        except LightUnavailableError:
+            with self._lock:
+                self._shadow.clear()
+            raise
+        finally:
+            self.invalidate_readings()
+
+    def reset(self) -> None:
+        """Turn the light off, disarming the watchdog if it is armed.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        if self._watchdog is not None:
+            self.disarm_watchdog()
+        super().reset()
+
+    def release(self) -> None:
+        """Disarm the watchdog if it is armed, then release the light.
+
+        A light released cleanly must not play the pattern reserved for
+        a host that stopped tickling it.
+        """
+        if self._watchdog is not None:
+            # The failure has been logged, releasing must still succeed.
+            with contextlib.suppress(LightUnavailableError):
+                self.disarm_watchdog()
+        super().release()
+
+    def _reset_writes(self) -> None:
+        """Forget the colors last written, the device may have changed them."""
+        super()._reset_writes()
+        self._shadow.clear()
+
+    def _set_target(
+        self,
+        color: tuple[int, int, int],
+        fade_ms: int,
+        leds: LEDS,
+    ) -> None:
+        """Record the color requested for leds, to be written by update()."""
+        color = tuple(color)
+        self.state.fade_to_color(color, fade_ms, leds)
+        for led in self._expand(leds):
+            self._targets[led] = (color, fade_ms)
+
+    @staticmethod
+    def _expand(leds: LEDS) -> tuple[LEDS, ...]:
+        """Return the individual LEDs addressed by leds."""
+        if leds == LEDS.All:
+            return (LEDS.Top, LEDS.Bottom)
+        return (leds,)
+
+    def _coalesce(
+        self,
+        targets: dict[LEDS, LEDTarget],
+    ) -> list[tuple[LEDS, LEDTarget]]:
+        """Return the commands needed to move the LEDs to their targets."""
+        changed = {
+            led: target
+            for led, target in targets.items()
+            if self._shadow.get(led) != target
+        }
+
+        top, bottom = changed.get(LEDS.Top), changed.get(LEDS.Bottom)
+        if top is not None and top == bottom:
+            return [(LEDS.All, top)]
+
+        return list(changed.items())
+
+    def _write(self, report: State | bytes) -> None:
+        """Write report to the device.
+
+        Cached volatile read back values are discarded whenever a
+        command other than a query is written.
+
+        :param report: Command or query to write
+        :raises LightUnavailableError: If device communication fails
+        """
+        if self._writer is not None:
+            self._writer.raise_error()
+
+        payload = bytes(report)
+        with self._lock:
+            self._queue(payload)
+        self._drain()
+
+        if payload[1] not in self._quiet_actions:
+            self.invalidate_readings()
+
+    def arm_watchdog(
+        self,
+        timeout_ms: int,
+        start: int = 0,
+        stop: int = 0,
+        *,
+        stay: bool = False,
+    ) -> asyncio.Task:
+        """Hand liveness signalling to the device's server tickle watchdog.
+
+        The device is armed immediately and a task re-tickles it every
+        half timeout. If this process stops tickling, e.g. because it
+        crashed or hung, the device plays pattern lines start through
+        stop on its own. Re-arming replaces the previous watchdog.
+
+        :param timeout_ms: Milliseconds without a tickle before playing
+        :param start: First pattern line to play on timeout
+        :param stop: Last pattern line to play on timeout
+        :param stay: Keep the current color instead of playing on timeout
+        :return: The asyncio.Task tickling the device
+        :raises ValueError: If timeout_ms is outside the timeout field range
+        :raises LightUnavailableError: If device communication fails
+        """
+        if timeout_ms not in range(State.tick_ms, self.max_timeout_ms + 1):
+            msg = (
+                f"timeout_ms must be between {State.tick_ms} and {self.max_timeout_ms}"
+            )
+            raise ValueError(msg)
+
+        self._watchdog = partial(
+            self._command,
+            State.server_tickle,
+            True,
+            timeout_ms,
+            start,
+            stop,
+            stay=stay,
+        )
+        self.tickle_watchdog()
+
+        return self.add_task(
+            "watchdog",
+            partial(_watchdog, interval=timeout_ms / 2000),
+            replace=True,
+        )
+
+    def tickle_watchdog(self) -> None:
+        """Reset the countdown of an armed server tickle watchdog.
+
+        Called periodically by the task started by arm_watchdog(), no
+        action is taken if the watchdog is not armed.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        if self._watchdog is None:
+            return
+        self._write(self._watchdog())
+
+    def disarm_watchdog(self) -> None:
+        """Stop tickling the device and disarm its server tickle watchdog.
+
+        :raises LightUnavailableError: If device communication fails
+        """
+        self.cancel_task("watchdog")
+        self._watchdog = None
+        self._write(self._command(State.server_tickle, False))
+
+    def _read_version(self) -> int:
+        """Query the device for its firmware version."""
+        reply = self._query(self._command(State.get_version))
+        return (reply.green - ord("0")) * 100 + (reply.blue - ord("0"))
+
+    def _read_chip_id(self) -> str:
+        """Query the device for its chip identifier."""
+        return bytes(self._query(self._command(State.get_chip_id)))[2:].hex()
+
+    def _read_color(self, leds: LEDS) -> tuple[int, int, int]:
+        """Query the device for the color an LED is displaying."""
+        return self._query(self._command(State.read_color, leds)).color
+
+    def _read_play_state(self) -> PlayState:
+        """Query the device for its pattern playback status."""
+        reply = self._query(self._command(State.read_play_state))
+        return PlayState(
+            playing=bool(reply.play),
+            start=reply.start,
+            stop=reply.stop,
+            count=reply.count,
+            position=reply.position,
+        )
+
+    def _query(self, request: State) -> State:
+        """Send request to the device and return the device's reply.
+
+        The request is written by the calling thread, after any writes
+        queued for the background writer, and no other write is made
+        until the reply has been read, so the reply always answers
+        this request.
+
+        :param request: Query to write
+        :raises LightUnavailableError: If device communication fails
+        """
+        with self._io_lock:
+            if self._writer is not None:
+                self._writer.flush()
+
+            writes = self.stats.writes
+            self._transmit(bytes(request))
+            if self.stats.writes == writes:
+                # Dropped by a degraded light or missed its write_timeout.
+                raise LightUnavailableError(self)
+
+            with self.exclusive_access():
+                try:
+                    reply = self.hardware.handle.get_feature_report(Report.One, 8)
+                except Exception as error:
+                    logger.error(f"{self}: {error}")
+                    raise LightUnavailableError(self) from None
+
+        return State.from_bytes(bytes(reply))
+
+
+async def _fade_through(
+    light: Blink1,
+    segments: Sequence[FadeStop],
+    leds: LEDS,
+) -> None:
+    """Offload each fade segment to the device and wait for it to finish."""
+    for color, duration_ms in segments:
+        light.fade_to(color, duration_ms, leds)
+        await asyncio.sleep(duration_ms / 1000)
+
+
+async def _watchdog(light: Blink1, interval: float) -> None:
+    """Tickle an armed Blink(1) server tickle watchdog every interval seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        light.tickle_watchdog()
@@ -10,11 +10,17 @@ from .fields import (
     LedsField,
     LinesField,
     PlayField,
+    PositionField,
     RedField,
     ReportField,
     StartField,
+    StayField,
     StopField,
+    TickleStartField,
+    TickleStopField,
+    TimeoutField,
 )
+from .pattern import PatternLine, PatternMemory, PlayState
 from .state import State
 
 __all__ = [
@@ -27,11 +33,19 @@ __all__ = [
     "GreenField",
     "LedsField",
     "LinesField",
+    "PatternLine",
+    "PatternMemory",
     "PlayField",
+    "PlayState",
+    "PositionField",
     "RedField",
     "Report",
     "ReportField",
     "StartField",
     "State",
+    "StayField",
     "StopField",
+    "TickleStartField",
+    "TickleStopField",
+    "TimeoutField",
 ]
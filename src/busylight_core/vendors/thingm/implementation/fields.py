@@ -72,12 +72,47 @@ class CountField(BitField):
 
 
 class FadeField(BitField):
-    """16-bit fade field for transition timing in milliseconds."""
+    """16-bit fade field for transition timing in 10 ms ticks."""
 
     def __init__(self) -> None:
         super().__init__(8, 16)
 
 
+class TimeoutField(BitField):
+    """16-bit server tickle timeout field in 10 ms ticks."""
+
+    def __init__(self) -> None:
+        super().__init__(24, 16)
+
+
+class StayField(BitField):
+    """8-bit server tickle flag to keep the current color on timeout."""
+
+    def __init__(self) -> None:
+        super().__init__(16, 8)
+
+
+class TickleStartField(BitField):
+    """8-bit first pattern line played on server tickle timeout."""
+
+    def __init__(self) -> None:
+        super().__init__(8, 8)
+
+
+class TickleStopField(BitField):
+    """8-bit last pattern line played on server tickle timeout."""
+
+    def __init__(self) -> None:
+        super().__init__(0, 8)
+
+
+class PositionField(BitField):
+    """8-bit pattern position field reported by play state reads."""
+
+    def __init__(self) -> None:
+        super().__init__(8, 8)
+
+
 class LedsField(BitField):
     """8-bit LED selection field for multi-LED devices."""
 
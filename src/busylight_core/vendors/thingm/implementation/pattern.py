@@ -0,0 +1,100 @@
+"""ThingM Blink(1) pattern memory mirror.
+
+This module defines the PatternMemory class which keeps a host-side
+copy of the lines stored in a Blink(1)'s pattern memory so that only
+lines which actually change need to be written to the device, and the
+PlayState reported by the device while patterns are playing.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+
+class PatternLine(NamedTuple):
+    """A single step in a Blink(1) color pattern."""
+
+    color: tuple[int, int, int]
+    fade_ms: int = 0
+
+
+class PlayState(NamedTuple):
+    """Pattern playback status reported by the device."""
+
+    playing: bool
+    start: int
+    stop: int
+    count: int
+    position: int
+
+
+class PatternMemory:
+    """Host-side mirror of a Blink(1)'s pattern memory.
+
+    Each line is either a PatternLine known to be stored on the device
+    or None when the device contents are unknown. Unknown lines always
+    compare as changed, so the first upload writes every line.
+    """
+
+    def __init__(self, nlines: int = 16, tick_ms: int = 10) -> None:
+        """Initialize an empty mirror.
+
+        :param nlines: Number of lines in the device's pattern memory
+        :param tick_ms: Milliseconds in one unit of a stored fade duration
+        """
+        self.nlines = nlines
+        self.tick_ms = tick_ms
+        self.lines: list[PatternLine | None] = [None] * nlines
+
+    def __len__(self) -> int:
+        return self.nlines
+
+    def __iter__(self) -> Iterator[PatternLine | None]:
+        return iter(self.lines)
+
+    def __getitem__(self, index: int) -> PatternLine | None:
+        return self.lines[index]
+
+    def __setitem__(self, index: int, line: PatternLine | None) -> None:
+        self.lines[index] = line
+
+    def invalidate(self) -> None:
+        """Forget the mirrored contents, forcing the next upload to write all lines."""
+        self.lines = [None] * self.nlines
+
+    def normalize(self, line: PatternLine) -> PatternLine:
+        """Return line as the device stores it.
+
+        The fade duration is rounded down to whole ticks and the color
+        is made a tuple, so a line compares equal to the line read back.
+
+        :param line: Pattern line to be stored
+        """
+        color, fade_ms = line
+        return PatternLine(tuple(color), fade_ms // self.tick_ms * self.tick_ms)
+
+    def diff(
+        self,
+        lines: Sequence[PatternLine],
+        start: int = 0,
+    ) -> list[tuple[int, PatternLine]]:
+        """Return the lines that differ from the mirrored contents.
+
+        Lines are compared and returned as normalized by normalize().
+
+        :param lines: Pattern lines to be stored starting at start
+        :param start: Pattern line index of the first line
+        :return: List of (index, line) pairs which need to be written
+        :raises ValueError: If the lines do not fit in pattern memory
+        """
+        if start < 0 or start + len(lines) > self.nlines:
+            msg = f"{len(lines)} lines at {start} exceed {self.nlines} line memory"
+            raise ValueError(msg)
+
+        normalized = enumerate(map(self.normalize, lines), start)
+        return [
+            (index, line) for index, line in normalized if self.lines[index] != line
+        ]
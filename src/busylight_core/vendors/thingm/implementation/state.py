@@ -5,6 +5,10 @@ and device control for ThingM Blink(1) devices, including color control,
 pattern management, and LED selection.
 """
 
+from __future__ import annotations
+
+from typing import ClassVar
+
 from busylight_core.word import Word
 
 from .enums import LEDS, Action, Report
@@ -17,10 +21,15 @@ from .fields import (
     LedsField,
     LinesField,
     PlayField,
+    PositionField,
     RedField,
     ReportField,
     StartField,
+    StayField,
     StopField,
+    TickleStartField,
+    TickleStopField,
+    TimeoutField,
 )
 
 
@@ -33,9 +42,25 @@ class State(Word):
     required for device communication.
     """
 
+    tick_ms: ClassVar[int] = 10
+    """Milliseconds in one unit of the fade and timeout fields."""
+
     def __init__(self) -> None:
         super().__init__(0, 64)
 
+    @classmethod
+    def from_bytes(cls, data: bytes) -> State:
+        """Create a State from a feature report read back from the device.
+
+        Reports shorter than eight bytes are padded with zeros and
+        longer reports are truncated.
+
+        :param data: Feature report bytes, starting with the report ID
+        """
+        state = cls()
+        state[0:64] = int.from_bytes(bytes(data[:8]).ljust(8, b"\x00"), "big")
+        return state
+
     report = ReportField()
     action = ActionField()
     red = RedField()
@@ -46,6 +71,11 @@ class State(Word):
     stop = StopField()  # alias for blue
     count = CountField()
     fade = FadeField()
+    position = PositionField()  # overlaps fade
+    timeout = TimeoutField()  # alias for green and blue
+    stay = StayField()  # alias for count
+    tickle_start = TickleStartField()  # alias for position
+    tickle_stop = TickleStopField()  # alias for leds
     leds = LedsField()
     line = LinesField()  # alias for leds
 
@@ -75,9 +105,37 @@ class State(Word):
         self.report = Report.One
         self.action = Action.FadeColor
         self.color = color
-        self.fade = fade_ms
+        self.fade = fade_ms // self.tick_ms
         self.leds = leds
 
+    @classmethod
+    def fade_report(
+        cls,
+        color: tuple[int, int, int],
+        fade_ms: int = 10,
+        leds: LEDS = LEDS.All,
+    ) -> bytes:
+        """Return the report fade_to_color() lays out, without a State.
+
+        :param color: RGB color tuple (red, green, blue) with values 0-255
+        :param fade_ms: Fade duration in milliseconds
+        :param leds: Which LEDs to control (All, Top, or Bottom)
+        """
+        red, green, blue = color
+        ticks = fade_ms // cls.tick_ms
+        return bytes(
+            (
+                Report.One,
+                Action.FadeColor,
+                red & 0xFF,
+                green & 0xFF,
+                blue & 0xFF,
+                (ticks >> 8) & 0xFF,
+                ticks & 0xFF,
+                leds & 0xFF,
+            )
+        )
+
     def write_pattern_line(
         self,
         color: tuple[int, int, int],
@@ -94,9 +152,50 @@ class State(Word):
         self.report = Report.One
         self.action = Action.SetColorPattern
         self.color = color
-        self.fade = fade_ms
+        self.fade = fade_ms // self.tick_ms
+        self.line = index
+
+    def read_pattern_line(self, index: int) -> None:
+        """Request a single line from the device's pattern memory.
+
+        The device answers with the line's color and fade duration in
+        the next feature report read.
+
+        :param index: Pattern line index (0-15)
+        """
+        self.clear()
+        self.report = Report.One
+        self.action = Action.ReadColorPattern
         self.line = index
 
+    def read_color(self, leds: LEDS = LEDS.Top) -> None:
+        """Request the color currently displayed by an LED.
+
+        :param leds: Which LED to read (Top or Bottom)
+        """
+        self.clear()
+        self.report = Report.One
+        self.action = Action.ReadColor
+        self.leds = leds
+
+    def get_version(self) -> None:
+        """Request the device's firmware version."""
+        self.clear()
+        self.report = Report.One
+        self.action = Action.GetVersion
+
+    def get_chip_id(self) -> None:
+        """Request the device's unique chip identifier."""
+        self.clear()
+        self.report = Report.One
+        self.action = Action.GetChipID
+
+    def read_play_state(self) -> None:
+        """Request the device's pattern playback status."""
+        self.clear()
+        self.report = Report.One
+        self.action = Action.PlayStateRead
+
     def save_patterns(self) -> None:
         """Save current pattern memory to device flash storage."""
         self.clear()
@@ -121,6 +220,35 @@ class State(Word):
         self.stop = stop
         self.count = count
 
+    def server_tickle(
+        self,
+        enable: bool,
+        timeout_ms: int = 0,
+        start: int = 0,
+        stop: int = 0,
+        *,
+        stay: bool = False,
+    ) -> None:
+        """Arm, refresh or disarm the device's server tickle watchdog.
+
+        While armed, the device plays pattern lines start through stop
+        if it is not tickled again within timeout_ms.
+
+        :param enable: Arm the watchdog if True, disarm it if False
+        :param timeout_ms: Milliseconds without a tickle, rounded down to 10 ms
+        :param start: First pattern line to play on timeout
+        :param stop: Last pattern line to play on timeout
+        :param stay: Keep the current color instead of playing on timeout
+        """
+        self.clear()
+        self.report = Report.One
+        self.action = Action.ServerTickle
+        self.play = int(enable)
+        self.timeout = timeout_ms // self.tick_ms
+        self.stay = int(stay)
+        self.tickle_start = start
+        self.tickle_stop = stop
+
     def clear_patterns(self, start: int = 0, count: int = 16) -> None:
         """Clear pattern memory by writing black to specified range.
 
@@ -30,7 +30,8 @@ class Word:
 
         self.initial_value = value
         self.length = length
-        self.bits = array.array("B", [(value >> n) & 1 for n in self.range])
+        self.mask = (1 << length) - 1
+        self._value = value & self.mask
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(value={self.hex})"
@@ -68,7 +69,17 @@ class Word:
     @property
     def value(self) -> int:
         """Return the integer value of the word."""
-        return sum([b << n for n, b in enumerate(self.bits)])
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        """Replace every bit of the word with the bits of value."""
+        self._value = value & self.mask
+
+    @property
+    def bits(self) -> array.array:
+        """Return the bits of the word, least significant first."""
+        return array.array("B", [(self._value >> n) & 1 for n in self.range])
 
     @property
     def range(self) -> range:
@@ -87,29 +98,37 @@ class Word:
 
     def clear(self) -> None:
         """Clear all bits in the word."""
-        self.bits = array.array("B", [0] * self.length)
+        self._value = 0
 
     def __bytes__(self) -> bytes:
-        return self.value.to_bytes(self.length // 8, byteorder="big")
+        return self._value.to_bytes(self.length // 8, byteorder="big")
 
     def __getitem__(self, key: int | slice) -> int:
         if isinstance(key, int):
             if key not in self.range:
                 msg = f"Index out of range: {key}"
                 raise IndexError(msg)
-            return self.bits[key]
-        return sum([b << n for n, b in enumerate(self.bits[key])])
+            return (self._value >> key) & 1
+        start, stop, step = key.indices(self.length)
+        if step == 1:
+            return (self._value >> start) & ((1 << max(stop - start, 0)) - 1)
+        return sum(((self._value >> n) & 1) << i for i, n in enumerate(self.range[key]))
 
     def __setitem__(self, key: int | slice, value: bool | int) -> None:
         if isinstance(key, int):
             if key not in self.range:
                 msg = f"Index out of range: {key}"
                 raise IndexError(msg)
-            self.bits[key] = value & 1
+            self._value = (self._value & ~(1 << key)) | ((value & 1) << key)
+            return
+        start, stop, step = key.indices(self.length)
+        if step == 1:
+            width = max(stop - start, 0)
+            field = ((1 << width) - 1) << start
+            self._value = (self._value & ~field) | ((value << start) & field)
             return
-        length = len(self.bits[key])
-        new_bits = array.array("B", [value >> n & 1 for n in range(length)])
-        self.bits[key] = new_bits
+        for i, n in enumerate(self.range[key]):
+            self._value = (self._value & ~(1 << n)) | (((value >> i) & 1) << n)
 
 
 class ReadOnlyBitField:
@@ -0,0 +1,155 @@
+"""Background device writes for USB connected lights."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .stats import LightStats
+
+
+class Writer:
+    """Writes a light's payloads on a dedicated thread.
+
+    Payloads are queued by put(), which returns without waiting for
+    the device. If the payloads are complete device states only the
+    latest matters, so queuing a payload replaces any payload still
+    waiting and the queue never holds more than one. Otherwise every
+    payload is written in order and put() blocks while maxsize
+    payloads are waiting.
+
+    A failed write is kept and raised by the next call to raise_error(),
+    flush() or join().
+    """
+
+    def __init__(
+        self,
+        write: Callable[[bytes], None],
+        stats: LightStats,
+        *,
+        maxsize: int = 8,
+        latest_wins: bool = True,
+        name: str = "writer",
+    ) -> None:
+        """Initialize a writer; call start() to begin writing.
+
+        :param write: Writes one payload to the device
+        :param stats: Counters updated when waiting payloads are dropped
+        :param maxsize: Most payloads waiting to be written
+        :param latest_wins: Payloads are complete states, keep only the latest
+        :param name: Name of the writer thread
+        :raises ValueError: If maxsize is not positive
+        """
+        if maxsize <= 0:
+            msg = f"maxsize must be positive: {maxsize}"
+            raise ValueError(msg)
+
+        self.write = write
+        self.stats = stats
+        self.maxsize = maxsize
+        self.latest_wins = latest_wins
+        self.name = name
+        self.error: BaseException | None = None
+        self._queue: deque[bytes] = deque()
+        self._ready = threading.Condition()
+        self._busy = False
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """True if the writer thread is accepting payloads."""
+        return self._thread is not None and not self._stopping
+
+    @property
+    def stopped(self) -> bool:
+        """True if the writer thread has exited or was never started."""
+        return self._thread is None or not self._thread.is_alive()
+
+    @property
+    def pending(self) -> int:
+        """Number of payloads waiting to be written."""
+        return len(self._queue)
+
+    def start(self) -> Writer:
+        """Start the writer thread if it is not running."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name=self.name,
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def put(self, payload: bytes) -> None:
+        """Queue payload to be written by the writer thread.
+
+        :param payload: Bytes to write to the device
+        """
+        with self._ready:
+            if self.latest_wins:
+                self.stats.dropped += len(self._queue)
+                self._queue.clear()
+            else:
+                while len(self._queue) >= self.maxsize:
+                    self._ready.wait()
+            self._queue.append(payload)
+            self._ready.notify_all()
+
+    def raise_error(self) -> None:
+        """Raise the error from a failed write, if there was one, and forget it."""
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Wait until every queued payload has been written.
+
+        :param timeout: Seconds to wait, None waits until the queue is empty
+        :raises TimeoutError: If payloads are still waiting after timeout
+        """
+        with self._ready:
+            drained = self._ready.wait_for(
+                lambda: not self._queue and not self._busy,
+                timeout,
+            )
+        self.raise_error()
+        if not drained:
+            msg = f"{self.name}: {self.pending} payloads not written"
+            raise TimeoutError(msg)
+
+    def join(self, timeout: float | None = None) -> None:
+        """Write the queued payloads, then stop the writer thread.
+
+        :param timeout: Seconds to wait for the writer thread to exit
+        """
+        with self._ready:
+            self._stopping = True
+            self._ready.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self.raise_error()
+
+    def _run(self) -> None:
+        while True:
+            with self._ready:
+                self._ready.wait_for(lambda: self._queue or self._stopping)
+                if not self._queue:
+                    return
+                payload = self._queue.popleft()
+                self._busy = True
+                self._ready.notify_all()
+
+            try:
+                self.write(payload)
+            except Exception as error:
+                self.error = error
+            finally:
+                with self._ready:
+                    self._busy = False
+                    self._ready.notify_all()
@@ -0,0 +1,41 @@
+"""Tests for the PayloadCache."""
+
+from busylight_core.cache import PayloadCache
+
+
+def test_cache_miss_then_hit() -> None:
+    """Test lookups are counted as misses until the key is cached."""
+    cache = PayloadCache(maxsize=2)
+
+    assert cache.get("red") is None
+    cache.put("red", (1, b"\x01"))
+
+    assert cache.get("red") == (1, b"\x01")
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """Test the least recently used entry is evicted when the cache is full."""
+    cache = PayloadCache(maxsize=2)
+    cache.put("red", (1, b"\x01"))
+    cache.put("green", (2, b"\x02"))
+    cache.get("red")
+
+    cache.put("blue", (3, b"\x03"))
+
+    assert len(cache) == 2
+    assert cache.get("green") is None
+    assert cache.get("red") == (1, b"\x01")
+    assert cache.get("blue") == (3, b"\x03")
+
+
+def test_cache_clear() -> None:
+    """Test clear removes every entry and resets the counters."""
+    cache = PayloadCache(maxsize=2)
+    cache.put("red", (1, b"\x01"))
+    cache.get("red")
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
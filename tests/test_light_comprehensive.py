@@ -1,9 +1,14 @@
 """Comprehensive tests for the Light base class to improve coverage."""
 
+import asyncio
+import threading
+import time
 from typing import ClassVar
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
+import serial
+from loguru import logger
 
 from busylight_core.exceptions import HardwareUnsupportedError, LightUnavailableError
 from busylight_core.hardware import ConnectionType, Hardware
@@ -44,6 +49,15 @@ def create_mock_hardware(
     return mock_hardware
 
 
+@pytest.fixture
+def light() -> MockLightSubclass:
+    """Light with a payload that follows its color."""
+    with patch.object(MockLightSubclass, "__bytes__", lambda s: bytes(s.color)):
+        light = MockLightSubclass(create_mock_hardware())
+        light.platform = "Linux"
+        yield light
+
+
 class TestLightFirstLight:
     """Test first_light method coverage."""
 
@@ -374,6 +388,756 @@ class TestLightUpdate:
                 mock_logger.assert_called_once()
 
 
+class TestLightFraming:
+    """Test the payload framing resolved once per acquisition."""
+
+    def test_framing_resolved_once(self, light) -> None:
+        """Test the platform and write strategy are looked up on first write."""
+        with patch.object(
+            MockLightSubclass,
+            "write_strategy",
+            new_callable=PropertyMock,
+            return_value=light.hardware.handle.write,
+        ) as strategy:
+            light.update(force=True)
+            light.update(force=True)
+
+        strategy.assert_called_once()
+        assert light.hardware.handle.write.call_count == 2
+
+    def test_release_resolves_framing_again(self, light) -> None:
+        """Test the framing is resolved again after the light is released."""
+        light.update(force=True)
+        light.release()
+        light.platform = "Windows_10"
+        light.update(force=True)
+
+        light.hardware.handle.write.assert_called_with(b"\x00\x00\x00\x00")
+
+    def test_payload_logged_when_enabled(self, light) -> None:
+        """Test the payload is formatted for enabled debug logging."""
+        messages = []
+        logger.enable("busylight_core")
+        sink = logger.add(messages.append, level="DEBUG", format="{message}")
+        try:
+            light.color = (255, 0, 0)
+            light.update()
+        finally:
+            logger.remove(sink)
+            logger.disable("busylight_core")
+
+        assert any("payload ff:00:00" in message for message in messages)
+
+    def test_payload_not_formatted_when_disabled(self, light) -> None:
+        """Test the payload is not formatted while logging is disabled."""
+        formatted = []
+
+        class Payload(bytes):
+            def hex(self, *args: object) -> str:
+                formatted.append(self)
+                return super().hex(*args)
+
+        with patch.object(MockLightSubclass, "__bytes__", lambda _: Payload(b"\x01")):
+            light.update(force=True)
+
+        light.hardware.handle.write.assert_called_once_with(b"\x01")
+        assert formatted == []
+
+
+class TestLightWriteElision:
+    """Test that unchanged payloads are not written twice."""
+
+    def test_repeated_update_is_elided(self, light) -> None:
+        """Test an unchanged payload is only written once."""
+        light.color = (255, 0, 0)
+        light.update()
+        light.update()
+
+        light.hardware.handle.write.assert_called_once_with(b"\xff\x00\x00")
+        assert light.stats.writes == 1
+        assert light.stats.elided == 1
+
+    def test_changed_payload_is_written(self, light) -> None:
+        """Test a changed payload is written."""
+        light.color = (255, 0, 0)
+        light.update()
+        light.color = (0, 255, 0)
+        light.update()
+
+        assert light.hardware.handle.write.call_count == 2
+        assert light.stats.elided == 0
+
+    def test_force_writes_unchanged_payload(self, light) -> None:
+        """Test force=True writes even if the payload is unchanged."""
+        light.update()
+        light.update(force=True)
+
+        assert light.hardware.handle.write.call_count == 2
+        assert light.stats.writes == 2
+        assert light.stats.elided == 0
+
+    def test_elide_writes_disabled(self, light) -> None:
+        """Test classes can opt out of write elision."""
+        with patch.object(MockLightSubclass, "elide_writes", new=False):
+            light.update()
+            light.update()
+
+        assert light.hardware.handle.write.call_count == 2
+
+    def test_failed_write_is_not_remembered(self, light) -> None:
+        """Test the payload is written again after a failed write."""
+        light.hardware.handle.write.side_effect = [OSError("gone"), None]
+
+        with pytest.raises(LightUnavailableError):
+            light.update()
+        light.update()
+
+        assert light.hardware.handle.write.call_count == 2
+        assert light.stats.writes == 1
+
+    def test_windows_10_prefix_does_not_defeat_elision(self, light) -> None:
+        """Test the platform prefix is not part of the remembered payload."""
+        light.platform = "Windows_10"
+        light.update()
+        light.update()
+
+        light.hardware.handle.write.assert_called_once_with(b"\x00\x00\x00\x00")
+
+    def test_reset_always_writes(self, light) -> None:
+        """Test reset writes even if the light appears to be off."""
+        light.on = lambda *_args: light.update()
+        light.update()
+        light.reset()
+
+        assert light.hardware.handle.write.call_count == 2
+
+    def test_stats_clear(self, light) -> None:
+        """Test clearing the write statistics."""
+        light.update()
+        light.update()
+        light.stats.clear()
+
+        assert light.stats.writes == 0
+        assert light.stats.elided == 0
+
+
+class TestLightBatchUpdate:
+    """Test nested batch updates."""
+
+    def test_batch_writes_once(self, light) -> None:
+        """Test a batch writes once when it exits."""
+        with light.batch_update():
+            light.color = (255, 0, 0)
+            light.hardware.handle.write.assert_not_called()
+
+        light.hardware.handle.write.assert_called_once_with(b"\xff\x00\x00")
+
+    def test_nested_batches_write_once(self, light) -> None:
+        """Test only the outermost batch writes."""
+        with light.batch_update():
+            with light.batch_update():
+                light.color = (255, 0, 0)
+            with light.batch_update():
+                light.color = (0, 255, 0)
+            light.hardware.handle.write.assert_not_called()
+
+        light.hardware.handle.write.assert_called_once_with(b"\x00\xff\x00")
+        assert light.stats.coalesced == 2
+        assert light.stats.writes == 1
+
+    def test_exception_suppresses_write(self, light) -> None:
+        """Test a batch that raises does not write."""
+        with pytest.raises(RuntimeError, match="oops"):
+            _failed_batch(light, nested=False)
+
+        light.hardware.handle.write.assert_not_called()
+
+    def test_nested_exception_suppresses_outer_write(self, light) -> None:
+        """Test an exception escaping a nested batch suppresses every write."""
+        with pytest.raises(RuntimeError, match="oops"):
+            _failed_batch(light, nested=True)
+
+        light.hardware.handle.write.assert_not_called()
+
+    def test_batch_after_exception_writes(self, light) -> None:
+        """Test batching recovers after an exception."""
+        with pytest.raises(RuntimeError, match="oops"):
+            _failed_batch(light, nested=True)
+
+        with light.batch_update():
+            light.color = (0, 0, 255)
+
+        light.hardware.handle.write.assert_called_once_with(b"\x00\x00\xff")
+
+
+def _failed_batch(light: Light, *, nested: bool) -> None:
+    """Change the light's color in a batch that raises RuntimeError."""
+    msg = "oops"
+    with light.batch_update():
+        light.color = (255, 0, 0)
+        if not nested:
+            raise RuntimeError(msg)
+        with light.batch_update():
+            raise RuntimeError(msg)
+
+
+class TestLightRateLimit:
+    """Test latest-wins rate limiting of device writes."""
+
+    @pytest.fixture
+    def limited(self, light) -> MockLightSubclass:
+        """Light limited to ten writes a second with a first write made."""
+        light.max_update_hz = 10
+        light.color = (255, 0, 0)
+        light.update()
+        yield light
+        light.release()
+
+    def test_unlimited_by_default(self, light) -> None:
+        """Test every update is written when no rate is set."""
+        for color in ((255, 0, 0), (0, 255, 0), (0, 0, 255)):
+            light.color = color
+            light.update()
+
+        assert light.hardware.handle.write.call_count == 3
+
+    def test_invalid_rate(self, light) -> None:
+        """Test the rate must be positive."""
+        with pytest.raises(ValueError, match="must be positive"):
+            light.max_update_hz = 0
+
+    def test_latest_update_wins(self, limited) -> None:
+        """Test only the latest of a burst of updates is written."""
+        limited.color = (0, 255, 0)
+        limited.update()
+        limited.color = (0, 0, 255)
+        limited.update()
+        limited.hardware.handle.write.assert_called_once()
+
+        limited.flush()
+
+        limited.hardware.handle.write.assert_called_with(b"\x00\x00\xff")
+        assert limited.hardware.handle.write.call_count == 2
+        assert limited.stats.dropped == 1
+        assert limited.stats.merged == 1
+
+    def test_deferred_update_is_flushed_by_timer(self, limited) -> None:
+        """Test the deferred update is written without further calls."""
+        written = threading.Event()
+        limited.hardware.handle.write.side_effect = lambda _: written.set()
+        limited.color = (0, 255, 0)
+        limited.update()
+
+        assert written.wait(timeout=2)
+        limited.hardware.handle.write.assert_called_with(b"\x00\xff\x00")
+
+    @pytest.mark.asyncio
+    async def test_deferred_update_is_flushed_by_event_loop(self, limited) -> None:
+        """Test the running event loop writes the deferred update."""
+        with patch("busylight_core.light.threading.Timer") as timer:
+            limited.color = (0, 255, 0)
+            limited.update()
+            await asyncio.sleep(0.2)
+
+        timer.assert_not_called()
+
+        limited.hardware.handle.write.assert_called_with(b"\x00\xff\x00")
+        assert limited.stats.merged == 1
+
+    @pytest.mark.asyncio
+    async def test_deferred_aon_does_not_block_event_loop(self, limited) -> None:
+        """Test a deferred update flushed by the loop writes off the loop thread."""
+        threads = []
+        written = threading.Event()
+
+        def write(_payload: bytes) -> None:
+            threads.append(threading.current_thread())
+            time.sleep(0.2)
+            written.set()
+
+        def on(color: tuple[int, int, int], _led: int = 0) -> None:
+            limited.color = color
+            limited.update()
+
+        limited.on = on
+        limited.hardware.handle.write.side_effect = write
+        await limited.aon((0, 255, 0))
+        await limited.aon((0, 0, 255))
+
+        loop = asyncio.get_running_loop()
+        deadline, last, stall = loop.time() + 2, loop.time(), 0.0
+        while not written.is_set() and loop.time() < deadline:
+            await asyncio.sleep(0.01)
+            stall, last = max(stall, loop.time() - last), loop.time()
+
+        assert written.is_set()
+        assert stall < 0.15
+        assert threading.current_thread() not in threads
+        limited.hardware.handle.write.assert_called_with(b"\x00\x00\xff")
+
+    def test_return_to_written_state(self, limited) -> None:
+        """Test reverting to the written state writes nothing more."""
+        limited.color = (0, 255, 0)
+        limited.update()
+        limited.color = (255, 0, 0)
+        limited.update()
+        limited.flush()
+
+        limited.hardware.handle.write.assert_called_once()
+        assert limited.stats.dropped == 1
+
+    def test_force_writes_immediately(self, limited) -> None:
+        """Test force writes now and discards the deferred update."""
+        limited.color = (0, 255, 0)
+        limited.update()
+        limited.color = (0, 0, 255)
+        limited.update(force=True)
+        limited.flush()
+
+        limited.hardware.handle.write.assert_called_with(b"\x00\x00\xff")
+        assert limited.hardware.handle.write.call_count == 2
+        assert limited.stats.dropped == 1
+
+    def test_reset_discards_deferred_update(self, limited) -> None:
+        """Test reset writes immediately and discards the deferred update."""
+        limited.on = lambda *_args: limited.update()
+        limited.color = (0, 255, 0)
+        limited.update()
+        limited.color = (0, 0, 0)
+        limited.reset()
+        limited.flush()
+
+        limited.hardware.handle.write.assert_called_with(b"\x00\x00\x00")
+        assert limited.hardware.handle.write.call_count == 2
+
+    def test_commands_are_not_limited(self, limited) -> None:
+        """Test classes that write commands are never deferred."""
+        with patch.object(MockLightSubclass, "elide_writes", new=False):
+            limited.color = (0, 255, 0)
+            limited.update()
+
+        assert limited.hardware.handle.write.call_count == 2
+
+
+class TestLightAsync:
+    """Test the awaitable light methods."""
+
+    @pytest.fixture
+    def alight(self, light) -> MockLightSubclass:
+        """Light whose on() sets its color and updates the device."""
+
+        def on(color: tuple[int, int, int], _led: int = 0) -> None:
+            light.color = color
+            light.update()
+
+        light.on = on
+        yield light
+        light.release()
+
+    @pytest.mark.asyncio
+    async def test_aon_writes_on_worker_thread(self, alight) -> None:
+        """Test aon() writes from the light's worker thread."""
+        threads = []
+        alight.hardware.handle.write.side_effect = lambda _: threads.append(
+            threading.current_thread()
+        )
+
+        await alight.aon((255, 0, 0))
+
+        alight.hardware.handle.write.assert_called_once_with(b"\xff\x00\x00")
+        assert threads != [threading.current_thread()]
+        assert alight.stats.writes == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_keep_call_order(self, alight) -> None:
+        """Test concurrent calls reach the device in the order they were made."""
+        colors = [(i, 0, 0) for i in range(1, 20)]
+
+        await asyncio.gather(*(alight.aon(color) for color in colors))
+
+        written = [c.args[0] for c in alight.hardware.handle.write.call_args_list]
+        assert written == [bytes(color) for color in colors]
+
+    @pytest.mark.asyncio
+    async def test_state_changes_before_write(self, alight) -> None:
+        """Test the light's state changes as soon as aon() is called."""
+        pending = alight.aon((0, 255, 0))
+        coroutine = asyncio.ensure_future(pending)
+        await asyncio.sleep(0)
+
+        assert alight.color == (0, 255, 0)
+        await coroutine
+
+    @pytest.mark.asyncio
+    async def test_aoff_and_areset(self, alight) -> None:
+        """Test aoff() and areset() write black."""
+        await alight.aon((255, 0, 0))
+        await alight.aoff()
+        await alight.areset()
+
+        written = [c.args[0] for c in alight.hardware.handle.write.call_args_list]
+        assert written == [b"\xff\x00\x00", b"\x00\x00\x00", b"\x00\x00\x00"]
+
+    @pytest.mark.asyncio
+    async def test_aupdate_elides_unchanged_state(self, alight) -> None:
+        """Test aupdate() skips a payload the device was already sent."""
+        await alight.aupdate()
+        await alight.aupdate()
+        await alight.aupdate(force=True)
+
+        assert alight.hardware.handle.write.call_count == 2
+        assert alight.stats.elided == 1
+
+    @pytest.mark.asyncio
+    async def test_write_failure_raises(self, alight) -> None:
+        """Test device failures surface when the write is awaited."""
+        alight.hardware.handle.write.side_effect = OSError("unplugged")
+
+        with pytest.raises(LightUnavailableError):
+            await alight.aon((255, 0, 0))
+
+    @pytest.mark.asyncio
+    async def test_writes_by_background_writer(self, alight) -> None:
+        """Test aon() queues its write for a running background writer."""
+        threads = []
+        alight.hardware.handle.write.side_effect = lambda _: threads.append(
+            threading.current_thread().name
+        )
+        alight.start_writer()
+
+        await alight.aon((255, 0, 0))
+        alight.join()
+
+        assert threads == ["MockLightSubclass-writer"]
+
+    @pytest.mark.asyncio
+    async def test_writes_serialized_with_sync_writes(self, alight) -> None:
+        """Test async writes never overlap writes made by other threads."""
+        active = []
+        overlapped = threading.Event()
+
+        def write(_payload: bytes) -> None:
+            active.append(None)
+            if len(active) > 1:
+                overlapped.set()
+            time.sleep(0.005)
+            active.pop()
+
+        def spin() -> None:
+            for red in range(1, 20):
+                alight.on((red, 0, 0))
+
+        alight.hardware.handle.write.side_effect = write
+        thread = threading.Thread(target=spin)
+        thread.start()
+        for green in range(1, 20):
+            await alight.aon((0, green, 0))
+        thread.join(2)
+
+        assert not overlapped.is_set()
+
+    def test_sync_update_writes_directly(self, alight) -> None:
+        """Test synchronous calls still write on the calling thread."""
+        threads = []
+        alight.hardware.handle.write.side_effect = lambda _: threads.append(
+            threading.current_thread()
+        )
+
+        alight.on((255, 0, 0))
+
+        assert threads == [threading.current_thread()]
+
+
+class TestLightBackgroundWriter:
+    """Test writing to the device from a background thread."""
+
+    @pytest.fixture
+    def background(self, light) -> MockLightSubclass:
+        """Light writing on a background thread."""
+        light.start_writer()
+        yield light
+        light.release()
+
+    def test_update_returns_before_write(self, background) -> None:
+        """Test update() queues the payload and returns immediately."""
+        gate = threading.Event()
+        background.hardware.handle.write.side_effect = lambda _: gate.wait(2)
+        background.color = (255, 0, 0)
+
+        background.update()
+        assert not gate.is_set()
+        gate.set()
+        background.flush(timeout=2)
+
+        background.hardware.handle.write.assert_called_once_with(b"\xff\x00\x00")
+        assert background.stats.writes == 1
+
+    def test_writes_on_writer_thread(self, background) -> None:
+        """Test the payload is written by the writer thread."""
+        threads = []
+        background.hardware.handle.write.side_effect = lambda _: threads.append(
+            threading.current_thread()
+        )
+
+        background.color = (255, 0, 0)
+        background.update()
+        background.flush(timeout=2)
+
+        assert threads
+        assert threads[0] is not threading.current_thread()
+
+    def test_latest_wins(self, background) -> None:
+        """Test updates queued behind a busy write are replaced."""
+        started, gate = threading.Event(), threading.Event()
+
+        def write(_payload: bytes) -> None:
+            started.set()
+            gate.wait(2)
+
+        background.hardware.handle.write.side_effect = write
+        background.color = (1, 0, 0)
+        background.update()
+        assert started.wait(2)
+        for red in (2, 3, 4):
+            background.color = (red, 0, 0)
+            background.update()
+        gate.set()
+        background.flush(timeout=2)
+
+        written = [c.args[0] for c in background.hardware.handle.write.call_args_list]
+        assert written == [b"\x01\x00\x00", b"\x04\x00\x00"]
+        assert background.stats.dropped == 2
+
+    def test_error_raised_by_next_call(self, background) -> None:
+        """Test a failed background write is raised by the next update()."""
+        background.hardware.handle.write.side_effect = OSError("unplugged")
+        background.color = (255, 0, 0)
+        background.update()
+
+        with pytest.raises(LightUnavailableError):
+            background.flush(timeout=2)
+
+        background.hardware.handle.write.side_effect = None
+        background.update()
+        background.flush(timeout=2)
+        assert background.stats.writes == 1
+
+    def test_join_returns_to_synchronous_writes(self, background) -> None:
+        """Test join() stops the writer and later updates write directly."""
+        background.join()
+        threads = []
+        background.hardware.handle.write.side_effect = lambda _: threads.append(
+            threading.current_thread()
+        )
+
+        background.color = (255, 0, 0)
+        background.update()
+
+        assert threads == [threading.current_thread()]
+
+    def test_join_waits_for_blocked_write(self, background) -> None:
+        """Test updates made during join() are not written over a queued write."""
+        started, gate = threading.Event(), threading.Event()
+        active, overlapped = [], []
+
+        def write(_payload: bytes) -> None:
+            overlapped.extend(active)
+            active.append(threading.current_thread())
+            started.set()
+            gate.wait(2)
+            active.pop()
+
+        def change() -> None:
+            background.color = (0, 0, 255)
+            background.update()
+
+        background.hardware.handle.write.side_effect = write
+        background.color = (255, 0, 0)
+        background.update()
+        assert started.wait(2)
+
+        joiner = threading.Thread(target=background.join, kwargs={"timeout": 2})
+        joiner.start()
+        joiner.join(0.05)
+        updater = threading.Thread(target=change)
+        updater.start()
+        updater.join(0.05)
+        gate.set()
+        joiner.join(2)
+        updater.join(2)
+
+        assert not overlapped
+        written = [c.args[0] for c in background.hardware.handle.write.call_args_list]
+        assert written == [b"\xff\x00\x00", b"\x00\x00\xff"]
+
+    def test_release_writes_queued_payloads(self, light) -> None:
+        """Test release() waits for queued payloads to be written."""
+        light.start_writer()
+        light.color = (255, 0, 0)
+        light.update()
+        light.release()
+
+        light.hardware.handle.write.assert_called_once_with(b"\xff\x00\x00")
+
+
+class TestLightThreadSafety:
+    """Test updating a light from several threads."""
+
+    def test_batches_are_not_interleaved(self, light) -> None:
+        """Test every payload written is a state set by a single thread."""
+
+        def worker(level: int) -> None:
+            for _ in range(50):
+                with light.batch_update():
+                    light.color = (level, level, level)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for call in light.hardware.handle.write.call_args_list:
+            assert len(set(call.args[0])) == 1
+        assert light.hardware.handle.write.call_args.args[0] == bytes(light)
+
+    def test_overtaken_payload_is_dropped(self, light) -> None:
+        """Test a payload staged during a write is dropped for a newer one."""
+        started, gate = threading.Event(), threading.Event()
+
+        def write(_payload: bytes) -> None:
+            started.set()
+            gate.wait(2)
+
+        def change(level: int) -> None:
+            with light.batch_update():
+                light.color = (level, 0, 0)
+
+        def update(level: int) -> threading.Thread:
+            thread = threading.Thread(target=change, args=(level,))
+            thread.start()
+            return thread
+
+        light.hardware.handle.write.side_effect = write
+        threads = [update(1)]
+        assert started.wait(2)
+        for level in (2, 3):
+            threads.append(update(level))
+            threads[-1].join(0.05)
+        gate.set()
+        for thread in threads:
+            thread.join(2)
+
+        written = [call.args[0] for call in light.hardware.handle.write.call_args_list]
+        assert written == [b"\x01\x00\x00", b"\x03\x00\x00"]
+        assert light.stats.dropped == 1
+
+
+class TestLightWriteDeadline:
+    """Test dropping writes that miss write_timeout."""
+
+    @pytest.fixture
+    def gate(self, light) -> threading.Event:
+        """Event blocking the light's writes until it is set."""
+        gate = threading.Event()
+        light.hardware.handle.write.side_effect = lambda _: gate.wait(2)
+        light.write_timeout = 0.05
+        yield gate
+        gate.set()
+        light.release()
+
+    def change(self, light: MockLightSubclass, color: tuple[int, int, int]) -> None:
+        """Change the light's color in a batch."""
+        with light.batch_update():
+            light.color = color
+
+    def test_missed_deadline_drops_frame(self, light, gate) -> None:
+        """Test a blocked HID write is abandoned and counted."""
+        self.change(light, (255, 0, 0))
+
+        assert light.stats.missed == 1
+        assert light.stats.writes == 0
+        assert not light.degraded
+
+    def test_no_writes_queued_behind_blocked_write(self, light, gate) -> None:
+        """Test updates are dropped at once while a write is still blocked."""
+        self.change(light, (255, 0, 0))
+        self.change(light, (0, 255, 0))
+
+        assert light.stats.missed == 2
+        light.hardware.handle.write.assert_called_once()
+
+    def test_write_after_device_recovers(self, light, gate) -> None:
+        """Test the same state is written again once the device recovers."""
+        self.change(light, (255, 0, 0))
+        gate.set()
+        light.release()
+
+        light.update()
+
+        assert light.hardware.handle.write.call_count == 2
+        assert light.stats.writes == 1
+
+    def test_degraded_after_missed_deadlines(self, light, gate) -> None:
+        """Test a degraded light drops updates until it is reset."""
+        light.degrade_after = 2
+        for red in (1, 2, 3):
+            self.change(light, (red, 0, 0))
+
+        assert light.degraded
+        assert light.stats.missed == 2
+        assert light.stats.dropped == 1
+
+        gate.set()
+        light.release()
+        light.reset()
+        self.change(light, (4, 0, 0))
+
+        assert not light.degraded
+        light.hardware.handle.write.assert_called_with(b"\x04\x00\x00")
+
+    def test_release_waits_for_blocked_write(self, light, gate) -> None:
+        """Test release() closes the device only once a blocked write returns."""
+        self.change(light, (255, 0, 0))
+        released = threading.Event()
+        light.hardware.release.side_effect = released.set
+
+        light.release()
+
+        assert light.degraded
+        light.hardware.release.assert_not_called()
+        gate.set()
+        assert released.wait(2)
+
+    def test_shared_device_open_while_write_blocked(self) -> None:
+        """Test a non-exclusive light keeps the device open for a blocked write."""
+        gate = threading.Event()
+        hardware = create_mock_hardware()
+        hardware.handle.write.side_effect = lambda _: gate.wait(2)
+        with patch.object(MockLightSubclass, "__bytes__", lambda s: bytes(s.color)):
+            light = MockLightSubclass(hardware, reset=False, exclusive=False)
+            light.platform = "Linux"
+            light.write_timeout = 0.05
+            self.change(light, (255, 0, 0))
+            self.change(light, (0, 255, 0))
+
+            hardware.release.assert_not_called()
+            gate.set()
+            light.release()
+            hardware.release.assert_called_once()
+
+    def test_serial_write_timeout(self, light) -> None:
+        """Test serial writes use the port's write_timeout."""
+        light.hardware.device_type = ConnectionType.SERIAL
+        light.hardware.handle.write.side_effect = serial.SerialTimeoutException
+        light.write_timeout = 0.25
+
+        self.change(light, (255, 0, 0))
+
+        assert light.hardware.handle.write_timeout == 0.25
+        assert light.stats.missed == 1
+
+
 class TestLightIntegration:
     """Integration tests for Light class."""
 
@@ -127,3 +127,23 @@ class TestBlinkStickFlex:
             # Check that the specific LED was set
             assert blinkstick_flex.state.get_led(led - 1) == color
             mock_batch.assert_called_once()
+
+    def test_chain_length_default(self, blinkstick_flex) -> None:
+        """Test a Flex assumes every LED is attached."""
+        assert blinkstick_flex.chain_length == 32
+
+    def test_chain_length_sets_layout(self, blinkstick_flex) -> None:
+        """Test chain_length limits the layout to the attached LEDs."""
+        blinkstick_flex.on((255, 0, 0), led=1)
+        blinkstick_flex.chain_length = 12
+
+        assert blinkstick_flex.state.layout.chain_length == 12
+        assert blinkstick_flex.state.layout.positions[-1] == 1.0
+        assert blinkstick_flex.state.get_led(0) == (255, 0, 0)
+
+    @pytest.mark.parametrize("chain_length", [0, 33])
+    def test_chain_length_invalid(self, blinkstick_flex, chain_length) -> None:
+        """Test chain_length must fit the Flex's 32 LEDs."""
+        with pytest.raises(ValueError, match="chain_length"):
+            blinkstick_flex.chain_length = chain_length
+        assert blinkstick_flex.chain_length == 32
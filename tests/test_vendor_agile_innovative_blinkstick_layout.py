@@ -0,0 +1,66 @@
+"""Tests for Agile Innovative BlinkStick Layout implementation."""
+
+import math
+
+import pytest
+
+from busylight_core.vendors.agile_innovative.implementation import Layout, Shape
+
+
+class TestBlinkStickLayout:
+    """Test the BlinkStick Layout class."""
+
+    def test_layout_point(self) -> None:
+        """Test point() describes a single LED."""
+        layout = Layout.point()
+        assert layout.shape == Shape.POINT
+        assert layout.chain_length == 1
+        assert layout.positions == (0.0,)
+        assert layout.angles == (0.0,)
+
+    def test_layout_linear_positions(self) -> None:
+        """Test linear() positions span 0.0 to 1.0 inclusive."""
+        layout = Layout.linear(5)
+        assert layout.positions == (0.0, 0.25, 0.5, 0.75, 1.0)
+        assert layout.angles == (0.0,) * 5
+
+    def test_layout_linear_single_led(self) -> None:
+        """Test a one LED linear layout does not divide by zero."""
+        assert Layout.linear(1).positions == (0.0,)
+
+    def test_layout_ring_positions_and_angles(self) -> None:
+        """Test ring() spaces LEDs evenly around a full turn."""
+        layout = Layout.ring(8)
+        assert layout.positions == tuple(i / 8 for i in range(8))
+        assert layout.angles[0] == 0.0
+        assert layout.angles[2] == pytest.approx(math.pi / 2)
+        assert layout.angles[4] == pytest.approx(math.pi)
+
+    def test_layout_invalid_chain_length(self) -> None:
+        """Test non-positive chain lengths are rejected."""
+        with pytest.raises(ValueError, match="chain_length"):
+            Layout.linear(0)
+
+    def test_layout_reversed(self) -> None:
+        """Test reversed mirrors the chain."""
+        assert Layout.linear(4).reversed == (3, 2, 1, 0)
+
+    def test_layout_rotation(self) -> None:
+        """Test rotation() returns gather indices for each step count."""
+        layout = Layout.ring(4)
+        assert layout.rotation(0) == (0, 1, 2, 3)
+        assert layout.rotation(1) == (3, 0, 1, 2)
+        assert layout.rotation(-1) == (1, 2, 3, 0)
+        assert layout.rotation(5) == layout.rotation(1)
+
+    def test_layout_rotations_precomputed(self) -> None:
+        """Test rotations are computed once and shared."""
+        layout = Layout.ring(8)
+        assert layout.rotation(3) is layout.rotation(3)
+        assert len(layout.rotations) == 8
+
+    def test_layout_is_hashable(self) -> None:
+        """Test layouts compare and hash by value."""
+        assert Layout.ring(8) == Layout.ring(8)
+        assert hash(Layout.ring(8)) == hash(Layout.ring(8))
+        assert Layout.ring(8) != Layout.linear(8)
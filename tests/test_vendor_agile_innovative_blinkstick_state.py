@@ -1,6 +1,12 @@
 """Tests for Agile Innovative BlinkStick State implementation."""
 
-from busylight_core.vendors.agile_innovative.implementation import State
+import pytest
+
+from busylight_core.vendors.agile_innovative.implementation import (
+    Layout,
+    Shape,
+    State,
+)
 
 
 class TestBlinkStickState:
@@ -243,3 +249,47 @@ class TestBlinkStickState:
             grb_color = State.rgb_to_grb(rgb_color)
             converted_back = State.grb_to_rgb(grb_color)
             assert converted_back == rgb_color
+
+    def test_state_factory_layouts(self) -> None:
+        """Test factory methods attach the expected LED layouts."""
+        assert State.blinkstick().layout.shape == Shape.POINT
+        assert State.blinkstick_square().layout.shape == Shape.RING
+        assert State.blinkstick_strip().layout.shape == Shape.LINEAR
+        assert State.blinkstick_nano().layout.chain_length == 2
+        assert State.blinkstick_pro().layout.chain_length == 192
+        assert State.blinkstick_flex().layout.chain_length == 32
+
+    def test_state_flex_chain_length(self) -> None:
+        """Test blinkstick_flex() with a short chain keeps the report size."""
+        state = State.blinkstick_flex(chain_length=10)
+        assert state.nleds == 32
+        assert state.layout.chain_length == 10
+
+    def test_state_layout_longer_than_nleds(self) -> None:
+        """Test a layout chain longer than nleds is rejected."""
+        with pytest.raises(ValueError, match="exceeds"):
+            State(report=6, nleds=4, layout=Layout.ring(8))
+
+    def test_state_gather(self) -> None:
+        """Test gather() rearranges colors by source index."""
+        state = State(report=6, nleds=4)
+        state.colors = [(1, 1, 1), (2, 2, 2), (3, 3, 3), (4, 4, 4)]
+        state.gather([3, 2, 1, 0])
+        assert state.colors == [(4, 4, 4), (3, 3, 3), (2, 2, 2), (1, 1, 1)]
+
+    def test_state_gather_partial(self) -> None:
+        """Test gather() leaves LEDs beyond the indices unchanged."""
+        state = State(report=6, nleds=4)
+        state.colors = [(1, 1, 1), (2, 2, 2), (3, 3, 3), (4, 4, 4)]
+        state.gather([1, 0])
+        assert state.colors == [(2, 2, 2), (1, 1, 1), (3, 3, 3), (4, 4, 4)]
+
+    def test_state_rotate_ring(self) -> None:
+        """Test rotate() moves colors around the Square ring."""
+        state = State.blinkstick_square()
+        state.set_led(0, (255, 0, 0))
+        state.rotate()
+        assert state.get_led(0) == (0, 0, 0)
+        assert state.get_led(1) == (255, 0, 0)
+        state.rotate(-2)
+        assert state.get_led(7) == (255, 0, 0)
@@ -280,3 +280,131 @@ class TestCompuLabFitStatUSB:
         assert mro[1] == ColorableMixin
         assert mro[2].__name__ == "CompuLabBase"
         assert mro[3].__name__ == "Light"
+
+
+class TestCompuLabFitStatUSBSequence:
+    """Test device-side color sequences."""
+
+    @pytest.fixture
+    def fit_statusb(self) -> FitStatUSB:
+        """Create a FitStatUSB with a mock handle."""
+        hardware = Mock(spec=Hardware)
+        hardware.device_id = (0x2047, 0x03DF)
+        hardware.connection_type = ConnectionType.SERIAL
+        hardware.handle = Mock()
+        return FitStatUSB(hardware, reset=False, exclusive=False)
+
+    def test_encode_sequence(self) -> None:
+        """Test steps are encoded as color and four digit duration pairs."""
+        steps = (((255, 0, 0), 500), ((0, 0, 255), 250))
+        expected = b"B#ff0000-0500#0000ff-0250\n"
+        assert FitStatUSB.encode_sequence(steps, 9999) == expected
+
+    def test_encode_sequence_splits_long_steps(self) -> None:
+        """Test steps longer than max_step_ms are split."""
+        steps = (((0, 255, 0), 25000),)
+        expected = b"B#00ff00-9999#00ff00-9999#00ff00-5002\n"
+        assert FitStatUSB.encode_sequence(steps, 9999) == expected
+
+    def test_encode_sequence_is_cached(self) -> None:
+        """Test equal sequences share one encoding."""
+        first = FitStatUSB.encode_sequence((((1, 2, 3), 100),), 9999)
+        second = FitStatUSB.encode_sequence((((1, 2, 3), 100),), 9999)
+        assert first is second
+
+    @pytest.mark.parametrize("steps", [[], [((255, 0, 0), 0)]])
+    def test_invalid_sequence(self, fit_statusb, steps) -> None:
+        """Test empty sequences and non-positive durations are rejected."""
+        with pytest.raises(ValueError, match="step"):
+            fit_statusb.sequence(steps)
+        fit_statusb.hardware.handle.write.assert_not_called()
+
+    def test_sequence_uploads_once(self, fit_statusb) -> None:
+        """Test a sequence is written once and not repeated."""
+        steps = [((255, 0, 0), 500), ((0, 0, 0), 500)]
+        fit_statusb.sequence(steps)
+        fit_statusb.sequence(steps)
+
+        fit_statusb.hardware.handle.write.assert_called_once_with(
+            b"B#ff0000-0500#000000-0500\n"
+        )
+        assert fit_statusb.color == (255, 0, 0)
+
+    def test_on_stops_sequence(self, fit_statusb) -> None:
+        """Test a color change replaces the sequence and allows re-upload."""
+        steps = [((255, 0, 0), 500), ((0, 0, 0), 500)]
+        fit_statusb.sequence(steps)
+        fit_statusb.on((0, 255, 0))
+        fit_statusb.sequence(steps)
+
+        writes = [
+            call.args[0] for call in fit_statusb.hardware.handle.write.call_args_list
+        ]
+        assert writes == [
+            b"B#ff0000-0500#000000-0500\n",
+            b"B#00ff00\n",
+            b"B#ff0000-0500#000000-0500\n",
+        ]
+        assert bytes(fit_statusb) == writes[-1]
+
+    @pytest.mark.asyncio
+    async def test_sequence_without_repeat(self, fit_statusb) -> None:
+        """Test a non-repeating sequence ends on its last color."""
+        fit_statusb.sequence([((255, 0, 0), 10), ((0, 0, 255), 10)], repeat=False)
+        await fit_statusb.tasks["sequence"]
+
+        assert fit_statusb.hardware.handle.write.call_args.args[0] == b"B#0000ff\n"
+        assert fit_statusb.color == (0, 0, 255)
+
+    @pytest.mark.asyncio
+    async def test_on_cancels_pending_finish(self, fit_statusb) -> None:
+        """Test a color change cancels a non-repeating sequence's finish."""
+        fit_statusb.sequence([((255, 0, 0), 10)], repeat=False)
+        fit_statusb.on((0, 255, 0))
+
+        assert "sequence" not in fit_statusb.tasks
+        assert fit_statusb.color == (0, 255, 0)
+
+
+class TestCompuLabFitStatUSBPayloadCache:
+    """Test on() reuses cached colors and commands."""
+
+    @pytest.fixture
+    def fit_statusb(self, monkeypatch) -> FitStatUSB:
+        """Create a FitStatUSB with an eight entry payload cache."""
+        monkeypatch.setattr(FitStatUSB, "payload_cache_size", 8)
+        FitStatUSB.payload_cache.cache_clear()
+        hardware = Mock(spec=Hardware)
+        hardware.device_id = (0x2047, 0x03DF)
+        hardware.handle = Mock()
+        yield FitStatUSB(hardware, reset=False, exclusive=False)
+        FitStatUSB.payload_cache.cache_clear()
+
+    def test_repeated_change_hits(self, fit_statusb) -> None:
+        """Test turning on a color again from the same color is a hit."""
+        for _ in range(2):
+            fit_statusb.on((255, 0, 0))
+            fit_statusb.on((0, 255, 0))
+
+        cache = FitStatUSB.payload_cache()
+        assert (cache.hits, cache.misses) == (1, 3)
+        written = fit_statusb.hardware.handle.write.call_args.args[0]
+        assert written == b"B#00ff00\n"
+
+    def test_sequence_is_not_snapshotted(self, fit_statusb) -> None:
+        """Test a playing sequence cannot be captured by snapshot()."""
+        fit_statusb.sequence([((255, 0, 0), 500), ((0, 0, 255), 500)])
+        assert fit_statusb.snapshot() is None
+
+        fit_statusb.on((0, 255, 0))
+
+        assert fit_statusb.snapshot() == (0, 255, 0)
+        written = fit_statusb.hardware.handle.write.call_args.args[0]
+        assert written == b"B#00ff00\n"
+
+    def test_restore_stops_sequence(self, fit_statusb) -> None:
+        """Test restore() replaces a sequence with the captured color."""
+        fit_statusb.sequence([((255, 0, 0), 500), ((0, 0, 255), 500)])
+        fit_statusb.restore((0, 0, 255))
+
+        assert bytes(fit_statusb) == b"B#0000ff\n"
@@ -2,9 +2,12 @@
 
 from unittest.mock import Mock, patch
 
+import pytest
+
 from busylight_core.hardware import ConnectionType, Hardware
 from busylight_core.vendors.embrava.blynclight import Blynclight
-from busylight_core.vendors.embrava.implementation import FlashSpeed, State
+from busylight_core.vendors.embrava.blynclight_plus import BlynclightPlus
+from busylight_core.vendors.embrava.implementation import Cue, FlashSpeed, State
 
 
 def create_mock_blynclight_hardware() -> Mock:
@@ -94,7 +97,8 @@ class TestBlynclightBytes:
             result = bytes(blynclight)
 
             assert isinstance(result, bytes)
-            assert blynclight.state.off == 1  # Should set off=True when not lit
+            assert result[4] & 0x02  # Off bit is sent when not lit
+            assert blynclight.state.off == 0  # The state is not modified
 
     def test_bytes_flash_disabled_when_off(self) -> None:
         """Test that flash is disabled when light is off."""
@@ -105,10 +109,11 @@ class TestBlynclightBytes:
             blynclight.state.flash = True
             blynclight.color = (0, 0, 0)  # Set RGB to zero - this makes is_lit False
 
-            bytes(blynclight)
+            result = bytes(blynclight)
 
             # Flash should be disabled when light is off
-            assert blynclight.state.flash == 0
+            assert not result[4] & 0x08
+            assert blynclight.state.flash == 1
 
     def test_bytes_dim_disabled_when_off(self) -> None:
         """Test that dim is disabled when light is off."""
@@ -119,10 +124,11 @@ class TestBlynclightBytes:
             blynclight.state.dim = True
             blynclight.color = (0, 0, 0)  # Set RGB to zero - this makes is_lit False
 
-            bytes(blynclight)
+            result = bytes(blynclight)
 
             # Dim should be disabled when light is off
-            assert blynclight.state.dim == 0
+            assert not result[4] & 0x04
+            assert blynclight.state.dim == 1
 
     def test_bytes_flash_preserved_when_on(self) -> None:
         """Test that flash is preserved when light is on."""
@@ -138,6 +144,26 @@ class TestBlynclightBytes:
             # Flash should be preserved when light is on
             assert blynclight.state.flash == 1
 
+    def test_bytes_clears_off_when_lit(self) -> None:
+        """Test a color set after reset is sent with the off bit clear."""
+        mock_hardware = create_mock_blynclight_hardware()
+
+        with patch.object(mock_hardware, "acquire"), patch.object(Blynclight, "reset"):
+            blynclight = Blynclight(mock_hardware)
+            blynclight.state.reset()
+            blynclight.color = (255, 0, 0)
+
+            result = bytes(blynclight)
+
+            assert not result[4] & 0x02
+            assert blynclight.state.off == 1
+
+    def test_state_frame_is_cached(self) -> None:
+        """Test states with the same value share one encoded report."""
+        first, second = State(), State()
+        first.red = second.red = 0xFF
+        assert first.frame() is second.frame()
+
 
 class TestBlynclightDimming:
     """Test dimming functionality."""
@@ -329,11 +355,10 @@ class TestBlynclightIntegration:
             blynclight.state.dim = True
             blynclight.color = (0, 0, 0)  # Set color to zero to make is_lit False
 
-            bytes(blynclight)
+            result = bytes(blynclight)
 
             # Both should be disabled when light is off
-            assert blynclight.state.flash == 0
-            assert blynclight.state.dim == 0
+            assert result[4] == 0x02
 
 
 class TestBlynclightEdgeCases:
@@ -482,3 +507,129 @@ class TestBlynclightOnMethod:
 
             assert blynclight.color == test_color
             mock_update.assert_called_once()
+
+
+class TestBlynclightCue:
+    """Test alert cues combining color, flash and sound."""
+
+    def test_color_only(self) -> None:
+        """Test a color cue is lit, silent and not flashing."""
+        cue = Cue((255, 0, 0))
+        assert cue.frame == bytes([0, 0xFF, 0, 0, 0x10, 0, 0, 0xFF, 0x22])
+
+    def test_color_flash_and_sound(self) -> None:
+        """Test color, flash speed and music are combined in one report."""
+        cue = Cue((255, 0, 0), flash=FlashSpeed.fast, music=3, volume=2, repeat=True)
+        assert cue.frame == bytes([0, 0xFF, 0, 0, 0x48, 0x33, 0x02, 0xFF, 0x22])
+
+    def test_dim(self) -> None:
+        """Test a dim cue sets the dim bit."""
+        assert Cue((0, 0, 255), dim=True).frame[4] == 0x14
+
+    def test_black_cue_is_off(self) -> None:
+        """Test a cue without color is sent as off, keeping its sound."""
+        cue = Cue((0, 0, 0), flash=FlashSpeed.fast, dim=True, music=1)
+        assert cue.frame[4] == 0x42
+        assert cue.frame[5] == 0x11
+
+    def test_cues_are_immutable_and_hashable(self) -> None:
+        """Test equal cues compare and hash equal and share a report."""
+        first = Cue((0, 255, 0), music=5)
+        second = Cue((0, 255, 0), music=5)
+        assert first == second
+        assert len({first, second}) == 1
+        assert first.frame is second.frame
+        with pytest.raises(AttributeError):
+            first.music = 6
+
+    def test_alert_single_write(self) -> None:
+        """Test alert sends color, flash and sound in one write."""
+        mock_hardware = create_mock_blynclight_hardware()
+        mock_hardware.device_id = (0x2C0D, 0x0002)
+        cue = Cue((255, 0, 0), flash=FlashSpeed.medium, music=2, volume=3)
+
+        light = BlynclightPlus(mock_hardware, reset=False, exclusive=False)
+        light.alert(cue)
+
+        mock_hardware.handle.write.assert_called_once_with(cue.frame)
+        assert light.color == (255, 0, 0)
+        assert light.state.play == 1
+        assert light.state.speed == FlashSpeed.medium
+
+    def test_alert_writes_cue_frame(self) -> None:
+        """Test alert writes the cue's report without encoding the state."""
+        mock_hardware = create_mock_blynclight_hardware()
+        mock_hardware.device_id = (0x2C0D, 0x0002)
+        cue = Cue((0, 255, 0), flash=FlashSpeed.slow)
+        frame = cue.frame
+
+        light = BlynclightPlus(mock_hardware, reset=False, exclusive=False)
+        with patch.object(State, "encode") as encode:
+            light.alert(cue)
+
+        encode.assert_not_called()
+        mock_hardware.handle.write.assert_called_once_with(frame)
+
+    def test_nested_helpers_single_write(self) -> None:
+        """Test helpers called inside a batch are written together."""
+        mock_hardware = create_mock_blynclight_hardware()
+        mock_hardware.device_id = (0x2C0D, 0x0002)
+
+        light = BlynclightPlus(mock_hardware, reset=False, exclusive=False)
+        with light.batch_update():
+            light.on((255, 0, 0))
+            light.flash((255, 0, 0), FlashSpeed.fast)
+            light.play_sound(music=3)
+
+        mock_hardware.handle.write.assert_called_once()
+        assert light.stats.coalesced == 3
+
+    def test_alert_replaces_state(self) -> None:
+        """Test alert clears settings the cue does not include."""
+        mock_hardware = create_mock_blynclight_hardware()
+        mock_hardware.device_id = (0x2C0D, 0x0002)
+
+        light = BlynclightPlus(mock_hardware, reset=False, exclusive=False)
+        light.play_sound(music=4)
+        light.mute()
+        light.alert(Cue((0, 0, 255)))
+
+        assert light.state.play == 0
+        assert light.state.mute == 0
+        assert mock_hardware.handle.write.call_args.args[0] == Cue((0, 0, 255)).frame
+
+
+class TestBlynclightPayloadCache:
+    """Test on() reuses cached states and reports."""
+
+    @pytest.fixture
+    def light(self, monkeypatch) -> Blynclight:
+        """Create a Blynclight with an eight entry payload cache."""
+        monkeypatch.setattr(Blynclight, "payload_cache_size", 8)
+        Blynclight.payload_cache.cache_clear()
+        yield Blynclight(
+            create_mock_blynclight_hardware(), reset=False, exclusive=False
+        )
+        Blynclight.payload_cache.cache_clear()
+
+    def test_repeated_change_hits(self, light) -> None:
+        """Test turning on a color again from the same state is a hit."""
+        for _ in range(2):
+            light.on((255, 0, 0))
+            light.on((0, 255, 0))
+
+        cache = Blynclight.payload_cache()
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert light.color == (0, 255, 0)
+        written = light.hardware.handle.write.call_args.args[0]
+        assert written == light.state.frame()
+
+    def test_prior_state_is_part_of_key(self, light) -> None:
+        """Test the same color from a different state is not a hit."""
+        light.on((255, 0, 0))
+        light.off()
+        light.flash((0, 0, 255))
+        light.on((255, 0, 0))
+
+        assert Blynclight.payload_cache().hits == 0
+        assert light.state.flash == 1
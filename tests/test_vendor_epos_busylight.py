@@ -4,7 +4,9 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from busylight_core.exceptions import LightUnavailableError
 from busylight_core.hardware import ConnectionType, Hardware
+from busylight_core.mixins import WordSnapshotMixin
 from busylight_core.vendors.epos import Busylight
 from busylight_core.vendors.epos.epos_base import EPOSBase
 from busylight_core.vendors.epos.implementation import Action, Report, State
@@ -84,6 +86,16 @@ class TestEPOSBusylightState:
         assert state.color0 == (0, 0, 0)
         assert state.color1 == (0, 0, 0)
 
+    def test_state_set_colors(self) -> None:
+        """Test set_colors prepares a SetColor report for both LEDs."""
+        state = State()
+        state.set_colors((255, 0, 0), (0, 0, 255))
+        assert state.report == Report.ONE
+        assert state.action == Action.SetColor
+        assert state.color0 == (255, 0, 0)
+        assert state.color1 == (0, 0, 255)
+        assert bytes(state) == bytes([1, 0x12, 0x02, 255, 0, 0, 0, 0, 255, 0])
+
 
 class TestEPOSBusylight:
     """Test the main Busylight class."""
@@ -167,7 +179,7 @@ class TestEPOSBusylight:
         """Test reset() method calls state.clear() and super().reset()."""
         with (
             patch.object(busylight.state, "clear") as mock_state_reset,
-            patch.object(busylight.__class__.__bases__[0], "reset") as mock_super_reset,
+            patch.object(EPOSBase, "reset") as mock_super_reset,
         ):
             busylight.reset()
 
@@ -236,7 +248,114 @@ class TestEPOSBusylight:
         """Test MRO follows expected pattern."""
         mro = Busylight.__mro__
 
-        # Should be: Busylight -> EPOSBase -> Light -> ...
+        # Should be: Busylight -> WordSnapshotMixin -> EPOSBase -> Light -> ...
         assert mro[0] == Busylight
-        assert mro[1].__name__ == "EPOSBase"
-        assert mro[2].__name__ == "Light"
+        assert mro[1] == WordSnapshotMixin
+        assert mro[2].__name__ == "EPOSBase"
+        assert mro[3].__name__ == "Light"
+
+
+class TestEPOSBusylightLEDs:
+    """Test setting both EPOS Busylight LEDs with single reports."""
+
+    @pytest.fixture
+    def busylight(self) -> Busylight:
+        """Create a Busylight with a mock HID handle."""
+        hardware = Mock(spec=Hardware)
+        hardware.device_id = (0x1395, 0x0074)
+        hardware.connection_type = ConnectionType.HID
+        hardware.handle = Mock()
+        return Busylight(hardware, reset=False, exclusive=False)
+
+    @property
+    def red_blue(self) -> bytes:
+        """Report showing red on the first LED and blue on the second."""
+        return bytes([1, 0x12, 0x02, 255, 0, 0, 0, 0, 255, 0])
+
+    def test_set_leds_single_report(self, busylight) -> None:
+        """Test two different colors are written in one report."""
+        busylight.set_leds((255, 0, 0), (0, 0, 255))
+        busylight.hardware.handle.write.assert_called_once_with(self.red_blue)
+        assert busylight.get_led(1) == (255, 0, 0)
+        assert busylight.get_led(2) == (0, 0, 255)
+
+    def test_unchanged_leds_are_not_written(self, busylight) -> None:
+        """Test repeating the colors the device shows writes nothing."""
+        busylight.set_leds((255, 0, 0), (0, 0, 255))
+        busylight.set_leds((255, 0, 0), (0, 0, 255))
+        busylight.on((0, 0, 255), led=2)
+        busylight.hardware.handle.write.assert_called_once()
+
+    def test_on_single_led_keeps_other(self, busylight) -> None:
+        """Test on() for one LED rewrites the other LED's color unchanged."""
+        busylight.on((255, 0, 0), led=1)
+        busylight.on((0, 0, 255), led=2)
+        assert busylight.hardware.handle.write.call_args.args[0] == self.red_blue
+        assert busylight.hardware.handle.write.call_count == 2
+
+    def test_failed_write_is_retried(self, busylight) -> None:
+        """Test colors are written again after a failed write."""
+        busylight.hardware.handle.write.side_effect = [OSError, None]
+        with pytest.raises(LightUnavailableError):
+            busylight.set_leds((255, 0, 0), (0, 0, 255))
+        busylight.set_leds((255, 0, 0), (0, 0, 255))
+        assert busylight.hardware.handle.write.call_count == 2
+
+    def test_reset_always_writes(self, busylight) -> None:
+        """Test reset turns the LEDs off even if they appear to be off."""
+        busylight.off()
+        busylight.reset()
+        assert busylight.hardware.handle.write.call_count == 2
+
+
+class TestEPOSBusylightPayloadCache:
+    """Test on() reuses cached states and reports."""
+
+    @pytest.fixture
+    def busylight(self, monkeypatch) -> Busylight:
+        """Create a Busylight with an eight entry payload cache."""
+        monkeypatch.setattr(Busylight, "payload_cache_size", 8)
+        Busylight.payload_cache.cache_clear()
+        hardware = Mock(spec=Hardware)
+        hardware.device_id = (0x1395, 0x0074)
+        hardware.connection_type = ConnectionType.HID
+        hardware.handle = Mock()
+        yield Busylight(hardware, reset=False, exclusive=False)
+        Busylight.payload_cache.cache_clear()
+
+    def test_repeated_change_hits(self, busylight) -> None:
+        """Test repeating a change from the same state is a cache hit."""
+        busylight.off()
+        for _ in range(2):
+            busylight.on((255, 0, 0), led=1)
+            busylight.on((0, 0, 255), led=2)
+            busylight.off()
+
+        cache = Busylight.payload_cache()
+        assert (cache.hits, cache.misses) == (3, 4)
+        assert busylight.hardware.handle.write.call_count == 7
+
+    def test_cached_report_matches_state(self, busylight) -> None:
+        """Test a cached change restores the state and writes its report."""
+        busylight.off()
+        busylight.on((255, 0, 0), led=1)
+        busylight.on((0, 0, 255), led=2)
+        busylight.off()
+        busylight.on((255, 0, 0), led=1)
+        busylight.on((0, 0, 255), led=2)
+
+        assert Busylight.payload_cache().hits == 2
+        assert busylight.get_led(1) == (255, 0, 0)
+        assert busylight.get_led(2) == (0, 0, 255)
+        written = busylight.hardware.handle.write.call_args.args[0]
+        assert written == bytes(busylight)
+
+    def test_cache_disabled_by_default(self, busylight, monkeypatch) -> None:
+        """Test on() does not use the cache when payload_cache_size is 0."""
+        monkeypatch.setattr(Busylight, "payload_cache_size", 0)
+        busylight.on((255, 0, 0))
+        busylight.off()
+        busylight.on((255, 0, 0))
+
+        cache = Busylight.payload_cache()
+        assert (cache.hits, cache.misses) == (0, 0)
@@ -221,6 +221,14 @@ class TestKuandoBusylightBase:
             len(state_bytes) == 64
         )  # State should be 7 steps + 1 footer * 8 bytes each
 
+    def test_repeated_updates_are_written(self, busylight) -> None:
+        """Test keep alive packets are not elided as unchanged writes."""
+        busylight.platform = "Linux"
+        busylight.update()
+        busylight.update()
+        assert busylight.hardware.handle.write.call_count == 2
+        assert busylight.stats.elided == 0
+
     def test_on_method(self, busylight) -> None:
         """Test on() method with color."""
         color = (255, 128, 64)
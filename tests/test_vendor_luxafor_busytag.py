@@ -1,12 +1,90 @@
 """Tests for Luxafor BusyTag implementation."""
 
+import queue
+import threading
+from concurrent.futures import CancelledError
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from unittest.mock import Mock, patch
 
 import pytest
 
+from busylight_core.exceptions import LightUnavailableError
 from busylight_core.hardware import ConnectionType, Hardware
 from busylight_core.vendors.luxafor import BusyTag
-from busylight_core.vendors.luxafor._busytag import Command
+from busylight_core.vendors.luxafor._busytag import (
+    Command,
+    Response,
+    Transport,
+    Upload,
+    UploadProgress,
+)
+
+
+class FakeSerial:
+    """Serial handle that answers AT commands from a table of replies."""
+
+    def __init__(self, replies: dict[bytes, bytes] | None = None) -> None:
+        """Create a handle answering commands with replies, OK by default."""
+        self.replies = replies or {}
+        self.written: list[bytes] = []
+        self.incoming: queue.Queue[bytes] = queue.Queue()
+        self.hold = threading.Event()
+        self.hold.set()
+        self.in_waiting = 0
+        self.out_waiting = 0
+        self.port = "/dev/fake"
+        self.stored = bytearray()
+        self.remaining = 0
+
+    def write(self, data: bytes) -> int:
+        """Record data and queue the reply to the command it carries.
+
+        Data following an AT+UF upload command is stored rather than
+        parsed, and the upload is acknowledged once all of it arrived.
+        """
+        data = bytes(data)
+        self.written.append(data)
+
+        if self.remaining:
+            self.stored += data
+            self.remaining -= len(data)
+            if self.remaining <= 0:
+                self.incoming.put(self.replies.get(b"upload", b"OK\r\n"))
+            return len(data)
+
+        command = data.rstrip(b"\r\n")
+        if command.startswith(b"AT+UF="):
+            self.stored.clear()
+            self.remaining = int(command.rpartition(b",")[2])
+            return len(data)
+
+        reply = self.replies.get(command, b"OK\r\n")
+        if reply:
+            self.incoming.put(reply)
+        return len(data)
+
+    def read(self, size: int = 1) -> bytes:
+        """Return the next queued reply, waiting briefly for one."""
+        self.hold.wait()
+        try:
+            data = self.incoming.get(timeout=0.01)
+        except queue.Empty:
+            return b""
+        if isinstance(data, Exception):
+            raise data
+        return data
+
+
+@pytest.fixture
+def busytag(handle) -> BusyTag:
+    """Create a BusyTag attached to the test class's fake handle."""
+    hardware = Mock(spec=Hardware)
+    hardware.device_id = (0x303A, 0x81DF)
+    hardware.connection_type = ConnectionType.SERIAL
+    hardware.handle = handle
+    busytag = BusyTag(hardware, reset=False, exclusive=True)
+    yield busytag
+    busytag.release()
 
 
 class TestLuxaforBusyTagCommand:
@@ -26,6 +104,11 @@ class TestLuxaforBusyTagCommand:
         assert Command.GetLastResetReasonCore0 == "AT+GLRR0"
         assert Command.GetLastResetReasonCore1 == "AT+GLRR1"
         assert Command.SolidColor == "AT+SC={leds},{red:02x}{green:02x}{blue:02x}"
+        assert Command.UploadFile == "AT+UF={name},{size}"
+
+    def test_upload_file_method(self) -> None:
+        """Test upload_file formats the file name and size."""
+        assert Command.upload_file("away.png", 1234) == "AT+UF=away.png,1234"
 
     def test_solid_color_method_all_leds(self) -> None:
         """Test solid_color method with all LEDs (led=0)."""
@@ -329,3 +412,552 @@ class TestLuxaforBusyTag:
 
             # Color should also be set
             assert busytag.color == color
+
+
+class TestLuxaforBusyTagResponse:
+    """Test the Response returned for AT commands."""
+
+    def test_value_strips_tag(self) -> None:
+        """Test value returns the payload after the response tag."""
+        response = Response("AT+GDN", ("+DN:busytag-3EC5C8",))
+        assert response.value == "busytag-3EC5C8"
+
+    def test_value_without_tag(self) -> None:
+        """Test value returns untagged lines unchanged."""
+        assert Response("AT+GDN", ("busytag",)).value == "busytag"
+
+    def test_value_without_lines(self) -> None:
+        """Test value is empty when the device only acknowledged."""
+        assert Response("AT+SC=127,ffffff").value == ""
+
+
+class TestLuxaforBusyTagTransport:
+    """Test the pipelined AT command transport."""
+
+    @pytest.fixture
+    def handle(self) -> FakeSerial:
+        """Create a fake Busy Tag serial handle."""
+        return FakeSerial(
+            {
+                b"AT+GDN": b"+DN:busytag-3EC5C8\r\nOK\r\n",
+                b"AT+GMN": b"+MN:Greynut\r\nOK\r\n",
+                b"AT+GLEC": b"ERROR\r\n",
+            }
+        )
+
+    @pytest.fixture
+    def transport(self, handle) -> Transport:
+        """Create a transport for the fake handle."""
+        transport = Transport(handle)
+        yield transport
+        transport.stop(timeout=1)
+
+    def test_submit_appends_terminator(self, transport, handle) -> None:
+        """Test commands are written with a single line terminator."""
+        transport.request("AT+GDN")
+        transport.request(b"AT+GMN\r\n")
+        assert handle.written == [b"AT+GDN\r\n", b"AT+GMN\r\n"]
+
+    def test_commands_are_pipelined(self, transport, handle) -> None:
+        """Test commands are written before earlier responses arrive."""
+        handle.hold.clear()
+        futures = [transport.submit(c) for c in ("AT+GDN", "AT+SC=127,ff0000")]
+        futures.append(transport.submit("AT+GMN"))
+
+        assert len(handle.written) == 3
+        assert transport.pending == 3
+        assert not any(future.done() for future in futures)
+
+        handle.hold.set()
+        name, color, maker = (future.result(timeout=1) for future in futures)
+
+        assert name == Response("AT+GDN", ("+DN:busytag-3EC5C8",))
+        assert color == Response("AT+SC=127,ff0000")
+        assert maker.value == "Greynut"
+        assert transport.pending == 0
+
+    def test_error_response(self, transport) -> None:
+        """Test ERROR completes the command with ok False."""
+        response = transport.request("AT+GLEC")
+        assert not response.ok
+        assert response.lines == ()
+
+    def test_request_timeout(self, transport, handle) -> None:
+        """Test request raises TimeoutError when the device is silent."""
+        handle.replies[b"AT+GID"] = b""
+        with pytest.raises(FutureTimeoutError):
+            transport.request("AT+GID", timeout=0.05)
+
+    def test_stop_fails_pending(self, transport, handle) -> None:
+        """Test stopping the transport fails outstanding commands."""
+        handle.hold.clear()
+        future = transport.submit("AT+GDN")
+        transport.stop(timeout=0)
+        handle.hold.set()
+        with pytest.raises(ConnectionAbortedError):
+            future.result(timeout=1)
+
+    def test_read_error_fails_pending(self, transport, handle) -> None:
+        """Test a failing serial handle fails outstanding commands."""
+        handle.replies[b"AT+GID"] = b""
+        future = transport.submit("AT+GID")
+        handle.incoming.put(OSError("unplugged"))
+        with pytest.raises(OSError, match="unplugged"):
+            future.result(timeout=1)
+
+    def test_write_error_is_not_pending(self, transport) -> None:
+        """Test a failed write does not leave a pending command behind."""
+        transport.handle = Mock()
+        transport.handle.write.side_effect = OSError("unplugged")
+        with pytest.raises(OSError, match="unplugged"):
+            transport.submit("AT+GDN")
+        assert transport.pending == 0
+
+
+class TestLuxaforBusyTagTransportParsing:
+    """Test response parsing without a reader thread."""
+
+    @pytest.fixture
+    def transport(self) -> Transport:
+        """Create a transport whose reader thread never starts."""
+        transport = Transport(FakeSerial({b"AT+GDN": b"", b"AT+GPL": b""}))
+        transport.start = Mock()
+        return transport
+
+    def test_partial_lines(self, transport) -> None:
+        """Test responses split across reads are reassembled."""
+        future = transport.submit("AT+GDN")
+        transport.feed(b"+DN:busy")
+        transport.feed(b"tag\r")
+        assert not future.done()
+        transport.feed(b"\nOK\r\n")
+        assert future.result(timeout=0).value == "busytag"
+
+    def test_multiline_response(self, transport) -> None:
+        """Test every line before OK belongs to the response."""
+        future = transport.submit("AT+GPL")
+        transport.feed(b"+PL:a.png\r\n+PL:b.gif\r\n\r\nOK\r\n")
+        assert future.result(timeout=0).lines == ("+PL:a.png", "+PL:b.gif")
+
+    def test_echo_is_ignored(self, transport) -> None:
+        """Test a command echoed by the device is not part of its response."""
+        future = transport.submit("AT+GDN")
+        transport.feed(b"AT+GDN\r\n+DN:busytag\r\nOK\r\n")
+        assert future.result(timeout=0).lines == ("+DN:busytag",)
+
+    def test_unsolicited_lines_are_dropped(self, transport) -> None:
+        """Test output with no outstanding command is discarded."""
+        transport.feed(b"booting\r\nOK\r\n")
+        future = transport.submit("AT+GDN")
+        transport.feed(b"+DN:busytag\r\nOK\r\n")
+        assert future.result(timeout=0).lines == ("+DN:busytag",)
+
+
+class TestLuxaforBusyTagQueries:
+    """Test BusyTag commands sent through the transport."""
+
+    @pytest.fixture
+    def handle(self) -> FakeSerial:
+        """Create a fake Busy Tag serial handle."""
+        return FakeSerial({b"AT+GDN": b"+DN:busytag-3EC5C8\r\nOK\r\n"})
+
+    def test_on_writes_through_transport(self, busytag, handle) -> None:
+        """Test color changes are written as terminated AT commands."""
+        busytag.on((255, 128, 64))
+        assert handle.written == [b"AT+SC=127,ff8040\r\n"]
+
+    def test_on_does_not_wait_for_response(self, busytag, handle) -> None:
+        """Test color changes return before the device answers."""
+        handle.hold.clear()
+        busytag.on((255, 0, 0))
+        busytag.on((0, 255, 0))
+        assert busytag.transport.pending == 2
+        handle.hold.set()
+
+    def test_query(self, busytag) -> None:
+        """Test query waits for the matching response."""
+        busytag.on((255, 0, 0))
+        assert busytag.query(Command.GetDeviceName).value == "busytag-3EC5C8"
+
+    def test_submit(self, busytag) -> None:
+        """Test submit returns a Future for the response."""
+        future = busytag.submit(Command.GetDeviceName)
+        assert future.result(timeout=1).ok
+
+    def test_repeated_color_is_elided(self, busytag, handle) -> None:
+        """Test setting the color already shown writes nothing."""
+        busytag.on((255, 0, 0))
+        busytag.on((255, 0, 0))
+        assert handle.written == [b"AT+SC=127,ff0000\r\n"]
+
+    def test_submit_forces_next_color(self, busytag, handle) -> None:
+        """Test a submitted command forces the next color to be written."""
+        busytag.on((255, 0, 0))
+        busytag.submit(Command.solid_color((0, 0, 255))).result(timeout=1)
+        busytag.on((255, 0, 0))
+        assert handle.written.count(b"AT+SC=127,ff0000\r\n") == 2
+
+    def test_query_forces_next_color(self, busytag, handle) -> None:
+        """Test a queried command that changes the display forces a write."""
+        busytag.on((255, 0, 0))
+        busytag.query(Command.solid_color((0, 0, 255)))
+        busytag.on((255, 0, 0))
+        assert handle.written.count(b"AT+SC=127,ff0000\r\n") == 2
+
+    def test_read_only_submit_keeps_color(self, busytag, handle) -> None:
+        """Test a submitted query does not force the next color to be written."""
+        busytag.on((255, 0, 0))
+        busytag.submit(Command.GetDeviceName).result(timeout=1)
+        busytag.on((255, 0, 0))
+        assert handle.written.count(b"AT+SC=127,ff0000\r\n") == 1
+
+    def test_read_only_query_keeps_color(self, busytag, handle) -> None:
+        """Test a metadata query does not force the next color to be written."""
+        busytag.on((255, 0, 0))
+        busytag.query(Command.GetDeviceName)
+        busytag.on((255, 0, 0))
+        assert handle.written.count(b"AT+SC=127,ff0000\r\n") == 1
+
+    def test_write_failure(self, busytag, handle) -> None:
+        """Test transport write failures surface as LightUnavailableError."""
+        handle.write = Mock(side_effect=OSError("unplugged"))
+        with pytest.raises(LightUnavailableError):
+            busytag.on((255, 0, 0))
+
+    def test_release_stops_transport(self, busytag) -> None:
+        """Test releasing the light fails outstanding commands."""
+        busytag.transport.handle.hold.clear()
+        future = busytag.submit(Command.GetDeviceName)
+        busytag.release()
+        busytag.transport.handle.hold.set()
+        with pytest.raises(ConnectionAbortedError):
+            future.result(timeout=1)
+
+
+class TestLuxaforBusyTagMetadata:
+    """Test typed, cached BusyTag metadata queries."""
+
+    @pytest.fixture
+    def handle(self) -> FakeSerial:
+        """Create a fake Busy Tag answering every metadata query."""
+        return FakeSerial(
+            {
+                b"AT+GDN": b"+DN:busytag-3EC5C8\r\nOK\r\n",
+                b"AT+GMN": b"+MN:Greynut\r\nOK\r\n",
+                b"AT+GID": b"+ID:3EC5C8\r\nOK\r\n",
+                b"AT+GTSS": b"+TSS:8388608\r\nOK\r\n",
+                b"AT+GFSS": b"+FSS:4194304\r\nOK\r\n",
+                b"AT+GLHA": b"+LHA:http://192.168.4.1\r\nOK\r\n",
+                b"AT+GLEC": b"+LEC:0\r\nOK\r\n",
+            }
+        )
+
+    @pytest.mark.parametrize(
+        ("method", "command", "expected"),
+        [
+            ("get_device_name", b"AT+GDN\r\n", "busytag-3EC5C8"),
+            ("get_manufacturer_name", b"AT+GMN\r\n", "Greynut"),
+            ("get_device_id", b"AT+GID\r\n", "3EC5C8"),
+            ("get_total_storage_size", b"AT+GTSS\r\n", 8388608),
+        ],
+    )
+    def test_facts_are_queried_once(
+        self, busytag, handle, method, command, expected
+    ) -> None:
+        """Test immutable properties cost one round trip per lifetime."""
+        assert getattr(busytag, method)() == expected
+        assert getattr(busytag, method)() == expected
+        assert handle.written == [command]
+
+    def test_facts_are_per_device(self, busytag, handle) -> None:
+        """Test each light caches its own facts."""
+        hardware = Mock(spec=Hardware)
+        hardware.device_id = (0x303A, 0x81DF)
+        hardware.handle = FakeSerial({b"AT+GDN": b"+DN:busytag-000001\r\nOK\r\n"})
+        other = BusyTag(hardware, reset=False, exclusive=True)
+
+        assert busytag.get_device_name() == "busytag-3EC5C8"
+        assert other.get_device_name() == "busytag-000001"
+        assert handle.written == [b"AT+GDN\r\n"]
+        other.release()
+
+    def test_free_storage_is_cached(self, busytag, handle) -> None:
+        """Test free storage is served from the cache within the TTL."""
+        assert busytag.get_free_storage_size() == 4194304
+        assert busytag.get_free_storage_size() == 4194304
+        assert handle.written == [b"AT+GFSS\r\n"]
+
+    def test_free_storage_expires(self, busytag, handle) -> None:
+        """Test free storage is queried again once the TTL has passed."""
+        with patch("time.monotonic", side_effect=[100.0, 100.0 + busytag.readback_ttl]):
+            busytag.get_free_storage_size()
+            busytag.get_free_storage_size()
+        assert handle.written == [b"AT+GFSS\r\n"] * 2
+
+    def test_free_storage_max_age(self, busytag, handle) -> None:
+        """Test max_age=0 always queries the device."""
+        busytag.get_free_storage_size()
+        busytag.get_free_storage_size(max_age=0)
+        assert handle.written == [b"AT+GFSS\r\n"] * 2
+
+    def test_invalidate_readings(self, busytag, handle) -> None:
+        """Test invalidate_readings discards volatile replies only."""
+        busytag.get_device_name()
+        busytag.get_local_host_address()
+        busytag.invalidate_readings()
+        busytag.get_device_name()
+        assert busytag.get_local_host_address() == "http://192.168.4.1"
+        assert handle.written == [b"AT+GDN\r\n", b"AT+GLHA\r\n", b"AT+GLHA\r\n"]
+
+    def test_last_error_code_is_not_cached(self, busytag, handle) -> None:
+        """Test the last error code is read every time."""
+        assert busytag.get_last_error_code() == 0
+        assert busytag.get_last_error_code() == 0
+        assert handle.written == [b"AT+GLEC\r\n"] * 2
+
+    def test_rejected_query(self, busytag, handle) -> None:
+        """Test an ERROR reply raises LightUnavailableError and is not cached."""
+        handle.replies[b"AT+GDN"] = b"ERROR\r\n"
+        with pytest.raises(LightUnavailableError):
+            busytag.get_device_name()
+        handle.replies[b"AT+GDN"] = b"+DN:busytag\r\nOK\r\n"
+        assert busytag.get_device_name() == "busytag"
+
+    def test_silent_device(self, busytag, handle) -> None:
+        """Test a query timeout raises LightUnavailableError."""
+        handle.replies[b"AT+GID"] = b""
+        with (
+            patch.object(busytag, "query", side_effect=FutureTimeoutError),
+            pytest.raises(LightUnavailableError),
+        ):
+            busytag.get_device_id()
+
+    def test_malformed_integer(self, busytag, handle) -> None:
+        """Test a non-numeric storage size raises LightUnavailableError."""
+        handle.replies[b"AT+GFSS"] = b"+FSS:lots\r\nOK\r\n"
+        with pytest.raises(LightUnavailableError):
+            busytag.get_free_storage_size()
+
+    @pytest.mark.parametrize(
+        ("method", "command", "reply"),
+        [
+            ("get_total_storage_size", b"AT+GTSS", b"+TSS:8388608\r\nOK\r\n"),
+            ("get_free_storage_size", b"AT+GFSS", b"+FSS:4194304\r\nOK\r\n"),
+        ],
+    )
+    def test_malformed_integer_is_not_cached(
+        self, busytag, handle, method, command, reply
+    ) -> None:
+        """Test a malformed reply is queried again rather than served from cache."""
+        handle.replies[command] = b"+XX:lots\r\nOK\r\n"
+        with pytest.raises(LightUnavailableError):
+            getattr(busytag, method)()
+        handle.replies[command] = reply
+        assert getattr(busytag, method)() in (8388608, 4194304)
+
+
+class TestLuxaforBusyTagUploadProgress:
+    """Test UploadProgress snapshots."""
+
+    def test_fraction(self) -> None:
+        """Test fraction is the share of bytes written."""
+        assert UploadProgress(256, 1024, 1.0).fraction == 0.25
+
+    def test_fraction_empty(self) -> None:
+        """Test an empty upload is complete."""
+        assert UploadProgress(0, 0, 0.0).fraction == 1.0
+
+    def test_throughput(self) -> None:
+        """Test throughput is bytes written per second."""
+        assert UploadProgress(2048, 4096, 0.5).throughput == 4096.0
+
+    def test_throughput_before_start(self) -> None:
+        """Test throughput is zero before any time has elapsed."""
+        assert UploadProgress(0, 4096, 0.0).throughput == 0.0
+
+
+class TestLuxaforBusyTagUpload:
+    """Test streaming files and buffers to a BusyTag."""
+
+    @pytest.fixture
+    def handle(self) -> FakeSerial:
+        """Create a fake Busy Tag with known free storage."""
+        return FakeSerial({b"AT+GFSS": b"+FSS:4194304\r\nOK\r\n"})
+
+    @pytest.fixture
+    def data(self) -> bytes:
+        """Picture data spanning several chunks."""
+        return bytes(range(256)) * 40
+
+    def test_upload_buffer(self, busytag, handle, data) -> None:
+        """Test a buffer is streamed in chunks after the upload command."""
+        upload = busytag.upload(data, "busy.png", chunk_size=4096)
+
+        assert upload.result(timeout=1).ok
+        assert handle.written[0] == b"AT+UF=busy.png,10240\r\n"
+        assert [len(chunk) for chunk in handle.written[1:]] == [4096, 4096, 2048]
+        assert handle.stored == data
+        assert upload.done()
+        assert not upload.cancelled()
+
+    def test_upload_file(self, busytag, handle, data, tmp_path) -> None:
+        """Test a file is streamed under its own name by default."""
+        path = tmp_path / "away.gif"
+        path.write_bytes(data)
+
+        upload = busytag.upload(path, chunk_size=1000)
+
+        assert upload.result(timeout=1).ok
+        assert handle.written[0] == b"AT+UF=away.gif,10240\r\n"
+        assert len(handle.written) == 12
+        assert handle.stored == data
+
+    def test_upload_buffer_requires_name(self, busytag, data) -> None:
+        """Test bytes-like sources must be given a file name."""
+        with pytest.raises(ValueError, match="name is required"):
+            busytag.upload(data)
+
+    def test_progress(self, busytag, data) -> None:
+        """Test on_progress reports every chunk."""
+        reports = []
+        upload = busytag.upload(
+            data, "busy.png", chunk_size=4096, on_progress=reports.append
+        )
+        upload.result(timeout=1)
+
+        assert [report.sent for report in reports] == [4096, 8192, 10240]
+        assert reports[-1].fraction == 1.0
+        assert upload.progress.sent == upload.progress.total == len(data)
+        assert upload.progress.elapsed >= 0.0
+
+    def test_cancel(self, busytag, handle, data) -> None:
+        """Test cancelling stops streaming before the next chunk."""
+
+        def cancel(_progress: UploadProgress) -> None:
+            upload.cancel()
+
+        upload = Upload(
+            busytag.transport, "busy.png", data, chunk_size=4096, on_progress=cancel
+        )
+        upload.start()
+
+        with pytest.raises(CancelledError):
+            upload.result(timeout=1)
+        assert upload.cancelled()
+        assert handle.stored == data[:4096] + bytes(len(data) - 4096)
+
+    def test_commands_after_cancel(self, busytag, handle, data) -> None:
+        """Test replies are matched to their commands after a cancelled upload."""
+        handle.replies[b"AT+GDN"] = b"+DN:busytag-3EC5C8\r\nOK\r\n"
+        upload = Upload(busytag.transport, "busy.png", data, chunk_size=4096)
+        upload.cancel()
+        upload.start()
+
+        with pytest.raises(CancelledError):
+            upload.result(timeout=1)
+
+        assert busytag.transport.request("AT+GDN").value == "busytag-3EC5C8"
+        assert busytag.transport.pending == 0
+
+    def test_failed_chunk_is_not_pending(self, busytag, handle, data) -> None:
+        """Test a failed chunk write does not leave the upload pending."""
+        write = handle.write
+
+        def fail_data(chunk: bytes) -> int:
+            if handle.remaining:
+                msg = "unplugged"
+                raise OSError(msg)
+            return write(chunk)
+
+        handle.write = fail_data
+        upload = busytag.upload(data, "busy.png", chunk_size=4096)
+
+        with pytest.raises(OSError, match="unplugged"):
+            upload.result(timeout=1)
+        assert busytag.transport.pending == 0
+
+    def test_buffer_chunks_are_views(self, busytag, data) -> None:
+        """Test bytes-like sources are sliced without copying."""
+        upload = Upload(busytag.transport, "busy.png", data, chunk_size=4096)
+        chunks = list(upload.chunks())
+        assert all(chunk.obj is data for chunk in chunks)
+        assert b"".join(chunks) == data
+
+    def test_file_chunks_reuse_buffer(self, busytag, data, tmp_path) -> None:
+        """Test files are read into a single reused buffer."""
+        path = tmp_path / "busy.png"
+        path.write_bytes(data)
+        upload = Upload(busytag.transport, "busy.png", path, chunk_size=4096)
+
+        buffers = {id(chunk.obj) for chunk in upload.chunks()}
+
+        assert len(buffers) == 1
+
+    def test_commands_wait_for_stream(self, busytag, handle, data) -> None:
+        """Test commands sent mid-upload are written after the data."""
+        senders = []
+
+        def send_color(_progress: UploadProgress) -> None:
+            if not senders:
+                sender = threading.Thread(target=busytag.on, args=((255, 0, 0),))
+                senders.append(sender)
+                sender.start()
+
+        busytag.upload(
+            data, "busy.png", chunk_size=4096, on_progress=send_color
+        ).result(timeout=1)
+        senders[0].join(timeout=1)
+
+        assert handle.written[-1] == b"AT+SC=127,ff0000\r\n"
+        assert handle.stored == data
+
+    def test_colors_do_not_wait_for_stream(self, busytag, handle, data) -> None:
+        """Test on() returns mid-upload and only the latest color is queued."""
+        queued = []
+
+        def send_colors(progress: UploadProgress) -> None:
+            if progress.sent == 4096:
+                busytag.on((255, 0, 0))
+                busytag.on((0, 0, 255))
+                queued.extend(handle.written)
+
+        busytag.upload(
+            data, "busy.png", chunk_size=4096, on_progress=send_colors
+        ).result(timeout=1)
+
+        assert len(queued) == 2
+        assert handle.written[-1] == b"AT+SC=127,0000ff\r\n"
+        assert b"AT+SC=127,ff0000\r\n" not in handle.written
+
+    def test_flow_control(self, busytag, handle, data) -> None:
+        """Test streaming pauses while the serial driver is backed up."""
+        handle.out_waiting = Transport.high_water + 1
+
+        def drained(_interval: float) -> None:
+            handle.out_waiting = 0
+
+        with patch(
+            "busylight_core.vendors.luxafor._busytag.time.sleep", side_effect=drained
+        ) as sleep:
+            busytag.upload(data, "busy.png").result(timeout=1)
+
+        sleep.assert_called_once_with(Transport.drain_interval)
+
+    def test_upload_invalidates_readings(self, busytag, handle, data) -> None:
+        """Test free storage is read again after an upload."""
+        busytag.get_free_storage_size()
+        busytag.upload(data, "busy.png").result(timeout=1)
+        busytag.get_free_storage_size()
+        assert handle.written.count(b"AT+GFSS\r\n") == 2
+
+    def test_rejected_upload(self, busytag, handle, data) -> None:
+        """Test a rejected upload completes with ok False."""
+        handle.replies[b"upload"] = b"ERROR\r\n"
+        assert not busytag.upload(data, "busy.png").result(timeout=1).ok
+
+    def test_file_lists(self, busytag, handle) -> None:
+        """Test file and picture lists are parsed one name per line."""
+        handle.replies[b"AT+GFL"] = b"+FL:busy.png\r\n+FL:config.json\r\nOK\r\n"
+        handle.replies[b"AT+GPL"] = b"+PL:busy.png\r\nOK\r\n"
+        assert busytag.get_file_list() == ["busy.png", "config.json"]
+        assert busytag.get_picture_list() == ["busy.png"]
@@ -1,13 +1,22 @@
 """Tests for Luxafor Flag implementation."""
 
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
 
+from busylight_core.exceptions import LightUnavailableError
 from busylight_core.hardware import ConnectionType, Hardware
 from busylight_core.light import Light
 from busylight_core.vendors.luxafor import Bluetooth, BusyTag, Flag, Mute, Orb
-from busylight_core.vendors.luxafor.implementation import Command, State
+from busylight_core.vendors.luxafor.implementation import (
+    LEDS,
+    Command,
+    FrameBuffer,
+    Pattern,
+    State,
+    Wave,
+)
 from busylight_core.vendors.luxafor.luxafor_base import LuxaforBase
 
 
@@ -92,6 +101,35 @@ class TestLuxaforFlag:
             result = Flag.claims(mock_hardware)
             assert result is False
 
+    def test_strobe_single_write(self, flag) -> None:
+        """Test strobe() offloads the effect in one write."""
+        flag.strobe((255, 0, 0), speed=10, repeat=4, led=LEDS.Back)
+        flag.hardware.handle.write.assert_called_once_with(
+            bytes([Command.Strobe, LEDS.Back, 255, 0, 0, 10, 0, 4])
+        )
+
+    def test_wave_single_write(self, flag) -> None:
+        """Test wave() offloads the effect in one write."""
+        flag.wave((0, 255, 0), Wave.Short, speed=5, repeat=1)
+        flag.hardware.handle.write.assert_called_once_with(
+            bytes([Command.Wave, Wave.Short, 0, 255, 0, 0, 1, 5])
+        )
+
+    def test_pattern_single_write(self, flag) -> None:
+        """Test pattern() plays a built-in pattern in one write."""
+        flag.pattern(Pattern.Police, repeat=2)
+        flag.hardware.handle.write.assert_called_once_with(
+            bytes([Command.Pattern, Pattern.Police, 2])
+        )
+
+    def test_on_after_effect_sends_color(self, flag) -> None:
+        """Test on() switches back to the Color command after an effect."""
+        flag.pattern(Pattern.Rainbow)
+        flag.on((1, 2, 3))
+        assert flag.hardware.handle.write.call_args[0][0] == bytes(
+            [Command.Color, LEDS.All, 1, 2, 3]
+        )
+
     def test_vendor_hierarchy(self, flag) -> None:
         """Test Flag inherits from LuxaforBase properly."""
         # Test inheritance hierarchy
@@ -106,6 +144,185 @@ class TestLuxaforFlag:
         assert LuxaforBase.vendor() == "Luxafor"
 
 
+class TestLuxaforFlagFrameBuffer:
+    """Test the Flag framebuffer and minimal command computation."""
+
+    @pytest.fixture
+    def flag(self) -> Flag:
+        """Create a Flag instance with a mock handle."""
+        hardware = Mock(spec=Hardware)
+        hardware.device_id = (0x04D8, 0xF372)
+        hardware.product_string = "Luxafor Flag"
+        hardware.handle = Mock()
+        hardware.handle.write = Mock(return_value=8)
+        return Flag(hardware, reset=False, exclusive=False)
+
+    def writes(self, flag) -> list[bytes]:
+        """Return the payloads written to the device."""
+        return [c[0][0] for c in flag.hardware.handle.write.call_args_list]
+
+    def test_addressed(self) -> None:
+        """Test LEDS targets map to LED numbers."""
+        assert FrameBuffer.addressed(LEDS.All) == (1, 2, 3, 4, 5, 6)
+        assert FrameBuffer.addressed(LEDS.Back) == (1, 2, 3)
+        assert FrameBuffer.addressed(LEDS.Front) == (4, 5, 6)
+        assert FrameBuffer.addressed(LEDS.LED5) == (5,)
+
+    def test_commands_initially_unknown(self) -> None:
+        """Test a fresh framebuffer writes every LED with one All command."""
+        assert FrameBuffer().commands() == [(LEDS.All, (0, 0, 0))]
+
+    def test_commands_nothing_changed(self) -> None:
+        """Test no commands are needed when the device is up to date."""
+        framebuffer = FrameBuffer()
+        framebuffer.commit(LEDS.All, (0, 0, 0))
+        assert framebuffer.commands() == []
+
+    def test_commands_uniform_sides(self) -> None:
+        """Test uniform sides are written with side commands."""
+        framebuffer = FrameBuffer()
+        framebuffer.set(LEDS.Back, (255, 0, 0))
+        framebuffer.set(LEDS.Front, (0, 0, 255))
+        assert framebuffer.commands() == [
+            (LEDS.Back, (255, 0, 0)),
+            (LEDS.Front, (0, 0, 255)),
+        ]
+
+    def test_commands_per_led(self) -> None:
+        """Test mixed sides fall back to one command per changed LED."""
+        framebuffer = FrameBuffer()
+        framebuffer.commit(LEDS.All, (0, 0, 0))
+        framebuffer[2] = (255, 0, 0)
+        framebuffer[6] = (0, 255, 0)
+        assert framebuffer.commands() == [
+            (LEDS.LED2, (255, 0, 0)),
+            (LEDS.LED6, (0, 255, 0)),
+        ]
+
+    def test_on_writes_once(self, flag) -> None:
+        """Test on() for all LEDs writes a single All command."""
+        flag.on((255, 0, 0))
+        assert self.writes(flag) == [bytes([Command.Color, LEDS.All, 255, 0, 0])]
+
+    def test_on_unchanged_skipped(self, flag) -> None:
+        """Test repeating a color already shown writes nothing."""
+        flag.on((255, 0, 0))
+        flag.hardware.handle.write.reset_mock()
+        flag.on((255, 0, 0))
+        flag.on((255, 0, 0), led=3)
+        flag.hardware.handle.write.assert_not_called()
+
+    def test_per_pixel_batch(self, flag) -> None:
+        """Test per-LED changes in a batch coalesce into side commands."""
+        flag.on((0, 0, 0))
+        flag.hardware.handle.write.reset_mock()
+
+        with flag.batch_update():
+            for led in (1, 2, 3):
+                flag.on((255, 0, 0), led=led)
+            for led in (4, 5, 6):
+                flag.on((0, 255, 0), led=led)
+
+        assert self.writes(flag) == [
+            bytes([Command.Color, LEDS.Back, 255, 0, 0]),
+            bytes([Command.Color, LEDS.Front, 0, 255, 0]),
+        ]
+
+    def test_per_pixel_batch_uniform(self, flag) -> None:
+        """Test setting every LED alike in a batch writes one All command."""
+        with flag.batch_update():
+            for led in range(1, 7):
+                flag.on((0, 0, 255), led=led)
+        assert self.writes(flag) == [bytes([Command.Color, LEDS.All, 0, 0, 255])]
+
+    def test_get_led(self, flag) -> None:
+        """Test per-LED colors are readable."""
+        flag.on((255, 0, 0), led=LEDS.Front)
+        assert flag.get_led(1) == (0, 0, 0)
+        assert flag.get_led(4) == (255, 0, 0)
+
+    def test_effect_invalidates_shadow(self, flag) -> None:
+        """Test a device-side effect forces the next color to be written."""
+        flag.on((255, 0, 0))
+        flag.pattern(Pattern.Rainbow)
+        flag.hardware.handle.write.reset_mock()
+        flag.on((255, 0, 0))
+        flag.hardware.handle.write.assert_called_once()
+
+    def test_repeated_effect_is_written(self, flag) -> None:
+        """Test repeating an effect restarts it rather than being elided."""
+        flag.strobe((255, 0, 0), repeat=2)
+        flag.strobe((255, 0, 0), repeat=2)
+        assert flag.hardware.handle.write.call_count == 2
+
+    def test_force_rewrites_colors(self, flag) -> None:
+        """Test update(force=True) writes LEDs already showing their color."""
+        flag.on((255, 0, 0))
+        flag.hardware.handle.write.reset_mock()
+        flag.update(force=True)
+        flag.hardware.handle.write.assert_called_once()
+
+    def test_color_setter_is_written(self, flag) -> None:
+        """Test setting color and calling update() writes every LED."""
+        flag.on((255, 0, 0))
+        flag.hardware.handle.write.reset_mock()
+
+        flag.color = (0, 0, 255)
+        flag.update()
+
+        flag.hardware.handle.write.assert_called_once()
+        assert flag.color == (0, 0, 255)
+        assert flag.get_led(1) == (0, 0, 255)
+
+    def test_reset_rewrites_colors(self, flag) -> None:
+        """Test reset() writes even when the LEDs already look off."""
+        flag.reset()
+        flag.reset()
+        assert flag.hardware.handle.write.call_count == 2
+
+    def test_state_unlocked_during_write(self, flag) -> None:
+        """Test another thread can change the LEDs while a write is blocked."""
+        started, gate, changed = threading.Event(), threading.Event(), threading.Event()
+
+        def write(_payload: bytes) -> int:
+            started.set()
+            gate.wait(2)
+            return 8
+
+        def change() -> None:
+            with flag.batch_update():
+                flag.on((0, 0, 255), led=4)
+                changed.set()
+
+        flag.hardware.handle.write.side_effect = write
+        first = threading.Thread(target=flag.on, args=((255, 0, 0),))
+        first.start()
+        assert started.wait(2)
+        second = threading.Thread(target=change)
+        second.start()
+
+        assert changed.wait(2)
+        gate.set()
+        first.join(2)
+        second.join(2)
+
+        assert self.writes(flag) == [
+            bytes([Command.Color, LEDS.All, 255, 0, 0]),
+            bytes([Command.Color, LEDS.LED4, 0, 0, 255]),
+        ]
+
+    def test_failed_write_rewrites_colors(self, flag) -> None:
+        """Test the LEDs are written again after a write fails."""
+        flag.hardware.handle.write.side_effect = OSError("unplugged")
+        with pytest.raises(LightUnavailableError):
+            flag.on((255, 0, 0))
+
+        flag.hardware.handle.write.side_effect = None
+        flag.hardware.handle.write.reset_mock()
+        flag.on((255, 0, 0))
+        flag.hardware.handle.write.assert_called_once()
+
+
 class TestLuxaforFlagState:
     """Test the Flag State class."""
 
@@ -122,6 +339,26 @@ class TestLuxaforFlagState:
         expected = bytes([Command.Fade, 1, 255, 128, 64, 10, 5])
         assert result == expected
 
+    def test_state_bytes_with_strobe_command(self) -> None:
+        """Test State.__bytes__() with Strobe command."""
+        state = State()
+        state.strobe((255, 0, 0), speed=20, repeat=3, leds=LEDS.Front)
+        expected = bytes([Command.Strobe, LEDS.Front, 255, 0, 0, 20, 0, 3])
+        assert bytes(state) == expected
+
+    def test_state_bytes_with_wave_command(self) -> None:
+        """Test State.__bytes__() with Wave command."""
+        state = State()
+        state.wave_effect((0, 0, 255), Wave.LongOverlapping, speed=30, repeat=2)
+        expected = bytes([Command.Wave, Wave.LongOverlapping, 0, 0, 255, 0, 2, 30])
+        assert bytes(state) == expected
+
+    def test_state_bytes_with_pattern_command(self) -> None:
+        """Test State.__bytes__() with Pattern command."""
+        state = State()
+        state.play_pattern(Pattern.Rainbow, repeat=5)
+        assert bytes(state) == bytes([Command.Pattern, Pattern.Rainbow, 5])
+
     def test_state_bytes_with_unsupported_command(self) -> None:
         """Test State.__bytes__() with unsupported command raises ValueError."""
         state = State()
@@ -1,16 +1,21 @@
 """Tests for MuteMe implementation."""
 
+import asyncio
 import struct
 from unittest.mock import Mock, patch
 
 import pytest
 
+from busylight_core.exceptions import LightUnavailableError
 from busylight_core.hardware import ConnectionType, Hardware
 from busylight_core.vendors.muteme import MuteMe
 from busylight_core.vendors.muteme.implementation import (
     BlinkBit,
     BlueBit,
+    ButtonDecoder,
+    ButtonEvent,
     DimBit,
+    Gesture,
     GreenBit,
     OneBitField,
     RedBit,
@@ -321,10 +326,10 @@ class TestMuteMe:
         """Test is_button property returns True."""
         assert muteme.is_button is True
 
-    def test_button_on_property_not_implemented(self, muteme) -> None:
-        """Test button_on property raises NotImplementedError."""
-        with pytest.raises(NotImplementedError):
-            _ = muteme.button_on
+    def test_button_on_property(self, muteme) -> None:
+        """Test button_on reads a pending report without waiting."""
+        assert muteme.button_on is False
+        muteme.hardware.handle.read.assert_called_once_with(8, 0)
 
     def test_on_method(self, muteme) -> None:
         """Test on() method updates color."""
@@ -450,3 +455,138 @@ class TestMuteMe:
         assert muteme.state.red == 0xFF
         assert muteme.state.green == 0xFF  # 1 & 1 = 1, so becomes 0xFF
         assert muteme.state.blue == 0
+
+
+class TestMuteMeButtonDecoder:
+    """Test decoding touch reports into button events."""
+
+    @pytest.fixture
+    def decoder(self) -> ButtonDecoder:
+        """Create a decoder with 30ms debounce and 800ms long press."""
+        return ButtonDecoder(debounce=0.03, long_press=0.8)
+
+    @pytest.mark.parametrize(
+        ("report", "expected"),
+        [
+            (b"\x00\x00\x00\x04", True),
+            (b"\x00\x00\x00\x01", True),
+            (b"\x00\x00\x00\x02", False),
+            (b"\x00\x00\x00\x00", False),
+            ([0, 0, 0, 4], True),
+            (b"\x00\x00", None),
+        ],
+    )
+    def test_touching(self, report, expected) -> None:
+        """Test the touch code is read from the fourth byte."""
+        assert ButtonDecoder.touching(report) is expected
+
+    def test_touch_is_debounced(self, decoder) -> None:
+        """Test a touch is reported once it has persisted for debounce."""
+        assert decoder.feed(True, 10.00) == []
+        assert decoder.feed(True, 10.02) == []
+        assert decoder.feed(None, 10.04) == [ButtonEvent(Gesture.TOUCH, 10.04)]
+        assert decoder.pressed
+
+    def test_chatter_is_ignored(self, decoder) -> None:
+        """Test touches shorter than debounce produce no events."""
+        for now in (10.00, 10.01, 10.02, 10.03, 10.04):
+            assert decoder.feed(now * 100 % 2 < 1, now) == []
+        assert decoder.feed(False, 10.2) == []
+        assert not decoder.pressed
+
+    def test_tap(self, decoder) -> None:
+        """Test a short touch produces touch, release and tap events."""
+        decoder.feed(True, 10.0)
+        decoder.feed(None, 10.05)
+        decoder.feed(False, 10.3)
+
+        assert decoder.feed(None, 10.35) == [
+            ButtonEvent(Gesture.RELEASE, 10.35, pytest.approx(0.3)),
+            ButtonEvent(Gesture.TAP, 10.35, pytest.approx(0.3)),
+        ]
+
+    def test_long_press(self, decoder) -> None:
+        """Test a held button produces one long press and no tap."""
+        decoder.feed(True, 10.0)
+        decoder.feed(None, 10.05)
+
+        assert decoder.feed(None, 10.8) == []
+        (event,) = decoder.feed(None, 10.9)
+        assert event.gesture == Gesture.LONG_PRESS
+        assert event.duration == pytest.approx(0.85)
+        assert decoder.feed(True, 11.5) == []
+
+        decoder.feed(False, 12.0)
+        events = decoder.feed(None, 12.05)
+        assert [event.gesture for event in events] == [Gesture.RELEASE]
+
+
+class TestMuteMeButton:
+    """Test reading button events from a MuteMe."""
+
+    @pytest.fixture
+    def muteme(self) -> MuteMe:
+        """Create a MuteMe whose reads return queued reports."""
+        hardware = Mock(spec=Hardware)
+        hardware.device_id = (0x16C0, 0x27DB)
+        hardware.connection_type = ConnectionType.HID
+        hardware.handle = Mock()
+        hardware.handle.read = Mock(return_value=b"")
+        muteme = MuteMe(hardware, reset=False, exclusive=False)
+        muteme.button.debounce = 0.0
+        return muteme
+
+    def test_read_button_uses_timeout(self, muteme) -> None:
+        """Test reads wait in the HID driver for read_timeout_ms."""
+        assert muteme.read_button() == []
+        muteme.hardware.handle.read.assert_called_once_with(8, MuteMe.read_timeout_ms)
+
+    def test_read_button_decodes_touch(self, muteme) -> None:
+        """Test a touch report produces a touch event."""
+        muteme.hardware.handle.read.return_value = b"\x00\x00\x00\x04"
+        (event,) = muteme.read_button()
+        assert event.gesture == Gesture.TOUCH
+        assert muteme.button.pressed
+
+    def test_read_button_failure(self, muteme) -> None:
+        """Test read failures raise LightUnavailableError."""
+        muteme.hardware.handle.read.side_effect = OSError
+        with pytest.raises(LightUnavailableError):
+            muteme.read_button()
+
+    def test_button_on_pressed(self, muteme) -> None:
+        """Test button_on reports a debounced touch."""
+        muteme.hardware.handle.read.return_value = [0, 0, 0, 1]
+        assert muteme.button_on is True
+
+    @pytest.mark.asyncio
+    async def test_button_events(self, muteme) -> None:
+        """Test the async iterator yields events in order."""
+        muteme.hardware.handle.read.side_effect = [
+            b"\x00\x00\x00\x04",
+            b"",
+            b"\x00\x00\x00\x02",
+        ]
+        events = muteme.button_events()
+        gestures = [(await anext(events)).gesture for _ in range(3)]
+        await events.aclose()
+
+        assert gestures == [Gesture.TOUCH, Gesture.RELEASE, Gesture.TAP]
+
+    @pytest.mark.asyncio
+    async def test_watch_button(self, muteme) -> None:
+        """Test watch_button passes events to the callback."""
+        muteme.hardware.handle.read.side_effect = [b"\x00\x00\x00\x04"] + [b""] * 1000
+        received = asyncio.Event()
+        events = []
+
+        def callback(event: ButtonEvent) -> None:
+            events.append(event)
+            received.set()
+
+        task = muteme.watch_button(callback)
+        await asyncio.wait_for(received.wait(), timeout=1)
+        task.cancel()
+
+        assert events[0].gesture == Gesture.TOUCH
+        assert muteme.tasks["button"] is task
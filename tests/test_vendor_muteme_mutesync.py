@@ -145,6 +145,16 @@ class TestMuteMeMuteSync:
         """Test button_on property returns False."""
         assert mutesync.button_on is False
 
+    def test_button_input_unsupported(self, mutesync) -> None:
+        """Test the MuteMe button input methods raise on the serial MuteSync."""
+        with pytest.raises(NotImplementedError, match="button input"):
+            mutesync.read_button()
+        with pytest.raises(NotImplementedError, match="button input"):
+            mutesync.button_events()
+        with pytest.raises(NotImplementedError, match="button input"):
+            mutesync.watch_button(print)
+        mutesync.hardware.handle.read.assert_not_called()
+
     def test_on_method(self, mutesync) -> None:
         """Test on() method sets color correctly."""
         test_color = (200, 100, 50)
@@ -221,3 +231,75 @@ class TestMuteMeMuteSync:
                 assert result is True, (
                     f"Failed for manufacturer='{manufacturer}', product='{product}'"
                 )
+
+
+class TestMuteSyncSegments:
+    """Test the MuteSync four segment framebuffer."""
+
+    @pytest.fixture
+    def mutesync(self) -> MuteSync:
+        """Create a MuteSync with a mock serial handle."""
+        hardware = Mock(spec=Hardware)
+        hardware.device_id = (0x10C4, 0xEA60)
+        hardware.connection_type = ConnectionType.SERIAL
+        hardware.manufacturer_string = "MuteSync Technologies"
+        hardware.product_string = "MuteSync Button"
+        hardware.handle = Mock()
+        return MuteSync(hardware, reset=False, exclusive=False)
+
+    def test_frame_is_preallocated(self, mutesync) -> None:
+        """Test segments are written into the same 13 byte frame."""
+        frame = mutesync.frame
+        mutesync.on((255, 0, 0), led=2)
+        mutesync.on((0, 0, 255))
+        assert mutesync.frame is frame
+        assert len(frame) == 13
+        assert frame[0] == 65
+
+    def test_on_single_segment(self, mutesync) -> None:
+        """Test on() with a segment number changes only that segment."""
+        mutesync.on((255, 0, 0), led=3)
+
+        expected = bytes([65, 0, 0, 0, 0, 0, 0, 255, 0, 0, 0, 0, 0])
+        mutesync.hardware.handle.write.assert_called_once_with(expected)
+        assert mutesync.get_led(3) == (255, 0, 0)
+        assert mutesync.color == (255, 0, 0)
+
+    def test_set_leds_single_write(self, mutesync) -> None:
+        """Test set_leds writes all segments in one report."""
+        mutesync.set_leds((1, 2, 3), (4, 5, 6), (7, 8, 9), (10, 11, 12))
+        mutesync.hardware.handle.write.assert_called_once_with(
+            bytes([65, *range(1, 13)])
+        )
+
+    def test_set_led_out_of_range(self, mutesync) -> None:
+        """Test segment numbers outside 1-4 are rejected."""
+        with pytest.raises(IndexError):
+            mutesync.set_led(5, (255, 0, 0))
+        with pytest.raises(IndexError):
+            mutesync.set_leds(*[(255, 0, 0)] * 5)
+
+    def test_unchanged_frame_is_not_written(self, mutesync) -> None:
+        """Test updates that would not change the frame are skipped."""
+        mutesync.on((0, 255, 0), led=1)
+        mutesync.on((0, 255, 0), led=1)
+        mutesync.set_leds((0, 255, 0))
+        mutesync.hardware.handle.write.assert_called_once()
+
+    def test_spinner(self, mutesync) -> None:
+        """Test rotating a lit segment writes one frame per step."""
+        colors = [(255, 255, 255), (0, 0, 0), (0, 0, 0), (0, 0, 0)]
+        for step in range(4):
+            mutesync.set_leds(*colors[-step:], *colors[:-step])
+
+        writes = [
+            call.args[0] for call in mutesync.hardware.handle.write.call_args_list
+        ]
+        assert len(writes) == 4
+        assert [write.index(255) for write in writes] == [1, 4, 7, 10]
+
+    def test_reset_always_writes(self, mutesync) -> None:
+        """Test reset turns the ring off even if it appears to be off."""
+        mutesync.off()
+        mutesync.reset()
+        assert mutesync.hardware.handle.write.call_count == 2
@@ -8,7 +8,7 @@ from busylight_core.hardware import ConnectionType, Hardware
 from busylight_core.vendors.embrava.blynclight import Blynclight
 from busylight_core.vendors.embrava.blynclight_plus import BlynclightPlus
 from busylight_core.vendors.embrava.embrava_base import EmbravaBase
-from busylight_core.vendors.embrava.implementation import FlashSpeed
+from busylight_core.vendors.embrava.implementation import Cue, FlashSpeed
 from busylight_core.vendors.plantronics import StatusIndicator
 from busylight_core.vendors.plantronics.plantronics_base import PlantronicsBase
 
@@ -176,10 +176,14 @@ class TestPlantronicsStatusIndicator:
         # Turn off the device
         status_indicator.off((0, 0, 0))
 
-        # Should set off, disable flash and dim when not lit
-        assert status_indicator.state.off == 1
-        assert status_indicator.state.flash == 0
-        assert status_indicator.state.dim == 0
+        # Should send off, with flash and dim disabled, when not lit
+        assert status_indicator.hardware.handle.write.call_args.args[0][4] == 0x02
+
+    def test_alert_method_inherited(self, status_indicator) -> None:
+        """Test alert() sends a whole cue in a single write."""
+        cue = Cue((255, 0, 0), flash=FlashSpeed.fast, music=1)
+        status_indicator.alert(cue)
+        status_indicator.hardware.handle.write.assert_called_once_with(cue.frame)
 
     def test_reset_method_inherited(self, status_indicator) -> None:
         """Test reset() method inherited from Blynclight."""
@@ -1,10 +1,14 @@
 """Tests for ThingM Blink1 implementation."""
 
+import asyncio
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
 
+from busylight_core.exceptions import LightUnavailableError
 from busylight_core.hardware import ConnectionType, Hardware
+from busylight_core.mixins import ReadbackMixin
 from busylight_core.vendors.thingm import Blink1
 from busylight_core.vendors.thingm.implementation import (
     LEDS,
@@ -16,7 +20,10 @@ from busylight_core.vendors.thingm.implementation import (
     GreenField,
     LedsField,
     LinesField,
+    PatternLine,
+    PatternMemory,
     PlayField,
+    PlayState,
     RedField,
     Report,
     ReportField,
@@ -27,6 +34,16 @@ from busylight_core.vendors.thingm.implementation import (
 from busylight_core.vendors.thingm.thingm_base import ThingMBase
 
 
+@pytest.fixture
+def blink1() -> Blink1:
+    """Create a Blink1 instance with a mock feature report handle."""
+    hardware = Mock(spec=Hardware)
+    hardware.device_id = (0x27B8, 0x01ED)
+    hardware.handle = Mock()
+    hardware.handle.send_feature_report = Mock(return_value=8)
+    return Blink1(hardware, reset=False, exclusive=False)
+
+
 class TestThingMBlink1Fields:
     """Test the bit field classes."""
 
@@ -158,7 +175,7 @@ class TestThingMBlink1State:
         assert state.report == Report.One
         assert state.action == Action.FadeColor
         assert state.color == color
-        assert state.fade == 10  # default fade_ms
+        assert state.fade == 1  # default fade_ms in 10 ms ticks
         assert state.leds == LEDS.All  # default leds
 
     def test_state_fade_to_color_custom(self) -> None:
@@ -173,9 +190,25 @@ class TestThingMBlink1State:
         assert state.report == Report.One
         assert state.action == Action.FadeColor
         assert state.color == color
-        assert state.fade == fade_ms
+        assert state.fade == fade_ms // 10
         assert state.leds == leds
 
+    @pytest.mark.parametrize(
+        ("color", "fade_ms", "leds"),
+        [
+            ((255, 128, 64), 10, LEDS.All),
+            ((1, 2, 3), 655350, LEDS.Top),
+            ((0, 0, 0), 15, LEDS.Bottom),
+        ],
+    )
+    def test_state_fade_report_matches_fade_to_color(
+        self, color, fade_ms, leds
+    ) -> None:
+        """Test fade_report returns the report fade_to_color lays out."""
+        state = State()
+        state.fade_to_color(color, fade_ms, leds)
+        assert State.fade_report(color, fade_ms, leds) == bytes(state)
+
     def test_state_fade_to_color_clears_previous(self) -> None:
         """Test fade_to_color clears previous state."""
         state = State()
@@ -205,7 +238,7 @@ class TestThingMBlink1State:
         assert state.report == Report.One
         assert state.action == Action.SetColorPattern
         assert state.color == color
-        assert state.fade == fade_ms
+        assert state.fade == fade_ms // 10
         assert state.line == index
 
     def test_state_save_patterns(self) -> None:
@@ -442,7 +475,7 @@ class TestThingMBlink1:
             assert blink1.state.report == Report.One
             assert blink1.state.action == Action.FadeColor
             assert blink1.state.color == color
-            assert blink1.state.fade == 10  # Default fade
+            assert blink1.state.fade == 1  # Default fade in 10 ms ticks
             assert blink1.state.leds == LEDS.Bottom
 
     def test_bytes_integration(self, blink1) -> None:
@@ -544,7 +577,675 @@ class TestThingMBlink1:
         """Test MRO follows expected pattern."""
         mro = Blink1.__mro__
 
-        # Should be: Blink1 -> ThingMBase -> Light -> ...
+        # Should be: Blink1 -> ReadbackMixin -> ThingMBase -> Light -> ...
         assert mro[0] == Blink1
-        assert mro[1].__name__ == "ThingMBase"
-        assert mro[2].__name__ == "Light"
+        assert mro[1] == ReadbackMixin
+        assert mro[2].__name__ == "ThingMBase"
+        assert mro[3].__name__ == "Light"
+
+
+class TestThingMBlink1PatternMemory:
+    """Test the PatternMemory mirror."""
+
+    def test_initially_unknown(self) -> None:
+        """Test a new mirror has no known lines."""
+        memory = PatternMemory()
+        assert len(memory) == 16
+        assert list(memory) == [None] * 16
+
+    def test_diff_unknown_lines_all_changed(self) -> None:
+        """Test unknown lines are always reported as changed."""
+        memory = PatternMemory()
+        lines = [PatternLine((255, 0, 0), 100), PatternLine((0, 255, 0), 100)]
+        assert memory.diff(lines, 3) == [(3, lines[0]), (4, lines[1])]
+
+    def test_diff_skips_matching_lines(self) -> None:
+        """Test lines matching the mirror are not reported."""
+        memory = PatternMemory()
+        memory[0] = PatternLine((255, 0, 0), 100)
+        memory[1] = PatternLine((0, 255, 0), 100)
+        lines = [PatternLine((255, 0, 0), 100), PatternLine((0, 0, 255), 100)]
+        assert memory.diff(lines) == [(1, lines[1])]
+
+    def test_diff_normalizes_lines(self) -> None:
+        """Test lines are compared and returned as the device stores them."""
+        memory = PatternMemory()
+        memory[0] = PatternLine((255, 0, 0), 10)
+        lines = [PatternLine([255, 0, 0], 19), PatternLine([0, 0, 255], 25)]
+        assert memory.diff(lines) == [(1, PatternLine((0, 0, 255), 20))]
+
+    def test_diff_out_of_range(self) -> None:
+        """Test lines overflowing pattern memory are rejected."""
+        memory = PatternMemory(nlines=4)
+        with pytest.raises(ValueError, match="exceed"):
+            memory.diff([PatternLine((0, 0, 0))] * 3, start=2)
+
+    def test_invalidate(self) -> None:
+        """Test invalidate() forgets mirrored lines."""
+        memory = PatternMemory()
+        memory[0] = PatternLine((1, 2, 3), 4)
+        memory.invalidate()
+        assert memory[0] is None
+
+
+class TestThingMBlink1Patterns:
+    """Test Blink1 pattern upload and read back."""
+
+    def test_state_from_bytes(self) -> None:
+        """Test State.from_bytes() round trips a report."""
+        state = State()
+        state.write_pattern_line((1, 2, 3), 500, 7)
+        assert bytes(State.from_bytes(bytes(state))) == bytes(state)
+
+    def test_state_from_bytes_short(self) -> None:
+        """Test State.from_bytes() pads short reports."""
+        state = State.from_bytes(bytes([1, ord("R"), 9]))
+        assert state.report == 1
+        assert state.red == 9
+        assert state.fade == 0
+
+    def test_state_read_pattern_line(self) -> None:
+        """Test read_pattern_line() configures a pattern read request."""
+        state = State()
+        state.read_pattern_line(5)
+        assert state.report == Report.One
+        assert state.action == Action.ReadColorPattern
+        assert state.line == 5
+        assert state.color == (0, 0, 0)
+
+    def test_write_patterns_initial_upload(self, blink1) -> None:
+        """Test the first upload writes every line."""
+        lines = [PatternLine((255, 0, 0), 100)] * 16
+        assert blink1.write_patterns(lines) == 16
+        assert blink1.hardware.handle.send_feature_report.call_count == 16
+        assert list(blink1.patterns) == lines
+
+    def test_write_patterns_only_changed_lines(self, blink1) -> None:
+        """Test later uploads only write lines that changed."""
+        lines = [PatternLine((255, 0, 0), 100)] * 16
+        blink1.write_patterns(lines)
+        blink1.hardware.handle.send_feature_report.reset_mock()
+
+        lines[9] = PatternLine((0, 0, 255), 250)
+        assert blink1.write_patterns(lines) == 1
+
+        send = blink1.hardware.handle.send_feature_report
+        send.assert_called_once()
+        written = State.from_bytes(send.call_args[0][0])
+        assert written.action == Action.SetColorPattern
+        assert written.color == (0, 0, 255)
+        assert written.fade == 25
+        assert written.line == 9
+
+    def test_write_patterns_unchanged_writes_nothing(self, blink1) -> None:
+        """Test an identical upload sends no reports."""
+        lines = [PatternLine((0, 255, 0), 100)] * 4
+        blink1.write_patterns(lines, start=2)
+        blink1.hardware.handle.send_feature_report.reset_mock()
+        assert blink1.write_patterns(lines, start=2) == 0
+        blink1.hardware.handle.send_feature_report.assert_not_called()
+
+    def test_write_patterns_save(self, blink1) -> None:
+        """Test save_patterns() is only sent when requested."""
+        lines = [PatternLine((255, 0, 0), 100)]
+        blink1.write_patterns(lines)
+        send = blink1.hardware.handle.send_feature_report
+        actions = [State.from_bytes(c[0][0]).action for c in send.call_args_list]
+        assert Action.SaveColorPatterns not in actions
+
+        blink1.write_patterns(lines, save=True)
+        assert State.from_bytes(send.call_args[0][0]).action == Action.SaveColorPatterns
+
+    def test_clear_patterns(self, blink1) -> None:
+        """Test clear_patterns() skips lines that are already black."""
+        blink1.write_patterns([PatternLine((0, 0, 0), 0)] * 8)
+        blink1.hardware.handle.send_feature_report.reset_mock()
+        assert blink1.clear_patterns() == 8
+
+    def test_read_pattern_line_seeds_mirror(self, blink1) -> None:
+        """Test read_pattern_line() records the device's line in the mirror."""
+        blink1.hardware.handle.get_feature_report = Mock(
+            return_value=[1, ord("R"), 10, 20, 30, 0x00, 0x32, 3]
+        )
+        line = blink1.read_pattern_line(3)
+        assert line == PatternLine((10, 20, 30), 500)
+        assert blink1.patterns[3] == line
+        blink1.hardware.handle.get_feature_report.assert_called_once_with(Report.One, 8)
+
+        blink1.hardware.handle.send_feature_report.reset_mock()
+        assert blink1.write_patterns([line], start=3) == 0
+
+    def test_read_pattern_line_then_unrounded_write(self, blink1) -> None:
+        """Test a fade between ticks matches the line read back."""
+        blink1.hardware.handle.get_feature_report = Mock(
+            return_value=[1, ord("R"), 255, 0, 0, 0x00, 0x01, 0]
+        )
+        blink1.read_pattern_line(0)
+        blink1.hardware.handle.send_feature_report.reset_mock()
+
+        assert blink1.write_patterns([PatternLine([255, 0, 0], 15)]) == 0
+        blink1.hardware.handle.send_feature_report.assert_not_called()
+
+    def test_write_patterns_records_stored_line(self, blink1) -> None:
+        """Test the mirror records lines as the device stores them."""
+        blink1.write_patterns([PatternLine([0, 255, 0], 123)])
+        assert blink1.patterns[0] == PatternLine((0, 255, 0), 120)
+
+    def test_read_pattern_line_failure(self, blink1) -> None:
+        """Test read failures raise LightUnavailableError."""
+        blink1.hardware.handle.get_feature_report = Mock(side_effect=OSError)
+        with pytest.raises(LightUnavailableError):
+            blink1.read_pattern_line(0)
+
+    def test_read_patterns(self, blink1) -> None:
+        """Test read_patterns() reads every line."""
+        blink1.hardware.handle.get_feature_report = Mock(
+            return_value=[1, ord("R"), 0, 0, 0, 0, 0, 0]
+        )
+        assert len(blink1.read_patterns()) == 16
+        assert None not in list(blink1.patterns)
+
+
+class TestThingMBlink1Fades:
+    """Test Blink1 hardware offloaded fades."""
+
+    def test_fade_to_single_write(self, blink1) -> None:
+        """Test fade_to() sends exactly one FadeColor report."""
+        blink1.fade_to((255, 0, 0), 2000, LEDS.Top)
+
+        send = blink1.hardware.handle.send_feature_report
+        send.assert_called_once()
+        written = State.from_bytes(send.call_args[0][0])
+        assert written.action == Action.FadeColor
+        assert written.color == (255, 0, 0)
+        assert written.fade == 200
+        assert written.leds == LEDS.Top
+
+    def test_fade_to_longest_duration(self, blink1) -> None:
+        """Test the fade field counts 10 ms ticks."""
+        blink1.fade_to((255, 0, 0), Blink1.max_fade_ms)
+
+        send = blink1.hardware.handle.send_feature_report
+        assert State.from_bytes(send.call_args[0][0]).fade == 0xFFFF
+
+    @pytest.mark.parametrize("duration_ms", [-1, 0xFFFF * 10 + 1])
+    def test_fade_to_invalid_duration(self, blink1, duration_ms) -> None:
+        """Test fade_to() rejects durations the fade field cannot hold."""
+        with pytest.raises(ValueError, match="duration_ms"):
+            blink1.fade_to((255, 0, 0), duration_ms)
+        blink1.hardware.handle.send_feature_report.assert_not_called()
+
+    def test_fade_segments_short_stops(self) -> None:
+        """Test stops within the fade limit map to one segment each."""
+        stops = [((255, 0, 0), 1000), ((0, 0, 255), 500)]
+        assert Blink1.fade_segments((0, 0, 0), stops, 0xFFFF) == stops
+
+    def test_fade_segments_long_stop_split(self) -> None:
+        """Test long stops are split into interpolated segments."""
+        segments = Blink1.fade_segments((0, 0, 0), [((200, 100, 0), 3000)], 1000)
+        assert segments == [
+            ((67, 33, 0), 1000),
+            ((133, 67, 0), 1000),
+            ((200, 100, 0), 1000),
+        ]
+
+    def test_fade_segments_preserve_duration(self) -> None:
+        """Test split segments add up to the requested duration."""
+        segments = Blink1.fade_segments((0, 0, 0), [((9, 9, 9), 1001)], 333)
+        assert sum(duration for _, duration in segments) == 1001
+        assert all(duration <= 333 for _, duration in segments)
+
+    @pytest.mark.asyncio
+    async def test_fade_through_one_write_per_stop(self, blink1) -> None:
+        """Test fade_through() offloads each stop as one report."""
+        stops = [((255, 0, 0), 10), ((0, 255, 0), 10), ((0, 0, 255), 10)]
+        task = blink1.fade_through(stops)
+        await task
+
+        send = blink1.hardware.handle.send_feature_report
+        assert send.call_count == 3
+        colors = [State.from_bytes(c[0][0]).color for c in send.call_args_list]
+        assert colors == [color for color, _ in stops]
+
+    @pytest.mark.asyncio
+    async def test_fade_through_replaces_running_fade(self, blink1) -> None:
+        """Test starting a new fade cancels the previous one."""
+        first = blink1.fade_through([((255, 0, 0), 1000)])
+        second = blink1.fade_through([((0, 255, 0), 10)])
+        await second
+        assert first.cancelled()
+
+
+class TestThingMBlink1ReadBack:
+    """Test Blink1 read back queries and their cache."""
+
+    def test_state_query_requests(self) -> None:
+        """Test State query methods configure the expected actions."""
+        state = State()
+        state.read_color(LEDS.Bottom)
+        assert state.action == Action.ReadColor
+        assert state.leds == LEDS.Bottom
+        state.get_version()
+        assert state.action == Action.GetVersion
+        state.get_chip_id()
+        assert state.action == Action.GetChipID
+        state.read_play_state()
+        assert state.action == Action.PlayStateRead
+        assert state.report == Report.One
+
+    def test_get_version_cached_forever(self, blink1) -> None:
+        """Test the firmware version is queried once."""
+        get = blink1.hardware.handle.get_feature_report
+        get.return_value = [1, ord("v"), 0, ord("2"), ord("4"), 0, 0, 0]
+        assert blink1.get_version() == 204
+        assert blink1.get_version() == 204
+        get.assert_called_once()
+
+    def test_get_chip_id_cached_forever(self, blink1) -> None:
+        """Test the chip ID is queried once."""
+        get = blink1.hardware.handle.get_feature_report
+        get.return_value = [1, ord("U"), 0xDE, 0xAD, 0xBE, 0xEF, 0x01, 0x02]
+        assert blink1.get_chip_id() == "deadbeef0102"
+        blink1.on((255, 0, 0))
+        assert blink1.get_chip_id() == "deadbeef0102"
+        get.assert_called_once()
+
+    def test_read_color(self, blink1) -> None:
+        """Test read_color() requests the LED and decodes the reply."""
+        get = blink1.hardware.handle.get_feature_report
+        get.return_value = [1, ord("r"), 10, 20, 30, 0, 0, 2]
+        assert blink1.read_color(LEDS.Bottom) == (10, 20, 30)
+        request = State.from_bytes(
+            blink1.hardware.handle.send_feature_report.call_args[0][0]
+        )
+        assert request.action == Action.ReadColor
+        assert request.leds == LEDS.Bottom
+
+    def test_read_color_cached_within_ttl(self, blink1) -> None:
+        """Test repeated reads inside the TTL are served from the cache."""
+        get = blink1.hardware.handle.get_feature_report
+        get.return_value = [1, ord("r"), 10, 20, 30, 0, 0, 1]
+        blink1.read_color()
+        blink1.read_color()
+        get.assert_called_once()
+
+    def test_read_color_cache_per_led(self, blink1) -> None:
+        """Test each LED has its own cache entry."""
+        get = blink1.hardware.handle.get_feature_report
+        get.return_value = [1, ord("r"), 10, 20, 30, 0, 0, 1]
+        blink1.read_color(LEDS.Top)
+        blink1.read_color(LEDS.Bottom)
+        assert get.call_count == 2
+
+    def test_read_color_expires(self, blink1) -> None:
+        """Test cached readings older than max_age are refreshed."""
+        get = blink1.hardware.handle.get_feature_report
+        get.return_value = [1, ord("r"), 10, 20, 30, 0, 0, 1]
+        blink1.read_color()
+        blink1.read_color(max_age=0)
+        assert get.call_count == 2
+
+    def test_write_discards_readings(self, blink1) -> None:
+        """Test writing a command discards cached volatile readings."""
+        get = blink1.hardware.handle.get_feature_report
+        get.return_value = [1, ord("r"), 10, 20, 30, 0, 0, 1]
+        blink1.read_color()
+        blink1.on((0, 255, 0))
+        blink1.read_color()
+        assert get.call_count == 2
+
+    def test_read_play_state(self, blink1) -> None:
+        """Test read_play_state() decodes the playback status."""
+        get = blink1.hardware.handle.get_feature_report
+        get.return_value = [1, ord("S"), 1, 2, 9, 3, 5, 0]
+        assert blink1.read_play_state() == PlayState(
+            playing=True, start=2, stop=9, count=3, position=5
+        )
+
+
+class TestThingMBlink1Coalescing:
+    """Test Blink1 per-LED shadow state and write coalescing."""
+
+    def written(self, blink1) -> list[State]:
+        """Return the states written to the device so far."""
+        send = blink1.hardware.handle.send_feature_report
+        return [State.from_bytes(c[0][0]) for c in send.call_args_list]
+
+    def test_same_color_both_leds_one_all_command(self, blink1) -> None:
+        """Test setting both LEDs alike in a batch writes one LEDS.All command."""
+        with blink1.batch_update():
+            blink1.on((255, 0, 0), led=1)
+            blink1.on((255, 0, 0), led=2)
+
+        written = self.written(blink1)
+        assert len(written) == 1
+        assert written[0].leds == LEDS.All
+        assert written[0].color == (255, 0, 0)
+
+    def test_different_colors_two_commands(self, blink1) -> None:
+        """Test setting the LEDs to different colors writes one command each."""
+        with blink1.batch_update():
+            blink1.on((255, 0, 0), led=1)
+            blink1.on((0, 0, 255), led=2)
+
+        written = self.written(blink1)
+        assert [(s.leds, s.color) for s in written] == [
+            (LEDS.Top, (255, 0, 0)),
+            (LEDS.Bottom, (0, 0, 255)),
+        ]
+
+    def test_last_request_in_batch_wins(self, blink1) -> None:
+        """Test only the final color requested in a batch is written."""
+        with blink1.batch_update():
+            blink1.on((255, 0, 0))
+            blink1.on((0, 255, 0))
+
+        written = self.written(blink1)
+        assert len(written) == 1
+        assert written[0].color == (0, 255, 0)
+
+    def test_unchanged_write_skipped(self, blink1) -> None:
+        """Test requesting the colors already shown writes nothing."""
+        blink1.on((255, 0, 0))
+        blink1.hardware.handle.send_feature_report.reset_mock()
+
+        blink1.on((255, 0, 0))
+        with blink1.batch_update():
+            blink1.on((255, 0, 0), led=1)
+            blink1.on((255, 0, 0), led=2)
+
+        blink1.hardware.handle.send_feature_report.assert_not_called()
+
+    def test_only_changed_led_written(self, blink1) -> None:
+        """Test changing one LED after an All command writes just that LED."""
+        blink1.on((255, 0, 0))
+        blink1.hardware.handle.send_feature_report.reset_mock()
+
+        with blink1.batch_update():
+            blink1.on((255, 0, 0), led=1)
+            blink1.on((0, 255, 0), led=2)
+
+        written = self.written(blink1)
+        assert [(s.leds, s.color) for s in written] == [(LEDS.Bottom, (0, 255, 0))]
+
+    def test_get_led(self, blink1) -> None:
+        """Test get_led() reports each LED independently."""
+        assert blink1.get_led(LEDS.Top) == (0, 0, 0)
+        blink1.on((255, 0, 0), led=1)
+        blink1.on((0, 0, 255), led=2)
+        assert blink1.get_led(LEDS.Top) == (255, 0, 0)
+        assert blink1.get_led(LEDS.Bottom) == (0, 0, 255)
+
+    def test_get_led_pending(self, blink1) -> None:
+        """Test get_led() reports colors requested inside a batch."""
+        with blink1.batch_update():
+            blink1.on((1, 2, 3), led=2)
+            assert blink1.get_led(LEDS.Bottom) == (1, 2, 3)
+
+    def test_nested_batches_write_once(self, blink1) -> None:
+        """Test nested batches only update the device at the outermost exit."""
+        with blink1.batch_update():
+            with blink1.batch_update():
+                blink1.on((255, 0, 0))
+            blink1.hardware.handle.send_feature_report.assert_not_called()
+        blink1.hardware.handle.send_feature_report.assert_called_once()
+
+    def test_pattern_write_inside_batch(self, blink1) -> None:
+        """Test pattern writes inside a batch do not disturb pending colors."""
+        with blink1.batch_update():
+            blink1.on((255, 0, 0))
+            blink1.write_patterns([PatternLine((0, 255, 0), 100)])
+
+        written = self.written(blink1)
+        assert [s.action for s in written] == [
+            Action.SetColorPattern,
+            Action.FadeColor,
+        ]
+        assert written[1].color == (255, 0, 0)
+
+    def test_state_unlocked_during_write(self, blink1) -> None:
+        """Test another thread can change the colors while a write is blocked."""
+        started, gate, changed = threading.Event(), threading.Event(), threading.Event()
+
+        def send(_payload: bytes) -> int:
+            started.set()
+            gate.wait(2)
+            return 8
+
+        def change() -> None:
+            with blink1.batch_update():
+                blink1.on((0, 0, 255), led=2)
+                changed.set()
+
+        blink1.hardware.handle.send_feature_report.side_effect = send
+        first = threading.Thread(target=blink1.on, args=((255, 0, 0),))
+        first.start()
+        assert started.wait(2)
+        second = threading.Thread(target=change)
+        second.start()
+
+        assert changed.wait(2)
+        gate.set()
+        first.join(2)
+        second.join(2)
+
+        written = self.written(blink1)
+        assert [(s.leds, s.color) for s in written] == [
+            (LEDS.All, (255, 0, 0)),
+            (LEDS.Bottom, (0, 0, 255)),
+        ]
+
+    def test_failed_write_rewrites_colors(self, blink1) -> None:
+        """Test the LEDs are written again after a write fails."""
+        send = blink1.hardware.handle.send_feature_report
+        send.side_effect = OSError("unplugged")
+        with pytest.raises(LightUnavailableError):
+            blink1.on((255, 0, 0))
+
+        send.side_effect = None
+        send.reset_mock()
+        blink1.on((255, 0, 0))
+        send.assert_called_once()
+
+
+class TestThingMBlink1Watchdog:
+    """Test the Blink1 server tickle watchdog."""
+
+    def last_written(self, blink1) -> State:
+        """Return the last state written to the device."""
+        send = blink1.hardware.handle.send_feature_report
+        return State.from_bytes(send.call_args[0][0])
+
+    def test_state_server_tickle(self) -> None:
+        """Test server_tickle() lays out the tickle command."""
+        state = State()
+        state.server_tickle(True, 0x1234 * 10, 2, 5, stay=True)
+        assert bytes(state) == bytes([1, ord("D"), 1, 0x12, 0x34, 1, 2, 5])
+
+    def test_state_server_tickle_disarm(self) -> None:
+        """Test server_tickle(False) clears the watchdog parameters."""
+        state = State()
+        state.server_tickle(False)
+        assert bytes(state) == bytes([1, ord("D"), 0, 0, 0, 0, 0, 0])
+
+    @pytest.mark.asyncio
+    async def test_arm_watchdog(self, blink1) -> None:
+        """Test arm_watchdog() arms the device immediately."""
+        task = blink1.arm_watchdog(4000, 0, 3)
+        written = self.last_written(blink1)
+        assert written.action == Action.ServerTickle
+        assert written.play == 1
+        assert written.timeout == 400
+        assert written.tickle_start == 0
+        assert written.tickle_stop == 3
+        assert blink1.tasks["watchdog"] is task
+        blink1.disarm_watchdog()
+
+    @pytest.mark.asyncio
+    async def test_watchdog_tickles_periodically(self, blink1) -> None:
+        """Test the watchdog task re-tickles at half the timeout."""
+        blink1.arm_watchdog(20)
+        await asyncio.sleep(0.035)
+        send = blink1.hardware.handle.send_feature_report
+        assert send.call_count >= 3
+        blink1.disarm_watchdog()
+
+    @pytest.mark.asyncio
+    async def test_disarm_watchdog(self, blink1) -> None:
+        """Test disarm_watchdog() cancels the task and disarms the device."""
+        task = blink1.arm_watchdog(4000)
+        blink1.disarm_watchdog()
+        await asyncio.sleep(0)
+        assert task.cancelled()
+        assert self.last_written(blink1).play == 0
+        assert "watchdog" not in blink1.tasks
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["reset", "release"])
+    async def test_shutdown_disarms_watchdog(self, blink1, method) -> None:
+        """Test reset() and release() disarm an armed watchdog."""
+        blink1.arm_watchdog(1000, 0, 3)
+        send = blink1.hardware.handle.send_feature_report
+        send.reset_mock()
+
+        getattr(blink1, method)()
+
+        tickles = [
+            State.from_bytes(c.args[0])
+            for c in send.call_args_list
+            if c.args[0][1] == Action.ServerTickle
+        ]
+        assert [tickle.play for tickle in tickles] == [0]
+        assert "watchdog" not in blink1.tasks
+
+    def test_reset_unarmed_watchdog(self, blink1) -> None:
+        """Test reset() sends no tickle when the watchdog is not armed."""
+        blink1.reset()
+        send = blink1.hardware.handle.send_feature_report
+        assert all(c.args[0][1] != Action.ServerTickle for c in send.call_args_list)
+
+    def test_tickle_unarmed_watchdog(self, blink1) -> None:
+        """Test tickling an unarmed watchdog writes nothing."""
+        blink1.tickle_watchdog()
+        blink1.hardware.handle.send_feature_report.assert_not_called()
+
+    @pytest.mark.parametrize("timeout_ms", [0, 9, 0xFFFF * 10 + 1])
+    def test_arm_watchdog_invalid_timeout(self, blink1, timeout_ms) -> None:
+        """Test out of range timeouts are rejected."""
+        with pytest.raises(ValueError, match="timeout_ms"):
+            blink1.arm_watchdog(timeout_ms)
+
+    @pytest.mark.asyncio
+    async def test_tickle_keeps_readings(self, blink1) -> None:
+        """Test tickles do not discard cached read back values."""
+        get = blink1.hardware.handle.get_feature_report = Mock(
+            return_value=[1, ord("r"), 10, 20, 30, 0, 0, 1]
+        )
+        blink1.arm_watchdog(4000)
+        blink1.read_color()
+        blink1.tickle_watchdog()
+        blink1.read_color()
+        get.assert_called_once()
+        blink1.disarm_watchdog()
+
+    @pytest.mark.asyncio
+    async def test_watchdog_keeps_color(self, blink1) -> None:
+        """Test arming the watchdog does not change the light's color."""
+        blink1.arm_watchdog(5000)
+        assert blink1.color == (0, 0, 0)
+        assert not blink1.is_lit
+        blink1.disarm_watchdog()
+
+
+class TestThingMBlink1Reports:
+    """Test commands and queries are kept apart from the LED color."""
+
+    @pytest.fixture
+    def blink1(self, blink1) -> Blink1:
+        """Create a Blink1 that has been turned red."""
+        version = [1, ord("v"), 0, ord("2"), ord("4"), 0, 0, 0]
+        handle = blink1.hardware.handle
+        handle.get_feature_report.return_value = version
+        blink1.on((255, 0, 0))
+        handle.send_feature_report.reset_mock()
+        return blink1
+
+    def test_query_is_not_written_again(self, blink1) -> None:
+        """Test update() after a query does not repeat the query."""
+        blink1.get_version()
+        send = blink1.hardware.handle.send_feature_report
+        send.reset_mock()
+
+        blink1.update()
+        with blink1.batch_update():
+            pass
+
+        send.assert_not_called()
+        assert blink1.color == (255, 0, 0)
+
+    def test_query_waits_for_background_writer(self, blink1) -> None:
+        """Test a query is written after queued writes and answered at once."""
+        events = []
+        gate = threading.Event()
+
+        def send(report: bytes) -> int:
+            gate.wait(2)
+            events.append(("send", report[1]))
+            return 8
+
+        def get(*_args: object) -> list[int]:
+            events.append(("get", None))
+            return [1, ord("v"), 0, ord("2"), ord("4"), 0, 0, 0]
+
+        blink1.hardware.handle.send_feature_report.side_effect = send
+        blink1.hardware.handle.get_feature_report.side_effect = get
+        blink1.start_writer()
+        blink1.on((0, 0, 255))
+        threading.Timer(0.05, gate.set).start()
+
+        assert blink1.get_version() == 204
+        assert events == [
+            ("send", Action.FadeColor),
+            ("send", Action.GetVersion),
+            ("get", None),
+        ]
+        blink1.join()
+
+    def test_save_is_not_written_again(self, blink1) -> None:
+        """Test update() after saving patterns does not write flash again."""
+        blink1.save_patterns()
+        send = blink1.hardware.handle.send_feature_report
+        send.reset_mock()
+
+        blink1.update()
+
+        send.assert_not_called()
+
+    def test_force_rewrites_leds(self, blink1) -> None:
+        """Test update(force=True) rewrites the LEDs' colors."""
+        blink1.update(force=True)
+
+        send = blink1.hardware.handle.send_feature_report
+        written = State.from_bytes(send.call_args[0][0])
+        send.assert_called_once()
+        assert written.action == Action.FadeColor
+        assert written.color == (255, 0, 0)
+
+    def test_reset_always_writes(self, blink1) -> None:
+        """Test every reset turns the LEDs off, even if they appear to be off."""
+        blink1.reset()
+        blink1.reset()
+
+        send = blink1.hardware.handle.send_feature_report
+        assert send.call_count == 2
+        assert State.from_bytes(send.call_args[0][0]).color == (0, 0, 0)
+
+    def test_color_setter_is_written(self, blink1) -> None:
+        """Test setting color and calling update() writes the new color."""
+        blink1.color = (0, 0, 255)
+        blink1.update()
+
+        send = blink1.hardware.handle.send_feature_report
+        send.assert_called_once()
+        assert State.from_bytes(send.call_args[0][0]).color == (0, 0, 255)
+        assert blink1.color == (0, 0, 255)
@@ -40,6 +40,21 @@ def test_word_method_clear(value) -> None:
     assert result.value == 0
 
 
+@pytest.mark.parametrize("value", [0, 0x5A, 0xFF])
+def test_word_value_setter(value) -> None:
+    """Test assigning Word.value replaces every bit."""
+    result = Word(0xA5, 8)
+    result.value = value
+    assert result.value == value
+
+
+def test_word_value_setter_truncates() -> None:
+    """Test assigning a value wider than the word keeps the low bits."""
+    result = Word(0, 8)
+    result.value = 0x1FF
+    assert result.value == 0xFF
+
+
 @pytest.mark.parametrize("value", [0, 0xFF])
 def test_word_dunder_bytes(value) -> None:
     """Test Word.__bytes__() method returns bytes."""
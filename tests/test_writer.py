@@ -0,0 +1,129 @@
+"""Tests for the background Writer."""
+
+import threading
+
+import pytest
+
+from busylight_core.stats import LightStats
+from busylight_core.writer import Writer
+
+
+class GatedWrite:
+    """Write callable that records payloads once the gate is opened."""
+
+    def __init__(self) -> None:
+        """Initialize with the gate closed."""
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.written: list[bytes] = []
+        self.error: Exception | None = None
+
+    def __call__(self, payload: bytes) -> None:
+        """Record payload once the gate opens, or raise the configured error."""
+        self.started.set()
+        self.gate.wait(timeout=2)
+        if self.error:
+            raise self.error
+        self.written.append(payload)
+
+
+@pytest.fixture
+def write() -> GatedWrite:
+    """Gated write callable."""
+    return GatedWrite()
+
+
+def make_writer(write: GatedWrite, **kwargs: object) -> Writer:
+    """Return a started Writer using write."""
+    return Writer(write, LightStats(), name="test-writer", **kwargs).start()
+
+
+def test_writer_invalid_maxsize(write) -> None:
+    """Test maxsize must be positive."""
+    with pytest.raises(ValueError, match="must be positive"):
+        Writer(write, LightStats(), maxsize=0)
+
+
+def test_writer_latest_wins(write) -> None:
+    """Test payloads queued behind a busy write are replaced by the latest."""
+    writer = make_writer(write)
+    writer.put(b"\x01")
+    assert write.started.wait(timeout=2)
+    for payload in (b"\x02", b"\x03", b"\x04"):
+        writer.put(payload)
+    assert writer.pending == 1
+
+    write.gate.set()
+    writer.flush(timeout=2)
+
+    assert write.written == [b"\x01", b"\x04"]
+    assert writer.stats.dropped == 2
+    writer.join()
+
+
+def test_writer_keeps_every_command(write) -> None:
+    """Test every payload is written in order when latest_wins is False."""
+    writer = make_writer(write, latest_wins=False, maxsize=2)
+    payloads = [bytes([n]) for n in range(6)]
+    threading.Timer(0.05, write.gate.set).start()
+
+    for payload in payloads:
+        writer.put(payload)
+    writer.flush(timeout=2)
+
+    assert write.written == payloads
+    assert writer.stats.dropped == 0
+    writer.join()
+
+
+def test_writer_flush_timeout(write) -> None:
+    """Test flush raises TimeoutError if payloads are still waiting."""
+    writer = make_writer(write)
+    writer.put(b"\x01")
+
+    with pytest.raises(TimeoutError):
+        writer.flush(timeout=0.01)
+
+    write.gate.set()
+    writer.join()
+
+
+def test_writer_error_raised_once(write) -> None:
+    """Test a failed write is raised by the next call, then forgotten."""
+    write.error = OSError("unplugged")
+    write.gate.set()
+    writer = make_writer(write)
+    writer.put(b"\x01")
+
+    with pytest.raises(OSError, match="unplugged"):
+        writer.flush(timeout=2)
+    writer.raise_error()
+    writer.join()
+
+
+def test_writer_join_writes_queued_payloads(write) -> None:
+    """Test join writes what is queued before stopping."""
+    writer = make_writer(write, latest_wins=False)
+    writer.put(b"\x01")
+    writer.put(b"\x02")
+    write.gate.set()
+
+    writer.join(timeout=2)
+
+    assert write.written == [b"\x01", b"\x02"]
+    assert not writer.running
+    assert writer.stopped
+
+
+def test_writer_join_timeout_leaves_thread_running(write) -> None:
+    """Test a writer blocked past the join timeout is not stopped."""
+    writer = make_writer(write)
+    writer.put(b"\x01")
+    assert write.started.wait(timeout=2)
+
+    writer.join(timeout=0.05)
+    assert not writer.stopped
+
+    write.gate.set()
+    writer.join(timeout=2)
+    assert writer.stopped